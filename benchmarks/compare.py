@@ -0,0 +1,82 @@
+"""Compare two benchmark result files and fail on regressions.
+
+Usage:
+    python -m benchmarks.compare baseline.json current.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+
+
+def load_metrics(path):
+    """Load the metrics section of a benchmark results file."""
+    with open(path, "r") as f:
+        return json.load(f)["metrics"]
+
+
+def compare(baseline, current, threshold=0.1):
+    """
+    Compare two sets of metrics.
+
+    Args:
+        baseline: Metrics from the reference run
+        current: Metrics from the run being checked
+        threshold: Allowed relative slowdown before a metric counts as a regression
+
+    Returns:
+        List of (name, baseline value, current value, relative change, regressed) tuples
+    """
+    rows = []
+    for name in sorted(baseline):
+        if name not in current:
+            continue
+
+        old = baseline[name]["value"]
+        new = current[name]["value"]
+        if old == 0:
+            continue
+
+        change = (new - old) / old
+        # Positive "slowdown" is always bad, whichever direction the metric grows
+        slowdown = -change if baseline[name]["higher_is_better"] else change
+        rows.append((name, old, new, change, slowdown > threshold))
+    return rows
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Compare benchmark result files.")
+    parser.add_argument("baseline", help="Reference results JSON")
+    parser.add_argument("current", help="Results JSON to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative regression that fails the comparison (default: 0.1 = 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_metrics(args.baseline)
+    current = load_metrics(args.current)
+    rows = compare(baseline, current, args.threshold)
+
+    regressions = 0
+    for name, old, new, change, regressed in rows:
+        unit = current[name]["unit"]
+        status = "REGRESSED" if regressed else "ok"
+        print(f"{name:40} {old:12.4f} -> {new:12.4f} {unit:6} {change:+7.1%}  {status}")
+        regressions += regressed
+
+    missing = sorted(set(baseline) - set(current))
+    for name in missing:
+        print(f"{name:40} missing from current results")
+
+    if regressions:
+        print(f"{regressions} metric(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Fixtures for the headless benchmark suite."""
+
+import json
+import os
+import platform
+import statistics
+import time
+
+# Benchmarks always run headless, so force the dummy SDL drivers before pygame loads
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from src.core.engine import Engine
+
+DEFAULT_RESULTS_FILE = "benchmark_results.json"
+
+
+def pytest_addoption(parser):
+    """Add benchmark command line options."""
+    parser.addoption(
+        "--benchmark-json",
+        action="store",
+        default=DEFAULT_RESULTS_FILE,
+        help="Path of the JSON file benchmark results are written to",
+    )
+    parser.addoption(
+        "--benchmark-rounds",
+        action="store",
+        type=int,
+        default=5,
+        help="Number of timed rounds per benchmark (the median is reported)",
+    )
+
+
+class BenchmarkRecorder:
+    """Times callables and collects the results for the whole session."""
+
+    def __init__(self, rounds=5):
+        self.rounds = rounds
+        self.results = {}
+
+    def measure(self, func, iterations=100):
+        """
+        Time a callable.
+
+        Args:
+            func: Callable to time
+            iterations: Number of calls per round
+
+        Returns:
+            Median seconds per call over all rounds
+        """
+        func()  # Warm up caches before timing
+        samples = []
+        for _ in range(self.rounds):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            samples.append((time.perf_counter() - start) / iterations)
+        return statistics.median(samples)
+
+    def record(self, name, value, unit, higher_is_better=False):
+        """Store a single metric."""
+        self.results[name] = {
+            "value": value,
+            "unit": unit,
+            "higher_is_better": higher_is_better,
+        }
+        return value
+
+    def time_per_call(self, name, func, iterations=100):
+        """Record the median cost of a call in milliseconds."""
+        return self.record(name, self.measure(func, iterations) * 1000, "ms")
+
+    def calls_per_second(self, name, func, iterations=100):
+        """Record the median throughput of a call in calls per second."""
+        seconds = self.measure(func, iterations)
+        return self.record(name, 1.0 / seconds if seconds > 0 else 0.0, "ops/s", True)
+
+    def to_dict(self):
+        """Return the results with enough context to compare runs."""
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "rounds": self.rounds,
+            "metrics": self.results,
+        }
+
+
+_recorder = None
+
+
+def pytest_configure(config):
+    """Create the session-wide recorder."""
+    global _recorder
+    _recorder = BenchmarkRecorder(rounds=config.getoption("--benchmark-rounds"))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write all recorded metrics to the results file."""
+    if _recorder is None or not _recorder.results:
+        return
+
+    path = session.config.getoption("--benchmark-json")
+    with open(path, "w") as f:
+        json.dump(_recorder.to_dict(), f, indent=4, sort_keys=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_init():
+    """Initialize pygame with a dummy display for all benchmarks."""
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def benchmark():
+    """Return the session benchmark recorder."""
+    return _recorder
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create an engine with a headless display surface and default settings."""
+    engine = Engine(
+        width=800,
+        height=600,
+        title="Benchmark Engine",
+        settings_file=str(tmp_path / "settings.json"),
+    )
+    engine.screen = pygame.display.get_surface()
+    return engine
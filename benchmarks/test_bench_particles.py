@@ -0,0 +1,37 @@
+"""Benchmarks for the array-backed particle emitters."""
+
+import pygame
+import pytest
+
+from src.objects.particles import ParticleEmitter, numpy
+
+pytestmark = pytest.mark.skipif(numpy is None, reason="particles need NumPy")
+
+PALETTE = [(255, 200, 80), (255, 255, 255)]
+
+
+def fill_emitter(count, radius):
+    """Create an emitter holding count long-lived particles."""
+    emitter = ParticleEmitter(count, PALETTE, radius=radius, gravity=(0, 50), drag=0.5)
+    emitter.emit(count, (400, 300), speed=(20, 200), life=(1000, 2000), spread=50)
+    return emitter
+
+
+@pytest.mark.parametrize("count", [10000, 50000])
+def test_particle_update(benchmark, count):
+    """Measure one vectorized update tick of every live particle."""
+    emitter = fill_emitter(count, 0)
+
+    benchmark.time_per_call(f"particle_update_{count}", lambda: emitter.update(1 / 60), 100)
+
+
+@pytest.mark.parametrize("count, radius", [(50000, 0), (5000, 2)])
+def test_particle_render(benchmark, engine, count, radius):
+    """Measure drawing through direct pixel writes (radius 0) and batched sprite blits."""
+    emitter = fill_emitter(count, radius)
+    frame = pygame.Surface((800, 600), 0, engine.screen)
+    mode = "sprites" if radius else "pixels"
+
+    benchmark.time_per_call(
+        f"particle_render_{mode}_{count}", lambda: emitter.render(frame), iterations=20
+    )
@@ -0,0 +1,78 @@
+"""Benchmarks for resource loading and logging."""
+
+import logging
+import os
+
+from src.core.resource_manager import ResourceManager
+from src.utils.logger import GameLogger
+
+SOUND_PATH = os.path.join("assets", "sounds", "ui_sounds", "click-a.ogg")
+FONT_PATH = os.path.join("assets", "fonts", "kenney_future.ttf")
+
+
+def test_resource_cold_load(benchmark):
+    """Measure loading assets into an empty resource manager, decoding every sound."""
+
+    def cold_load():
+        manager = ResourceManager(sound_cache_dir=None)
+        manager.load_sound("click", SOUND_PATH)
+        manager.load_font("kenney", FONT_PATH, 24)
+
+    benchmark.time_per_call("resource_cold_load", cold_load, iterations=10)
+
+
+def test_cached_sound_load(benchmark, tmp_path):
+    """Measure loading a sound whose decoded samples are already cached on disk."""
+    cache_dir = str(tmp_path / "sounds")
+    ResourceManager(sound_cache_dir=cache_dir).load_sound("click", SOUND_PATH)
+
+    def cached_load():
+        ResourceManager(sound_cache_dir=cache_dir).load_sound("click", SOUND_PATH)
+
+    benchmark.time_per_call("resource_cached_sound_load", cached_load, iterations=10)
+
+
+def test_resource_warm_load(benchmark):
+    """Measure retrieving assets that are already cached."""
+    manager = ResourceManager(sound_cache_dir=None)
+    manager.load_sound("click", SOUND_PATH)
+    manager.load_font("kenney", FONT_PATH, 24)
+
+    def warm_load():
+        manager.get_sound("click")
+        manager.get_font("kenney", 24)
+
+    benchmark.calls_per_second("resource_warm_load", warm_load, iterations=10000)
+
+
+def test_logger_throughput(benchmark, tmp_path):
+    """Measure GameLogger messages per second to a log file."""
+    logger = GameLogger.get_logger(
+        "BenchmarkLogger",
+        level=logging.INFO,
+        log_to_file=True,
+        log_to_console=False,
+        file_path=str(tmp_path / "benchmark.log"),
+    )
+
+    benchmark.calls_per_second(
+        "logger_throughput", lambda: logger.info("Benchmark message %d", 42), 1000
+    )
+
+
+def test_async_logger_throughput(benchmark, tmp_path):
+    """Measure GameLogger messages per second with async logging enabled."""
+    logger = GameLogger.get_logger(
+        "AsyncBenchmarkLogger",
+        level=logging.INFO,
+        log_to_file=True,
+        log_to_console=False,
+        file_path=str(tmp_path / "async_benchmark.log"),
+    )
+    GameLogger.enable_async()
+    try:
+        benchmark.calls_per_second(
+            "async_logger_throughput", lambda: logger.info("Benchmark message %d", 42), 1000
+        )
+    finally:
+        GameLogger.disable_async()
@@ -0,0 +1,53 @@
+"""Benchmarks for scene updates and rendering."""
+
+import pygame
+import pytest
+
+from src.core.post_process import PostProcessor, numpy
+from src.main import register_scenes
+
+
+@pytest.fixture
+def scenes(engine):
+    """Register every scene the game ships with."""
+    register_scenes(engine)
+    return engine.scene_manager
+
+
+def test_pong_update_ticks(benchmark, scenes):
+    """Measure PongScene update ticks per second."""
+    scenes.switch_to("game")
+    pong = scenes.current_scene
+    pong.max_score = float("inf")  # Keep the match running for the whole benchmark
+
+    benchmark.calls_per_second("pong_update_ticks", lambda: pong.update(1 / 60), 1000)
+
+
+@pytest.mark.parametrize(
+    "scene_name",
+    ["main_menu", "credits", "game", "pause", "options", "options_from_pause", "game_over"],
+)
+def test_scene_render(benchmark, scenes, scene_name):
+    """Measure the render cost of every registered scene."""
+    if scene_name == "pause":
+        scenes.switch_to("game")  # The pause overlay draws the game underneath
+    scenes.switch_to(scene_name)
+    surface = pygame.Surface((800, 600))
+
+    benchmark.time_per_call(f"render_{scene_name}", lambda: scenes.render(surface), iterations=20)
+
+
+@pytest.mark.skipif(numpy is None, reason="post effects need NumPy")
+@pytest.mark.parametrize("size", [(800, 600), (1920, 1080)])
+def test_post_process(benchmark, engine, size):
+    """Measure the full post-processing stack on a finished frame."""
+    engine.settings.post_effects = ["shake", "bloom", "vignette", "scanlines"]
+    processor = PostProcessor(engine.settings)
+    processor.offset = (3, -2)
+    frame = pygame.Surface(size, 0, 32)
+    pygame.draw.circle(frame, (255, 240, 200), (size[0] // 2, size[1] // 2), 40)
+
+    benchmark.time_per_call(
+        f"post_process_{size[1]}p", lambda: processor.apply(frame), iterations=20
+    )
+    processor.close()
@@ -0,0 +1,30 @@
+"""Benchmarks for UI event dispatch."""
+
+import pygame
+import pytest
+
+from src.ui import Menu
+
+
+@pytest.mark.parametrize("element_count", [10, 100, 500])
+def test_menu_handle_event(benchmark, element_count):
+    """Measure Menu.handle_event dispatch as the number of elements grows."""
+    font = pygame.font.SysFont(None, 24)
+    menu = Menu(x=400, y=0, width=300, height=600, centered=True)
+    menu.set_font(font)
+    for i in range(element_count):
+        menu.add_button(f"Button {i}")
+
+    events = [
+        pygame.event.Event(
+            pygame.MOUSEMOTION, {"pos": (400, 25), "rel": (1, 0), "buttons": (0, 0, 0)}
+        ),
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": (400, 25), "button": 1}),
+        pygame.event.Event(pygame.MOUSEBUTTONUP, {"pos": (400, 25), "button": 1}),
+    ]
+
+    def dispatch():
+        for event in events:
+            menu.handle_event(event)
+
+    benchmark.time_per_call(f"menu_handle_event_{element_count}", dispatch, iterations=50)
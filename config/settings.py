@@ -13,6 +13,9 @@ class Settings:
         self.fullscreen = False
         self.vsync = True
         self.fps_limit = 60
+        self.scaling = "sdl"  # Logical frame upscaling: "sdl", "smooth", "integer" or "none"
+        self.dynamic_resolution = False  # Use cheaper upscaling while frames run over budget
+        self.post_effects = []  # Full-frame effects: "shake", "bloom", "vignette", "scanlines"
 
         # Audio settings
         self.master_volume = 1.0
@@ -24,8 +27,26 @@ class Settings:
         # Gameplay settings
         self.difficulty = "normal"
 
-        # Controls
+        # Performance settings
+        self.idle_gc = False  # Run garbage collection between frames instead of mid-frame
+        self.trace_memory = False  # Trace allocations for F3 memory snapshots; slows allocation
+        self.async_logging = True  # Write log output on a background thread
+        self.telemetry = False  # Write structured frame/scene/match records for analysis
+        self.low_latency = False  # Poll input just before rendering instead of after presenting
+        self.frame_pacing = "hybrid"  # Frame wait: "sdl", "busy_loop" or "hybrid" sleep-then-spin
+        self.idle_fps = 20  # Frame-rate cap for menus left without input; 0 disables it
+        self.post_process_threads = 0  # Threads for post effects; 0 uses one per CPU
+        # Wait for input instead of redrawing scenes that declare themselves idle
+        self.idle_wait = True
+
+        # Development settings
+        self.hot_reload = False  # Rebuild UI definitions when their files change
+        self.surface_audit = False  # Log blits of surfaces not in the display pixel format
+
+        # Controls: each action maps to one key or a list of keys
         self.key_bindings = {
+            "move_up": [pygame.K_UP, pygame.K_w],
+            "move_down": [pygame.K_DOWN, pygame.K_s],
             "move_left": pygame.K_LEFT,
             "move_right": pygame.K_RIGHT,
             "jump": pygame.K_SPACE,
@@ -39,6 +60,9 @@ class Settings:
                 "fullscreen": self.fullscreen,
                 "vsync": self.vsync,
                 "fps_limit": self.fps_limit,
+                "scaling": self.scaling,
+                "dynamic_resolution": self.dynamic_resolution,
+                "post_effects": self.post_effects,
             },
             "audio": {
                 "master_volume": self.master_volume,
@@ -48,6 +72,18 @@ class Settings:
                 "sfx_enabled": self.sfx_enabled,
             },
             "gameplay": {"difficulty": self.difficulty},
+            "performance": {
+                "idle_gc": self.idle_gc,
+                "trace_memory": self.trace_memory,
+                "async_logging": self.async_logging,
+                "telemetry": self.telemetry,
+                "low_latency": self.low_latency,
+                "frame_pacing": self.frame_pacing,
+                "idle_fps": self.idle_fps,
+                "idle_wait": self.idle_wait,
+                "post_process_threads": self.post_process_threads,
+            },
+            "development": {"hot_reload": self.hot_reload, "surface_audit": self.surface_audit},
             "controls": self.key_bindings,
         }
 
@@ -64,6 +100,11 @@ class Settings:
             self.fullscreen = data["display"]["fullscreen"]
             self.vsync = data["display"]["vsync"]
             self.fps_limit = data["display"]["fps_limit"]
+            self.scaling = data["display"].get("scaling", self.scaling)
+            self.dynamic_resolution = data["display"].get(
+                "dynamic_resolution", self.dynamic_resolution
+            )
+            self.post_effects = data["display"].get("post_effects", self.post_effects)
 
             # Audio settings
             self.master_volume = data["audio"]["master_volume"]
@@ -75,9 +116,28 @@ class Settings:
             # Gameplay settings
             self.difficulty = data["gameplay"]["difficulty"]
 
-            # Controls
-            self.key_bindings = data["controls"]
+            # Performance settings (optional in older settings files)
+            performance = data.get("performance", {})
+            self.idle_gc = performance.get("idle_gc", self.idle_gc)
+            self.trace_memory = performance.get("trace_memory", self.trace_memory)
+            self.async_logging = performance.get("async_logging", self.async_logging)
+            self.telemetry = performance.get("telemetry", self.telemetry)
+            self.low_latency = performance.get("low_latency", self.low_latency)
+            self.frame_pacing = performance.get("frame_pacing", self.frame_pacing)
+            self.idle_fps = performance.get("idle_fps", self.idle_fps)
+            self.idle_wait = performance.get("idle_wait", self.idle_wait)
+            self.post_process_threads = performance.get(
+                "post_process_threads", self.post_process_threads
+            )
+
+            # Development settings (optional in older settings files)
+            development = data.get("development", {})
+            self.hot_reload = development.get("hot_reload", self.hot_reload)
+            self.surface_audit = development.get("surface_audit", self.surface_audit)
+
+            # Controls (actions missing from older settings files keep their defaults)
+            self.key_bindings.update(data["controls"])
 
             return True
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
             return False
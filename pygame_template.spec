@@ -11,8 +11,18 @@ a = Analysis(
         ('assets/sounds/ui_sounds', 'assets/sounds/ui_sounds'),
         ('assets/fonts', 'assets/fonts'),
         ('assets/images', 'assets/images'),
+        ('assets/ui', 'assets/ui'),
+    ],
+    # Scenes are registered as "module:Class" strings and imported on first use,
+    # so no static import leads the analysis to them
+    hiddenimports=[
+        'src.scenes.credits_scene',
+        'src.scenes.game_over_scene',
+        'src.scenes.menu_scene',
+        'src.scenes.options_scene',
+        'src.scenes.pause_scene',
+        'src.scenes.pong_scene',
     ],
-    hiddenimports=[],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,244 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from ..utils.logger import GameLogger
+
+try:
+    import numpy
+except ImportError:  # Pitch variants fall back to the original sound
+    numpy = None
+
+# Channels reserved for each category; playback never spills into another category
+DEFAULT_CATEGORIES = {"ui": 2, "sfx": 6}
+
+PITCH_STEP = 0.05  # Pitch requests are rounded to this step so variants can be shared
+
+
+class AudioManager:
+    """Plays sound effects through pooled, per-category mixer channels."""
+
+    def __init__(
+        self,
+        resource_manager,
+        settings,
+        categories=None,
+        max_instances=3,
+        retrigger_interval=40,
+        max_variants=64,
+    ):
+        """
+        Create the audio manager; call initialize() once the mixer is running.
+
+        Args:
+            resource_manager: Source of loaded sounds
+            settings: Settings providing sfx_enabled, master_volume and sfx_volume
+            categories: Dict of category name to number of reserved channels
+            max_instances: How many copies of one sound may play at the same time
+            retrigger_interval: Minimum milliseconds between starts of the same sound
+            max_variants: Number of pitch variants kept in the cache
+        """
+        self.resource_manager = resource_manager
+        self.settings = settings
+        self.categories = dict(categories or DEFAULT_CATEGORIES)
+        self.max_instances = max_instances
+        self.retrigger_interval = retrigger_interval
+        self.max_variants = max_variants
+        self.logger = GameLogger.get_logger("AudioManager")
+
+        self.pools = {}  # Category -> list of channels
+        self._started = {}  # Channel -> (start time, sound name)
+        self._last_played = {}  # Sound name -> start time of the latest play
+        self._variants = OrderedDict()  # (name, pitch) -> resampled sound, least recent first
+        self._pending = {}  # (name, pitch) -> future of a variant resampled in the background
+        self.executor = None  # Created when a variant is first needed that was not prepared
+
+        # Playback counters for tuning
+        self.stats = {"played": 0, "throttled": 0, "stolen": 0, "missing": 0}
+
+    def initialize(self):
+        """Reserve a block of mixer channels for each category."""
+        total = sum(self.categories.values())
+        if pygame.mixer.get_num_channels() < total:
+            pygame.mixer.set_num_channels(total)
+        # Reserved channels are skipped by Sound.play(), so stray calls cannot steal them
+        pygame.mixer.set_reserved(total)
+
+        first = 0
+        for category, count in self.categories.items():
+            self.pools[category] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            first += count
+        self.logger.info("Reserved %d mixer channels: %s", total, self.categories)
+
+    def get_volume(self, volume=1.0):
+        """Combine a per-play volume with the master and effects volume settings."""
+        return self.settings.master_volume * self.settings.sfx_volume * volume
+
+    def play(self, name, category="sfx", volume=1.0, pitch=1.0):
+        """
+        Play a loaded sound effect.
+
+        Args:
+            name: Name the sound was loaded under in the resource manager
+            category: Channel pool to play on
+            volume: Volume for this play, scaled by the volume settings
+            pitch: Playback speed factor; needs NumPy, otherwise ignored. Pitches not
+                set up with prepare_pitches() play unpitched until their variant is ready
+
+        Returns:
+            The channel playing the sound, or None if it was skipped
+        """
+        if not self.settings.sfx_enabled or not self.pools:
+            return None
+
+        sound = self.get_sound(name, pitch)
+        if sound is None:
+            self.stats["missing"] += 1
+            return None
+
+        # Drop rapid retriggers and pile-ups of the same sound
+        now = pygame.time.get_ticks()
+        last = self._last_played.get(name)
+        if last is not None and now - last < self.retrigger_interval:
+            self.stats["throttled"] += 1
+            return None
+        pool = self.pools[category]
+        if self._count_playing(pool, name) >= self.max_instances:
+            self.stats["throttled"] += 1
+            return None
+
+        channel = self._acquire_channel(pool)
+        channel.set_volume(self.get_volume(volume))
+        channel.play(sound)
+        self._started[channel] = (now, name)
+        self._last_played[name] = now
+        self.stats["played"] += 1
+        return channel
+
+    def _count_playing(self, pool, name):
+        """Count channels in a pool still playing the named sound."""
+        return sum(
+            1
+            for channel in pool
+            if channel.get_busy() and self._started.get(channel, (0, None))[1] == name
+        )
+
+    def _acquire_channel(self, pool):
+        """Return a free channel, or stop the one that has played the longest."""
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+        oldest = min(pool, key=lambda channel: self._started.get(channel, (0, None))[0])
+        oldest.stop()
+        self.stats["stolen"] += 1
+        return oldest
+
+    @staticmethod
+    def quantize_pitch(pitch):
+        """Round a pitch to PITCH_STEP so nearby requests share a variant."""
+        return round(round(pitch / PITCH_STEP) * PITCH_STEP, 2)
+
+    def get_sound(self, name, pitch=1.0):
+        """
+        Get a sound at the given pitch, never resampling on the calling thread.
+
+        Variants are kept in a small least-recently-used cache. One that has not
+        been prepared is resampled on a worker thread, and the original sound
+        is returned until it is ready.
+        """
+        sound = self.resource_manager.sounds.get(name)
+        if sound is None:
+            return None
+
+        pitch = self.quantize_pitch(pitch)
+        if pitch == 1.0 or numpy is None:
+            return sound
+
+        key = (name, pitch)
+        variant = self._variants.get(key)
+        if variant is not None:
+            self._variants.move_to_end(key)
+            return variant
+
+        future = self._pending.get(key)
+        if future is None:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(1, thread_name_prefix="PitchVariants")
+            self._pending[key] = self.executor.submit(self._resample, sound, pitch)
+        elif future.done():
+            del self._pending[key]
+            try:
+                self._add_variant(key, future.result())
+                return self._variants[key]
+            except (pygame.error, ValueError) as e:
+                self.logger.error("Error resampling %s to pitch %s: %s", name, pitch, e)
+        return sound
+
+    def prepare_pitches(self, name, low, high):
+        """
+        Resample a sound for every pitch step between low and high now.
+
+        Call this while loading, e.g. when a scene is entered, so later plays
+        with a pitch in that range get their variant at once.
+
+        Args:
+            name: Name the sound was loaded under
+            low: Lowest pitch that will be requested
+            high: Highest pitch that will be requested
+        """
+        sound = self.resource_manager.sounds.get(name)
+        if sound is None or numpy is None:
+            return
+        steps = range(round(low / PITCH_STEP), round(high / PITCH_STEP) + 1)
+        for pitch in (round(step * PITCH_STEP, 2) for step in steps):
+            key = (name, pitch)
+            if pitch != 1.0 and key not in self._variants:
+                self._pending.pop(key, None)
+                self._add_variant(key, self._resample(sound, pitch))
+
+    def _add_variant(self, key, variant):
+        """Cache a variant, evicting the least recently used one when full."""
+        self._variants[key] = variant
+        if len(self._variants) > self.max_variants:
+            self._variants.popitem(last=False)
+
+    @staticmethod
+    def _resample(sound, pitch):
+        """Make a copy of a sound played back pitch times faster."""
+        samples = pygame.sndarray.array(sound)
+        positions = numpy.arange(0, len(samples) - 1, pitch)
+        index = positions.astype(numpy.intp)
+        fraction = (positions - index).reshape((-1,) + (1,) * (samples.ndim - 1))
+        resampled = samples[index] * (1 - fraction) + samples[index + 1] * fraction
+        return pygame.sndarray.make_sound(resampled.astype(samples.dtype))
+
+    def discard_variants(self, name):
+        """Forget cached variants of a sound, e.g. after it was reloaded."""
+        for key in [key for key in self._variants if key[0] == name]:
+            del self._variants[key]
+        for key in [key for key in self._pending if key[0] == name]:
+            del self._pending[key]  # The old sound's result is ignored when it arrives
+
+    def stop(self, category=None):
+        """Stop every effect, or only those in one category."""
+        pools = [self.pools[category]] if category else self.pools.values()
+        for pool in pools:
+            for channel in pool:
+                channel.stop()
+
+    def close(self):
+        """Stop the background resampling thread."""
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+        self._pending.clear()
+
+    def get_stats(self):
+        """Return playback counters and how many channels are busy per category."""
+        stats = dict(self.stats)
+        stats["busy"] = {
+            category: sum(1 for channel in pool if channel.get_busy())
+            for category, pool in self.pools.items()
+        }
+        stats["variants"] = len(self._variants)
+        return stats
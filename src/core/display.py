@@ -0,0 +1,232 @@
+import pygame
+from ..utils.logger import GameLogger
+from ..utils.surfaces import AuditSurface, surface_audit
+from config.constants import BLACK
+
+# How the logical framebuffer reaches the window:
+#   none    - no framebuffer; scenes render at the window size and reflow on resize
+#   integer - nearest-neighbour upscale by the largest whole factor that fits
+#   smooth  - smoothscale to the largest size that fits, keeping the aspect ratio
+#   sdl     - SDL's SCALED flag scales on the GPU; falls back to smooth if unavailable
+SCALING_MODES = ("none", "integer", "smooth", "sdl")
+
+# Software upscale filters from best looking to cheapest, stepped through by
+# dynamic resolution: smoothscale, nearest at the same size, then nearest at
+# a whole factor, which also writes fewer window pixels
+QUALITY_LEVELS = ("smooth", "nearest", "integer")
+
+# Mouse event types carrying window coordinates
+POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+
+class Display:
+    """Owns the window and the fixed-size logical framebuffer scenes render into."""
+
+    def __init__(self, settings, width, height, title):
+        """
+        Create the display; call open() once pygame is initialized.
+
+        Args:
+            settings: Settings providing vsync, scaling and dynamic_resolution
+            width, height: Logical resolution scenes are laid out in
+            title: Window caption
+        """
+        self.settings = settings
+        self.base_size = (width, height)  # Logical size requested for the scaled modes
+        self.logical_size = self.base_size
+        self.title = title
+        self.logger = GameLogger.get_logger("Display")
+
+        self.window = None  # Display surface
+        self.surface = None  # Where scenes draw: the framebuffer, or the window when not scaling
+        self._framebuffer = None  # Logical-size surface scaled into the window
+        self.scaling = None  # Mode in use after any fallback
+        self.viewport = pygame.Rect(0, 0, width, height)  # Window area showing the frame
+        self.mapped = False  # Whether pointer coordinates need converting
+        self._target = None  # Window subsurface the frame is scaled into
+
+        # Dynamic resolution state
+        self.quality = 0  # Index into QUALITY_LEVELS, relative to the configured mode
+        self.over_budget = 0  # Consecutive frames slower than the budget
+        self.under_budget = 0  # Consecutive frames comfortably inside it
+
+    def set_mode(self, size, flags=0):
+        """
+        Create the display surface, requesting vsync when the setting is on.
+
+        Drivers that cannot provide vsync for the requested mode raise an
+        error; the mode is then created without it.
+
+        Args:
+            size: Window or fullscreen resolution
+            flags: pygame display flags
+
+        Returns:
+            The display surface
+        """
+        if self.settings.vsync:
+            try:
+                return pygame.display.set_mode(size, flags, vsync=1)
+            except pygame.error as e:
+                self.logger.warning("Vsync unavailable, continuing without it: %s", e)
+        return pygame.display.set_mode(size, flags)
+
+    def open(self, fullscreen):
+        """
+        Create the window for the scaling setting and set up the framebuffer.
+
+        Args:
+            fullscreen: Whether to cover the desktop
+        """
+        flags = pygame.HWSURFACE | pygame.DOUBLEBUF
+        if fullscreen:
+            flags |= pygame.FULLSCREEN
+
+        self.scaling = self.settings.scaling
+        self.logical_size = self.base_size
+        self._framebuffer = None  # The pixel format may change with the mode
+        if self.scaling == "sdl":
+            try:
+                # The display surface is the logical size; SDL stretches it to the window
+                self.window = self.set_mode(self.logical_size, flags | pygame.SCALED)
+            except pygame.error as e:
+                self.logger.warning("SDL scaling unavailable, using smoothscale: %s", e)
+                self.scaling = "smooth"
+
+        if self.scaling != "sdl":
+            size = self.logical_size
+            if fullscreen:
+                # Get current display info for proper fullscreen resolution
+                display_info = pygame.display.Info()
+                size = (display_info.current_w, display_info.current_h)
+            self.window = self.set_mode(size, flags)
+            if self.scaling == "none":
+                self.logical_size = self.window.get_size()
+
+        pygame.display.set_caption(self.title)
+        self.quality = 0
+        self.configure()
+        self.logger.info(
+            "Display %dx%d (%s), logical %dx%d",
+            *self.window.get_size(),
+            self.scaling,
+            *self.logical_size,
+        )
+
+    def get_filter(self):
+        """Return the upscale filter in use, after any dynamic resolution step-down."""
+        first = QUALITY_LEVELS.index("integer" if self.scaling == "integer" else "smooth")
+        return QUALITY_LEVELS[min(first + self.quality, len(QUALITY_LEVELS) - 1)]
+
+    def configure(self):
+        """Fit the logical frame into the window and create the framebuffer."""
+        window_w, window_h = self.window.get_size()
+        logical_w, logical_h = self.logical_size
+
+        if self.scaling in ("none", "sdl") or (window_w, window_h) == self.logical_size:
+            self.viewport = self.window.get_rect()
+            self.mapped = False
+            if not surface_audit.enabled:
+                # Scenes draw straight into the window
+                self.surface = self.window
+                self._target = None
+                return
+        else:
+            scale = min(window_w / logical_w, window_h / logical_h)
+            if self.get_filter() == "integer":
+                scale = max(1, int(scale))
+            self.viewport = pygame.Rect(0, 0, int(logical_w * scale), int(logical_h * scale))
+            self.viewport.center = (window_w // 2, window_h // 2)
+            self.viewport = self.viewport.clip(self.window.get_rect())
+            self.mapped = True
+
+        # The audit needs a framebuffer of its own to watch every blit scenes make
+        surface_class = AuditSurface if surface_audit.enabled else pygame.Surface
+        if (
+            type(self._framebuffer) is not surface_class
+            or self._framebuffer.get_size() != self.logical_size
+        ):
+            self._framebuffer = surface_class(self.logical_size, 0, self.window)
+        self.surface = self._framebuffer
+        self._target = self.window.subsurface(self.viewport)
+        self.window.fill(BLACK)  # Letterbox bars; never drawn over afterwards
+
+    def on_window_resized(self):
+        """
+        Refit the frame after the window changed size.
+
+        Returns:
+            True if the logical size changed, i.e. scenes must reflow
+        """
+        self.window = pygame.display.get_surface()
+        if self.scaling == "none":
+            changed = self.window.get_size() != self.logical_size
+            self.logical_size = self.window.get_size()
+            self.configure()
+            return changed
+        self.configure()
+        return False
+
+    def present(self):
+        """Scale the finished logical frame into the window; the caller flips."""
+        if self._target is None:
+            return
+        if self.viewport.size == self.logical_size:
+            self.window.blit(self.surface, self.viewport)
+        elif self.get_filter() == "smooth":
+            pygame.transform.smoothscale(self.surface, self.viewport.size, self._target)
+        else:
+            pygame.transform.scale(self.surface, self.viewport.size, self._target)
+
+    def adapt_quality(self, frame_time, budget):
+        """
+        Step the upscale filter down while frames run over budget, and back up once they recover.
+
+        Args:
+            frame_time: Seconds the last frame took to update, render and scale
+            budget: Seconds available per frame
+        """
+        if self._target is None or not budget:
+            return
+        if frame_time > budget:
+            self.over_budget += 1
+            self.under_budget = 0
+        elif frame_time < budget * 0.5:
+            self.under_budget += 1
+            self.over_budget = 0
+        else:
+            self.over_budget = self.under_budget = 0
+
+        if self.over_budget >= 30 and self.get_filter() != QUALITY_LEVELS[-1]:
+            self._set_quality(self.quality + 1)
+        elif self.under_budget >= 300 and self.quality > 0:
+            self._set_quality(self.quality - 1)
+
+    def _set_quality(self, quality):
+        """Switch to another upscale quality level."""
+        self.quality = quality
+        self.over_budget = self.under_budget = 0
+        self.configure()
+        self.logger.info("Dynamic resolution: upscaling with %s", self.get_filter())
+
+    def to_logical(self, pos):
+        """Convert a window position to logical framebuffer coordinates."""
+        if not self.mapped:
+            return pos
+        return (
+            (pos[0] - self.viewport.x) * self.logical_size[0] // self.viewport.width,
+            (pos[1] - self.viewport.y) * self.logical_size[1] // self.viewport.height,
+        )
+
+    def map_event(self, event):
+        """Return a pointer event with its coordinates in logical pixels."""
+        if not self.mapped or event.type not in POINTER_EVENTS:
+            return event
+        attributes = dict(event.__dict__)
+        attributes["pos"] = self.to_logical(event.pos)
+        if "rel" in attributes:
+            attributes["rel"] = (
+                int(event.rel[0] * self.logical_size[0] / self.viewport.width),
+                int(event.rel[1] * self.logical_size[1] / self.viewport.height),
+            )
+        return pygame.event.Event(event.type, attributes)
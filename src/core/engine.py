@@ -1,18 +1,45 @@
 import pygame
 from .scene_manager import SceneManager
 from .resource_manager import ResourceManager
-from ..utils.logger import GameLogger
+from .audio_manager import AudioManager
+from .music_player import MusicPlayer
+from .input_manager import InputManager
+from .event_filter import EventFilter
+from .frame_pacer import FramePacer
+from .display import Display
+from .file_watcher import FileWatcher
+from .post_process import PostProcessor
+from .frame_capture import FrameWriter, create_capture_surface, frame_hash
+from ..utils.logger import GameLogger, LOG_DIR
 from ..utils.performance import performance
+from ..utils.startup import startup
+from ..utils.telemetry import telemetry
+from ..utils.surfaces import surface_audit
+from ..ui.loader import reload_changed_definitions
 from config.settings import Settings
-from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, ASSET_DIR
 import logging
+import os
+import random
+import time
+
+# Headroom left before the frame is due when sampling input late (seconds)
+LATENCY_MARGIN = 0.002
+
+# Longest time to block on input while the scene is idle (milliseconds)
+IDLE_WAIT_MS = 250
 
 
 class Engine:
     """Core game engine handling pygame initialization and main loop."""
 
     def __init__(
-        self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, title="PyGame Pong Template", fps=60
+        self,
+        width=SCREEN_WIDTH,
+        height=SCREEN_HEIGHT,
+        title="PyGame Pong Template",
+        fps=60,
+        settings_file="settings.json",
     ):
         self.width = width
         self.height = height
@@ -21,6 +48,14 @@ class Engine:
         self.running = False
         self.clock = None
         self.screen = None
+        self.file_watcher = None  # Set when hot reloading is enabled
+
+        # Frame timing for the low-latency loop and the input latency metric
+        self.input_sampled_at = None  # When this frame's events were polled
+        self.frame_ready_at = None  # When rendering finished, before the flip
+        self.last_present = None  # When the previous flip returned
+        self.work_estimate = 0.0  # Expected seconds from polling input to a finished frame
+        self.pending_events = []  # Event that woke the engine from an idle wait
 
         # Store original window dimensions for proper fullscreen handling
         self.original_width = width
@@ -33,68 +68,189 @@ class Engine:
         # Initialize managers right away
         self.resource_manager = ResourceManager()
         self.scene_manager = SceneManager(self)
+        # Settings are loaded before any subsystem reads them
+        self.settings_file = settings_file
         self.settings = Settings()
+        if self.settings.load(settings_file):
+            self.logger.info("Loaded settings from %s", settings_file)
+        self.audio = AudioManager(self.resource_manager, self.settings)
+        self.music = MusicPlayer(self.resource_manager, self.settings)
+        self.input = InputManager(self.settings)
+        self.event_filter = EventFilter()
+        self.pacer = FramePacer(self.settings)
+        self.display = Display(self.settings, width, height, title)
+        self.post_process = PostProcessor(self.settings)
 
     def initialize(self):
         """Set up pygame and initialize core systems."""
-        pygame.init()
-        pygame.mixer.init()
+        # Keep log file and console I/O out of the frame loop
+        if self.settings.async_logging:
+            GameLogger.enable_async()
+
+        with startup.phase("pygame.init"):
+            pygame.init()
+        with startup.phase("mixer.init"):
+            pygame.mixer.init()
+            self.audio.initialize()
+            self.music.initialize()
+        # Report blits of surfaces not in the display format
+        if self.settings.surface_audit:
+            surface_audit.enable()
+
+        with startup.phase("display setup"):
+            self.setup_display()
+
+        self.clock = self.pacer.clock
+
+        # Record garbage collection pauses for the performance overlay
+        performance.start_gc_tracking()
+        if self.settings.idle_gc:
+            performance.enable_idle_gc()
+            self.logger.info("Idle-time garbage collection enabled")
+        if self.settings.trace_memory:
+            # Started up front so F3 snapshots cover the whole session
+            performance.start_memory_tracing()
+            self.logger.info("Memory allocation tracing enabled")
+
+        # Structured records for offline analysis
+        if self.settings.telemetry:
+            telemetry.open(os.path.join(LOG_DIR, "telemetry.jsonl"))
+            self.logger.info("Telemetry session %s started", telemetry.session_id)
+
+        # Reload changed assets and UI definitions without restarting
+        if self.settings.hot_reload:
+            self.file_watcher = FileWatcher([ASSET_DIR])
+            self.file_watcher.start()
 
-        # Set up display mode based on fullscreen setting
-        if self.settings.fullscreen:
-            # Get current display info for proper fullscreen resolution
-            display_info = pygame.display.Info()
-            self.width = display_info.current_w
-            self.height = display_info.current_h
-
-            self.screen = pygame.display.set_mode(
-                (self.width, self.height), pygame.FULLSCREEN | pygame.HWSURFACE | pygame.DOUBLEBUF
-            )
-            self.logger.info(f"Initialized in fullscreen mode: {self.width}x{self.height}")
-        else:
-            self.screen = pygame.display.set_mode(
-                (self.width, self.height), pygame.HWSURFACE | pygame.DOUBLEBUF
-            )
-            self.logger.info(f"Initialized in windowed mode: {self.width}x{self.height}")
-
-        pygame.display.set_caption(self.title)
-        self.clock = pygame.time.Clock()
         self.logger.info("Game engine initialized successfully")
 
+    def setup_display(self):
+        """Create the window and the logical framebuffer scenes render into."""
+        self.display.open(self.settings.fullscreen)
+        self.screen = self.display.surface
+        self.width, self.height = self.display.logical_size
+        self.logger.info(
+            "Initialized in %s mode: %dx%d",
+            "fullscreen" if self.settings.fullscreen else "windowed",
+            self.width,
+            self.height,
+        )
+
+    def set_fullscreen(self, fullscreen):
+        """Switch between fullscreen and windowed mode, keeping the logical resolution."""
+        self.settings.fullscreen = fullscreen
+        size = (self.width, self.height)
+        self.display.open(fullscreen)
+        self.screen = self.display.surface
+        if self.display.logical_size != size:
+            self.apply_logical_size()
+
+    def apply_logical_size(self):
+        """Adopt the display's logical size and let the current scene reflow its layout."""
+        self.width, self.height = self.display.logical_size
+        self.logger.info("Logical resolution changed to %dx%d", self.width, self.height)
+        self.scene_manager.on_resize(self.width, self.height)
+
     def toggle_debug_logging(self):
         """Toggle debug logging on/off."""
         self.debug_logging = not self.debug_logging
         new_level = logging.DEBUG if self.debug_logging else logging.INFO
         GameLogger.set_all_loggers_level(new_level)
-        self.logger.info(f"Debug logging {'enabled' if self.debug_logging else 'disabled'}")
+        self.logger.info("Debug logging %s", "enabled" if self.debug_logging else "disabled")
 
     def handle_events(self):
         """Process all game events."""
-        for event in pygame.event.get():
+        self.input.begin_frame()
+        # Drop event types the scene ignores at the queue and merge motion bursts
+        self.event_filter.apply(self.scene_manager.current_scene)
+        self.input_sampled_at = time.perf_counter()
+        events = self.event_filter.process(self.pending_events + pygame.event.get())
+        self.pending_events = []
+        if events:
+            self.pacer.notify_activity()
+        for event in events:
+            # Pointer positions arrive in window pixels; scenes work in logical pixels
+            event = self.display.map_event(event)
+            self.input.process_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
                 self.logger.info("Quit event received")
+            elif event.type == pygame.VIDEORESIZE:
+                self.on_resize(event.w, event.h)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Key releases are not delivered while unfocused; avoid stuck actions
+                self.input.reset()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F1:
                     self.toggle_debug_logging()
                 elif event.key == pygame.K_F2:
                     performance.toggle_metrics_display()
                     self.logger.debug("Performance metrics display toggled")
-                elif event.key == pygame.K_ESCAPE:
-                    if (
-                        "pause" in self.settings.key_bindings
-                        and event.key == self.settings.key_bindings["pause"]
-                    ):
-                        self.logger.debug("Pause key pressed")
+                elif event.key == pygame.K_F3:
+                    self.export_performance_report()
 
+            self.music.handle_event(event)
             self.scene_manager.handle_event(event)
 
+    def on_resize(self, width, height):
+        """Refit the frame to a new window size; scenes reflow only if the logical size changed."""
+        self.logger.info("Window resized to %dx%d", width, height)
+        changed = self.display.on_window_resized()
+        self.screen = self.display.surface
+        if changed:
+            self.apply_logical_size()
+
+    def process_file_changes(self):
+        """
+        Reload assets and UI definitions the file watcher saw change.
+
+        Returns:
+            True if any file changed
+        """
+        changes = self.file_watcher.poll_changes()
+        for path in changes:
+            for kind, key, resource in self.resource_manager.reload_path(path):
+                if kind == "sounds":
+                    self.audio.discard_variants(key)
+                self.scene_manager.notify_resource_reloaded(kind, key, resource)
+            if path.endswith((".yaml", ".yml")):
+                reload_changed_definitions(path)
+        return bool(changes)
+
+    def is_idle(self):
+        """Check whether the current scene is static, so frames need not be redrawn."""
+        scene = self.scene_manager.current_scene
+        return (
+            self.settings.idle_wait
+            and scene is not None
+            and self.last_present is not None  # The scene has been shown at least once
+            and not performance.show_metrics
+            and scene.is_idle()
+        )
+
+    def wait_while_idle(self):
+        """
+        Block until an event arrives instead of redrawing an unchanged scene.
+
+        Returns:
+            True if a frame should run: an event arrived or a file was reloaded
+        """
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        if event.type != pygame.NOEVENT:
+            self.pending_events.append(event)
+        elif not (self.file_watcher and self.process_file_changes()):
+            return False
+        # The time spent waiting is not a frame interval
+        self.pacer.resume()
+        return True
+
     def update(self, dt):
         """Update game state."""
         performance.start_frame()
 
         performance.start_section("scene_update")
         self.scene_manager.update(dt)
+        self.post_process.update(dt)
         performance.end_section()
 
     def render(self):
@@ -103,11 +259,177 @@ class Engine:
         self.screen.fill(BLACK)
         self.scene_manager.render(self.screen)
 
+        # Full-frame effects, applied before the overlay so it stays readable
+        if self.post_process.is_enabled():
+            start = time.perf_counter()
+            self.post_process.apply(self.screen)
+            performance.record_section("post_process", time.perf_counter() - start)
+
         # Draw performance metrics if enabled
         performance.draw_metrics(self.screen)
 
+        # Upscale the logical frame into the window
+        self.display.present()
+
+        self.frame_ready_at = time.perf_counter()
         pygame.display.flip()
+        self.last_present = time.perf_counter()
         performance.end_section()
+        self.record_frame_latency()
+
+    def record_frame_latency(self):
+        """Record input-to-present latency and update the expected frame work."""
+        if self.input_sampled_at is None:
+            return
+        performance.record_input_latency(self.last_present - self.input_sampled_at)
+
+        # The flip is left out: with vsync it blocks until the display refreshes
+        work = self.frame_ready_at - self.input_sampled_at
+        # Rise at once after a slow frame, fall back slowly so one fast frame cannot cause a miss
+        self.work_estimate = max(work, self.work_estimate * 0.95 + work * 0.05)
+
+        if self.settings.dynamic_resolution and self.settings.fps_limit:
+            self.display.adapt_quality(work, 1.0 / self.settings.fps_limit)
+
+    def get_frame_rate(self):
+        """Get the frame-rate cap, lowered while a menu scene sits without input."""
+        gameplay = getattr(self.scene_manager.current_scene, "gameplay", True)
+        return self.pacer.get_frame_rate(gameplay)
+
+    def wait_for_input(self):
+        """
+        Sleep until just enough of the frame is left to update and render.
+
+        Used by the low-latency loop instead of sleeping right after the
+        flip, so input is polled as late as possible before the next present.
+
+        Returns:
+            Seconds since the previous frame
+        """
+        fps = self.get_frame_rate()
+        if fps and self.last_present is not None:
+            deadline = self.last_present + 1.0 / fps
+            self.pacer.sleep_until(deadline - self.work_estimate - LATENCY_MARGIN)
+        return self.pacer.tick(0)
+
+    def log_frame_pacing(self):
+        """Log frame interval jitter for the current pacing mode."""
+        stats = self.pacer.get_jitter_stats()
+        self.logger.info(
+            "Frame pacing (%s): target %.2fms, avg %.2fms, jitter %.2fms, p99 %.2fms, max %.2fms",
+            self.settings.frame_pacing,
+            stats["target"],
+            stats["avg"],
+            stats["jitter"],
+            stats["p99"],
+            stats["max"],
+        )
+
+    def prepare_offscreen(self):
+        """Initialize pygame for rendering without the main loop, e.g. for frame capture."""
+        if not pygame.get_init():
+            pygame.init()
+        if pygame.display.get_surface() is None:
+            # Images and text are converted to the display format, so a mode must be set
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    def render_ticks(self, scene_name, first, stop, surface, seed=0):
+        """
+        Render a freshly entered scene offscreen, one fixed-length tick at a time.
+
+        The random module is seeded before the scene is entered and its state
+        restored afterwards, and every tick advances the scene by 1/fps
+        seconds, so the same arguments always produce the same frames.
+        Enabled post effects are applied to each frame.
+
+        Args:
+            scene_name: Registered scene to enter
+            first: First tick to render; earlier ticks are only updated
+            stop: Tick to stop before
+            surface: Offscreen surface each frame is drawn into
+            seed: Seed for the random module
+
+        Yields:
+            (tick, surface) once each frame has been drawn
+        """
+        self.prepare_offscreen()
+        dt = 1.0 / self.fps
+        state = random.getstate()
+        random.seed(seed)
+        self.post_process.stop_shake()
+        try:
+            self.scene_manager.switch_to(scene_name)
+            for tick in range(stop):
+                if tick:
+                    self.input.begin_frame()
+                    self.scene_manager.update(dt)
+                    self.post_process.update(dt)
+                if tick >= first:
+                    surface.fill(BLACK)
+                    self.scene_manager.render(surface)
+                    if self.post_process.is_enabled():
+                        self.post_process.apply(surface)
+                    yield tick, surface
+        finally:
+            random.setstate(state)
+
+    def capture_frame(self, scene_name, tick=0, seed=0):
+        """
+        Render a scene as it looks after a number of ticks into a new offscreen surface.
+
+        Args:
+            scene_name: Registered scene to enter
+            tick: Number of updates before the frame is drawn
+            seed: Seed for the random module
+
+        Returns:
+            The frame, in the capture pixel format
+        """
+        surface = create_capture_surface((self.width, self.height))
+        for _ in self.render_ticks(scene_name, tick, tick + 1, surface, seed):
+            pass
+        return surface
+
+    def capture_frames(self, scene_name, count, start=0, seed=0, directory=None):
+        """
+        Render consecutive ticks of a scene offscreen and hash each frame.
+
+        With a directory, frames are also saved as PNG files by a background
+        writer thread, so encoding overlaps rendering the following ticks.
+
+        Args:
+            scene_name: Registered scene to enter
+            count: Number of frames to capture
+            start: First tick captured
+            seed: Seed for the random module
+            directory: Folder to save frame_<tick>.png files to, or None
+
+        Returns:
+            CRC32 of each frame's pixels, in tick order
+        """
+        surface = create_capture_surface((self.width, self.height))
+        writer = FrameWriter(directory) if directory else None
+        hashes = []
+        if writer:
+            writer.start()
+        try:
+            for tick, frame in self.render_ticks(scene_name, start, start + count, surface, seed):
+                hashes.append(frame_hash(frame))
+                if writer:
+                    writer.submit(frame, tick)
+        finally:
+            if writer:
+                writer.close()
+        return hashes
+
+    def export_performance_report(self, path="performance_report.json"):
+        """Write the current performance metrics, including memory stats, to a file."""
+        try:
+            performance.export_report(path)
+            self.logger.info("Performance report written to %s", path)
+            self.log_frame_pacing()
+        except OSError as e:
+            self.logger.error("Error writing performance report: %s", e)
 
     def run(self):
         """Main game loop."""
@@ -117,9 +439,17 @@ class Engine:
 
         # Main game loop
         while self.running:
-            dt = (
-                self.clock.tick(self.settings.fps_limit) / 1000.0
-            )  # Delta time in seconds using fps from settings
+            # Static scenes sleep until input arrives instead of redrawing
+            if self.is_idle() and not self.wait_while_idle():
+                continue
+
+            if self.settings.low_latency:
+                dt = self.wait_for_input()
+            else:
+                dt = self.pacer.tick(self.get_frame_rate())
+
+            if self.file_watcher:
+                self.process_file_changes()
 
             performance.start_section("event_handling")
             self.handle_events()
@@ -127,6 +457,24 @@ class Engine:
 
             self.update(dt)
             self.render()
+            if surface_audit.enabled:
+                surface_audit.end_frame()
+
+            if telemetry.enabled:
+                telemetry.record(
+                    "frame",
+                    dt=round(dt * 1000, 3),
+                    s=performance.get_last_section_times(),
+                    ev=[self.event_filter.frame_received, self.event_filter.frame_dispatched],
+                    lat=round(performance.get_input_latency_stats()["last"], 3),
+                )
+
+            if startup.mark_first_frame():
+                for line in startup.report():
+                    self.logger.info("Startup: %s", line)
+
+            # Collect garbage after presenting, before waiting for the next frame
+            performance.collect_idle()
 
         self.cleanup()
 
@@ -146,8 +494,35 @@ class Engine:
                 # Small delay to allow display to settle
                 pygame.time.delay(100)
             except Exception as e:
-                self.logger.error(f"Error when exiting fullscreen: {e}")
+                self.logger.error("Error when exiting fullscreen: %s", e)
+
+        telemetry.close()
+
+        stats = self.event_filter.get_stats()
+        self.logger.info(
+            "Events received: %d, dispatched: %d", stats["received"], stats["dispatched"]
+        )
+        self.log_frame_pacing()
+        if surface_audit.enabled:
+            surface_audit.report()
+
+        if self.file_watcher:
+            self.file_watcher.stop()
+        self.post_process.close()
+        self.audio.close()
+
+        # Restore normal garbage collection behavior
+        performance.stop_gc_tracking()
+        performance.stop_memory_tracing()
+        if performance.idle_gc:
+            performance.disable_idle_gc()
 
         # Save settings before exiting
-        self.settings.save()
+        self.settings.save(self.settings_file)
         pygame.quit()
+
+        # Write out any log records still queued
+        stats = GameLogger.get_async_stats()
+        if stats["dropped"]:
+            self.logger.warning("Dropped %d log records during the session", stats["dropped"])
+        GameLogger.disable_async()
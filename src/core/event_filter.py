@@ -0,0 +1,114 @@
+import pygame
+
+# Event types a scene may opt out of; everything else always reaches the engine
+FILTERABLE_EVENTS = (
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.TEXTINPUT,
+    pygame.TEXTEDITING,
+    pygame.FINGERMOTION,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.MULTIGESTURE,
+)
+
+
+def _merge_motion(previous, event):
+    """Combine two motion events, keeping the latest position and the summed rel."""
+    attributes = dict(event.__dict__)
+    attributes["rel"] = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+    return pygame.event.Event(pygame.MOUSEMOTION, attributes)
+
+
+def _merge_wheel(previous, event):
+    """Combine two wheel events scrolling the same way, summing the distances."""
+    attributes = dict(event.__dict__)
+    for name in ("x", "y", "precise_x", "precise_y"):
+        if name in attributes:
+            attributes[name] = getattr(previous, name) + attributes[name]
+    return pygame.event.Event(pygame.MOUSEWHEEL, attributes)
+
+
+def coalesce_events(events):
+    """
+    Merge runs of consecutive high-rate events into single events.
+
+    Motion events collapse into one with the accumulated rel, wheel events
+    sum their scroll, and only the last of several resizes is kept. Runs are
+    only merged while nothing else arrives in between, so event order relative
+    to clicks and key presses is preserved.
+
+    Args:
+        events: Events in queue order
+
+    Returns:
+        New list of events
+    """
+    merged = []
+    for event in events:
+        previous = merged[-1] if merged else None
+        if previous is not None and previous.type == event.type:
+            if event.type == pygame.MOUSEMOTION:
+                merged[-1] = _merge_motion(previous, event)
+                continue
+            if event.type == pygame.MOUSEWHEEL and getattr(previous, "flipped", None) == getattr(
+                event, "flipped", None
+            ):
+                merged[-1] = _merge_wheel(previous, event)
+                continue
+            if event.type == pygame.VIDEORESIZE:
+                merged[-1] = event
+                continue
+        merged.append(event)
+    return merged
+
+
+class EventFilter:
+    """Blocks events the active scene ignores and coalesces bursts of the rest."""
+
+    def __init__(self):
+        self.scene = None  # Scene the current blocking was set up for
+        self.received = 0  # Events taken from the queue
+        self.dispatched = 0  # Events left after coalescing
+        self.frame_received = 0
+        self.frame_dispatched = 0
+
+    def apply(self, scene):
+        """
+        Block the filterable event types the scene does not handle.
+
+        Scenes list what they want in handled_events; None means every event.
+        """
+        if scene is self.scene:
+            return
+        self.scene = scene
+        wanted = getattr(scene, "handled_events", None)
+        if wanted is None:
+            pygame.event.set_allowed(list(FILTERABLE_EVENTS))
+            return
+        blocked = [event_type for event_type in FILTERABLE_EVENTS if event_type not in wanted]
+        allowed = [event_type for event_type in FILTERABLE_EVENTS if event_type in wanted]
+        if blocked:
+            pygame.event.set_blocked(blocked)
+        if allowed:
+            pygame.event.set_allowed(allowed)
+
+    def process(self, events):
+        """Coalesce a frame's events and count them."""
+        merged = coalesce_events(events)
+        self.frame_received = len(events)
+        self.frame_dispatched = len(merged)
+        self.received += self.frame_received
+        self.dispatched += self.frame_dispatched
+        return merged
+
+    def get_stats(self):
+        """Return event counts for the session and the last frame."""
+        return {
+            "received": self.received,
+            "dispatched": self.dispatched,
+            "frame_received": self.frame_received,
+            "frame_dispatched": self.frame_dispatched,
+        }
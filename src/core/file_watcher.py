@@ -0,0 +1,112 @@
+import os
+import threading
+
+from ..utils.logger import GameLogger
+
+
+class FileWatcher:
+    """Polls directories on a background thread and collects changed files."""
+
+    def __init__(self, paths, interval=0.5, extensions=None):
+        """
+        Create a watcher; call start() to begin polling.
+
+        Args:
+            paths: Directories to watch recursively
+            interval: Seconds between scans
+            extensions: Only report files with these extensions, e.g. {".png", ".ogg"}
+        """
+        self.paths = [os.path.normpath(path) for path in paths]
+        self.interval = interval
+        self.extensions = {ext.lower() for ext in extensions} if extensions else None
+        self.logger = GameLogger.get_logger("FileWatcher")
+
+        self.scan_count = 0
+        self._snapshot = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Take the initial snapshot and start polling."""
+        if self._thread is not None:
+            return
+        self._snapshot = self.scan()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+        self._thread.start()
+        self.logger.info("Watching %s for changes", ", ".join(self.paths))
+
+    def stop(self):
+        """Stop polling and wait for the thread to exit."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def is_running(self):
+        """Check whether the polling thread is active."""
+        return self._thread is not None
+
+    def _run(self):
+        """Poll until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except OSError as e:
+                self.logger.warning("File scan failed: %s", e)
+
+    def scan(self):
+        """
+        Stat every watched file.
+
+        Returns:
+            Dict mapping file path to (modification time, size)
+        """
+        snapshot = {}
+        stack = [path for path in self.paths if os.path.isdir(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif self.extensions is None or (
+                            os.path.splitext(entry.name)[1].lower() in self.extensions
+                        ):
+                            try:
+                                stat = entry.stat()
+                            except FileNotFoundError:
+                                continue  # Deleted while scanning
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        self.scan_count += 1
+        return snapshot
+
+    def check(self):
+        """Scan once and queue files that were added, changed or removed."""
+        snapshot = self.scan()
+        previous = self._snapshot
+        changed = {path for path, stat in snapshot.items() if previous.get(path) != stat}
+        changed.update(path for path in previous if path not in snapshot)
+        self._snapshot = snapshot
+
+        if changed:
+            with self._lock:
+                self._pending.update(changed)
+
+    def poll_changes(self):
+        """
+        Take the files changed since the last call; safe to call every frame.
+
+        Returns:
+            Sorted list of changed file paths
+        """
+        if not self._pending:
+            return []
+        with self._lock:
+            changed, self._pending = self._pending, set()
+        return sorted(changed)
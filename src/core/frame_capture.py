@@ -0,0 +1,115 @@
+import os
+import queue
+import threading
+import zlib
+
+import pygame
+from ..utils.logger import GameLogger
+
+# Pixel format of capture surfaces: 32-bit XRGB, so hashes do not depend on the display format
+CAPTURE_DEPTH = 32
+CAPTURE_MASKS = (0xFF0000, 0x00FF00, 0x0000FF, 0)
+
+
+def create_capture_surface(size):
+    """Create an offscreen surface in the fixed capture format."""
+    surface = pygame.Surface(size, 0, CAPTURE_DEPTH, CAPTURE_MASKS)
+    surface.fill((0, 0, 0))  # Also clears the unused padding byte
+    return surface
+
+
+def frame_hash(surface):
+    """
+    Hash a frame's pixels for golden-image comparisons.
+
+    CRC32 over the raw pixel buffer takes well under a millisecond for an
+    800x600 frame, so thousands of frames can be compared against stored
+    hashes without decoding images.
+
+    Args:
+        surface: Frame in the capture format
+
+    Returns:
+        Unsigned 32-bit CRC of the pixels
+    """
+    return zlib.crc32(surface.get_buffer())
+
+
+class FrameWriter:
+    """Saves captured frames to image files on a background thread."""
+
+    def __init__(self, directory, pattern="frame_{:05d}.png", max_pending=32):
+        """
+        Create a writer; call start() before submitting frames.
+
+        Args:
+            directory: Folder the images are written to, created if missing
+            pattern: File name format, given the frame number
+            max_pending: Frames queued before submit() blocks, bounding memory use
+        """
+        self.directory = directory
+        self.pattern = pattern
+        self.logger = GameLogger.get_logger("FrameWriter")
+
+        self.written = 0
+        self.failed = 0
+        self._queue = queue.Queue(max_pending)
+        self._thread = None
+
+    def start(self):
+        """Create the output folder and start the writer thread."""
+        if self._thread is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, surface, number):
+        """
+        Queue a copy of a frame for saving.
+
+        Encoding happens on the writer thread; this only copies the pixels,
+        and blocks only while max_pending frames are already waiting.
+
+        Args:
+            surface: Frame to save; it may be drawn over as soon as this returns
+            number: Frame number used in the file name
+
+        Returns:
+            Path the frame will be written to
+        """
+        path = os.path.join(self.directory, self.pattern.format(number))
+        self._queue.put((surface.copy(), path))
+        return path
+
+    def close(self):
+        """Write any queued frames and stop the thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self.logger.info(
+            "Wrote %d frames to %s (%d failed)", self.written, self.directory, self.failed
+        )
+
+    def _run(self):
+        """Save queued frames until the stop marker arrives."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            surface, path = item
+            try:
+                pygame.image.save(surface, path)
+                self.written += 1
+            except (pygame.error, OSError) as e:
+                self.failed += 1
+                self.logger.error("Failed to write %s: %s", path, e)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
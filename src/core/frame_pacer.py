@@ -0,0 +1,136 @@
+import statistics
+import time
+from collections import deque
+
+import pygame
+
+# How frames are timed:
+#   sdl       - Clock.tick(), which sleeps with SDL_Delay and may overshoot by a few ms
+#   busy_loop - Clock.tick_busy_loop(), exact but keeps a core busy
+#   hybrid    - sleep for most of the wait, then spin on perf_counter for the rest
+PACING_MODES = ("sdl", "busy_loop", "hybrid")
+
+SPIN_THRESHOLD = 0.002  # Hybrid mode spins for the last part of each wait (seconds)
+
+
+class FramePacer:
+    """Waits out each frame at the frame-rate cap and tracks frame interval jitter."""
+
+    def __init__(self, settings, idle_after=2.0, spin_threshold=SPIN_THRESHOLD, max_samples=240):
+        """
+        Create the frame pacer.
+
+        Args:
+            settings: Settings providing fps_limit, frame_pacing and idle_fps
+            idle_after: Seconds without input before a non-gameplay scene is capped at idle_fps
+            spin_threshold: Time left in a hybrid wait that is spun instead of slept
+            max_samples: Number of frame intervals kept for jitter statistics
+        """
+        self.settings = settings
+        self.idle_after = idle_after
+        self.spin_threshold = spin_threshold
+        self.clock = pygame.time.Clock()
+
+        self.last_tick = None  # perf_counter() when the previous frame started
+        self.last_activity = time.perf_counter()
+        self.intervals = deque(maxlen=max_samples)  # Seconds between frame starts
+        self.target = 0.0  # Frame interval the last tick aimed for
+
+    def notify_activity(self):
+        """Note that input arrived, lifting the idle cap."""
+        self.last_activity = time.perf_counter()
+
+    def is_idle(self):
+        """Check whether no input has arrived for idle_after seconds."""
+        return time.perf_counter() - self.last_activity >= self.idle_after
+
+    def resume(self):
+        """Start the next frame immediately, e.g. after the engine blocked on input."""
+        self.last_tick = None
+
+    def get_frame_rate(self, gameplay=True):
+        """
+        Get the frame-rate cap for the next frame.
+
+        Args:
+            gameplay: Whether the active scene needs the full frame rate regardless of input
+
+        Returns:
+            Frames per second, or 0 for uncapped
+        """
+        fps = self.settings.fps_limit
+        idle_fps = self.settings.idle_fps
+        if gameplay or not idle_fps or not self.is_idle():
+            return fps
+        return min(fps, idle_fps) if fps else idle_fps
+
+    def tick(self, fps):
+        """
+        Wait until the next frame is due and start it.
+
+        Args:
+            fps: Frame-rate cap; 0 starts the frame immediately
+
+        Returns:
+            Seconds since the previous frame started
+        """
+        mode = self.settings.frame_pacing
+        if mode == "sdl":
+            self.clock.tick(fps)
+        elif mode == "busy_loop":
+            self.clock.tick_busy_loop(fps)
+        else:
+            if fps and self.last_tick is not None:
+                self.sleep_until(self.last_tick + 1.0 / fps)
+            self.clock.tick()  # Keep Clock.get_fps() meaningful
+        return self._start_frame(fps)
+
+    def sleep_until(self, deadline):
+        """
+        Block until a perf_counter() deadline using the configured pacing mode.
+
+        Args:
+            deadline: Time to wake up, in perf_counter() seconds
+        """
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        mode = self.settings.frame_pacing
+        if mode == "sdl":
+            pygame.time.delay(int(remaining * 1000))
+            return
+        if mode != "busy_loop" and remaining > self.spin_threshold:
+            time.sleep(remaining - self.spin_threshold)
+        while time.perf_counter() < deadline:
+            pass
+
+    def _start_frame(self, fps):
+        """Record the interval since the previous frame and return it."""
+        now = time.perf_counter()
+        dt = 0.0 if self.last_tick is None else now - self.last_tick
+        if self.last_tick is not None:
+            self.intervals.append(dt)
+        self.last_tick = now
+        self.target = 1.0 / fps if fps else 0.0
+        return dt
+
+    def get_jitter_stats(self):
+        """
+        Get frame interval statistics in milliseconds.
+
+        Returns:
+            Dictionary with the target, average, standard deviation (jitter),
+            99th percentile and maximum interval
+        """
+        if len(self.intervals) < 2:
+            return {"target": self.target * 1000, "avg": 0.0, "jitter": 0.0, "p99": 0.0, "max": 0.0}
+
+        intervals = sorted(self.intervals)
+        p99 = intervals[min(len(intervals) - 1, int(len(intervals) * 0.99))]
+        return {
+            "target": self.target * 1000,
+            "avg": statistics.fmean(intervals) * 1000,
+            "jitter": statistics.pstdev(intervals) * 1000,
+            "p99": p99 * 1000,
+            "max": intervals[-1] * 1000,
+        }
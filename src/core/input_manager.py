@@ -0,0 +1,174 @@
+import copy
+
+import pygame
+from ..utils.logger import GameLogger
+
+# Gamepad bindings: action -> list of ("button", index), ("hat", axis, direction)
+# or ("axis", index, direction) sources. Defaults follow the common XInput layout.
+DEFAULT_JOYSTICK_BINDINGS = {
+    "move_up": [("hat", 1, 1), ("axis", 1, -1)],
+    "move_down": [("hat", 1, -1), ("axis", 1, 1)],
+    "move_left": [("hat", 0, -1), ("axis", 0, -1)],
+    "move_right": [("hat", 0, 1), ("axis", 0, 1)],
+    "jump": [("button", 0)],
+    "pause": [("button", 7)],
+}
+
+
+class InputManager:
+    """Maps keyboard and gamepad input to named actions polled once per frame."""
+
+    def __init__(self, settings, joystick_bindings=None, axis_threshold=0.5):
+        """
+        Create the input manager.
+
+        Args:
+            settings: Settings whose key_bindings map actions to a key or list of keys
+            joystick_bindings: Action -> gamepad sources; see DEFAULT_JOYSTICK_BINDINGS
+            axis_threshold: How far a stick must move before it counts as held
+        """
+        self.settings = settings
+        self.joystick_bindings = joystick_bindings or DEFAULT_JOYSTICK_BINDINGS
+        self.axis_threshold = axis_threshold
+        self.logger = GameLogger.get_logger("InputManager")
+        self.joysticks = {}  # Instance id -> pygame.joystick.Joystick
+
+        # Reverse lookup tables, rebuilt when the bindings change
+        self._bindings_snapshot = None
+        self._key_actions = {}
+        self._joystick_actions = {}
+
+        # Per-action state
+        self._sources = {}  # Action -> set of inputs currently holding it
+        self.pressed = set()  # Actions that went down this frame
+        self.released = set()  # Actions that went up this frame
+
+        # Mouse motion coalesced over the frame
+        self.mouse_pos = (0, 0)
+        self.mouse_rel = (0, 0)
+        self.mouse_buttons = (0, 0, 0)
+        self.mouse_moved = False
+
+        self.rebuild_bindings()
+
+    def rebuild_bindings(self):
+        """Build the key and gamepad reverse lookup tables."""
+        self._key_actions = {}
+        for action, keys in self.settings.key_bindings.items():
+            for key in keys if isinstance(keys, (list, tuple)) else (keys,):
+                self._key_actions.setdefault(key, []).append(action)
+
+        self._joystick_actions = {}
+        for action, sources in self.joystick_bindings.items():
+            for source in sources:
+                self._joystick_actions.setdefault(tuple(source), []).append(action)
+
+        # Deep copy, so keys appended to a binding's list in place are noticed too
+        self._bindings_snapshot = copy.deepcopy(self.settings.key_bindings)
+
+    def begin_frame(self):
+        """Clear per-frame state; call before processing the frame's events."""
+        self.pressed.clear()
+        self.released.clear()
+        self.mouse_rel = (0, 0)
+        self.mouse_moved = False
+        if self.settings.key_bindings != self._bindings_snapshot:
+            self.rebuild_bindings()
+
+    def process_event(self, event):
+        """Update action and mouse state from one pygame event."""
+        if event.type == pygame.KEYDOWN:
+            for action in self._key_actions.get(event.key, ()):
+                self._press(action, ("key", event.key))
+        elif event.type == pygame.KEYUP:
+            for action in self._key_actions.get(event.key, ()):
+                self._release(action, ("key", event.key))
+        elif event.type == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+            self.mouse_rel = (self.mouse_rel[0] + event.rel[0], self.mouse_rel[1] + event.rel[1])
+            self.mouse_buttons = event.buttons
+            self.mouse_moved = True
+        elif event.type == pygame.JOYBUTTONDOWN:
+            self._set_joystick_source(event.instance_id, ("button", event.button), True)
+        elif event.type == pygame.JOYBUTTONUP:
+            self._set_joystick_source(event.instance_id, ("button", event.button), False)
+        elif event.type == pygame.JOYHATMOTION:
+            for axis in (0, 1):
+                for direction in (-1, 1):
+                    held = event.value[axis] == direction
+                    self._set_joystick_source(event.instance_id, ("hat", axis, direction), held)
+        elif event.type == pygame.JOYAXISMOTION:
+            for direction in (-1, 1):
+                held = event.value * direction > self.axis_threshold
+                self._set_joystick_source(event.instance_id, ("axis", event.axis, direction), held)
+        elif event.type == pygame.JOYDEVICEADDED:
+            joystick = pygame.joystick.Joystick(event.device_index)
+            self.joysticks[joystick.get_instance_id()] = joystick
+            self.logger.info("Gamepad connected: %s", joystick.get_name())
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            self.joysticks.pop(event.instance_id, None)
+            self._release_joystick(event.instance_id)
+            self.logger.info("Gamepad disconnected")
+
+    def _set_joystick_source(self, instance_id, source, held):
+        """Press or release the actions bound to a gamepad input."""
+        for action in self._joystick_actions.get(source, ()):
+            if held:
+                self._press(action, ("joystick", instance_id) + source)
+            else:
+                self._release(action, ("joystick", instance_id) + source)
+
+    def _release_joystick(self, instance_id):
+        """Release everything a disconnected gamepad was holding."""
+        for action, sources in list(self._sources.items()):
+            for source in [s for s in sources if s[:2] == ("joystick", instance_id)]:
+                self._release(action, source)
+
+    def _press(self, action, source):
+        """Mark an action held by a source, noting the press if it was up."""
+        sources = self._sources.setdefault(action, set())
+        if not sources:
+            self.pressed.add(action)
+        sources.add(source)
+
+    def _release(self, action, source):
+        """Drop a source from an action, noting the release once nothing holds it."""
+        sources = self._sources.get(action)
+        if sources and source in sources:
+            sources.discard(source)
+            if not sources:
+                self.released.add(action)
+
+    def is_pressed(self, action):
+        """Check whether an action went down this frame."""
+        return action in self.pressed
+
+    def is_held(self, action):
+        """Check whether an action is currently down."""
+        return bool(self._sources.get(action))
+
+    def is_released(self, action):
+        """Check whether an action went up this frame."""
+        return action in self.released
+
+    def get_mouse_motion(self):
+        """
+        Get this frame's mouse movement as one event.
+
+        Returns:
+            A MOUSEMOTION event with the latest position and the summed rel,
+            or None if the mouse did not move
+        """
+        if not self.mouse_moved:
+            return None
+        return pygame.event.Event(
+            pygame.MOUSEMOTION,
+            {"pos": self.mouse_pos, "rel": self.mouse_rel, "buttons": self.mouse_buttons},
+        )
+
+    def reset(self):
+        """Release every action, e.g. when the window loses focus."""
+        for action, sources in self._sources.items():
+            if sources:
+                sources.clear()
+                self.released.add(action)
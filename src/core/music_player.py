@@ -0,0 +1,169 @@
+import pygame
+from ..utils.logger import GameLogger
+
+
+class MusicPlayer:
+    """Streams music tracks registered on the resource manager."""
+
+    def __init__(self, resource_manager, settings):
+        self.resource_manager = resource_manager
+        self.settings = settings
+        self.logger = GameLogger.get_logger("MusicPlayer")
+        self.end_event = None  # Event posted by the mixer when a track finishes
+
+        self.current = None  # Name of the track playing or about to play
+        self.playlist = []
+        self.playlist_index = 0
+        self.loop_playlist = True
+        self._next = None  # (name, loops, fade_ms) started once the fade-out ends
+        self.paused = False
+
+    def initialize(self):
+        """Ask the mixer to post an event whenever a track ends."""
+        self.end_event = pygame.event.custom_type()
+        pygame.mixer.music.set_endevent(self.end_event)
+        self.apply_volume()
+
+        # A scene may have asked for music before the mixer was running
+        if self.current and self.settings.music_enabled:
+            self._start(self.current, 0 if self.playlist else -1, 500)
+
+    def apply_volume(self):
+        """Apply the master and music volume settings."""
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.music.set_volume(self.settings.master_volume * self.settings.music_volume)
+
+    def play(self, name, loops=-1, fade_ms=500):
+        """
+        Stream a track, fading out whatever is playing first.
+
+        Args:
+            name: Name the track was registered under
+            loops: Extra times to repeat; -1 repeats forever
+            fade_ms: Fade-out time for the previous track and fade-in time for this one
+        """
+        self.playlist = []
+        self._switch_to(name, loops, fade_ms)
+
+    def play_playlist(self, names, loop=True, fade_ms=500):
+        """
+        Stream tracks one after another, queueing each next track ahead of time.
+
+        Args:
+            names: Registered track names in play order
+            loop: Start over after the last track
+            fade_ms: Fade used when switching from the current music
+        """
+        if not names:
+            return
+        self.playlist = list(names)
+        self.playlist_index = 0
+        self.loop_playlist = loop
+        self._switch_to(self.playlist[0], 0, fade_ms)
+
+    def _switch_to(self, name, loops, fade_ms):
+        """Start a track now, or after fading out the current one."""
+        if not self.settings.music_enabled or not pygame.mixer.get_init():
+            if name != self.current:
+                self._forget_paused()  # The paused track is no longer the one wanted
+            self.current = name
+            return  # Started later by unpause() or initialize()
+        if name == self.current and pygame.mixer.music.get_busy() and self._next is None:
+            return  # Already playing; keep going rather than restarting
+        self.current = name
+
+        if pygame.mixer.music.get_busy() and fade_ms > 0:
+            # The mixer streams one track at a time: fade out, then start on the end event
+            self._next = (name, loops, fade_ms)
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            self._start(name, loops, fade_ms)
+
+    def _start(self, name, loops, fade_ms):
+        """Load and start streaming a track."""
+        self._next = None
+        self.paused = False
+        path = self.resource_manager.get_music_path(name)
+        if path is None:
+            return
+        try:
+            pygame.mixer.music.load(path)
+            self.apply_volume()
+            pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        except pygame.error as e:
+            self.logger.error("Error streaming music %s: %s", path, e)
+            return
+        self._queue_next()
+
+    def _queue_next(self):
+        """Hand the following playlist track to the mixer so it starts without a gap."""
+        if not self.playlist:
+            return
+        index = self.playlist_index + 1
+        if index >= len(self.playlist):
+            if not self.loop_playlist:
+                return
+            index = 0
+        path = self.resource_manager.get_music_path(self.playlist[index])
+        if path is not None:
+            pygame.mixer.music.queue(path)
+
+    def handle_event(self, event):
+        """Advance playlists and finish fades when the mixer reports a track ended."""
+        if event.type != self.end_event or self.end_event is None:
+            return
+        if self._next is not None:
+            self._start(*self._next)
+        elif self.playlist:
+            # The queued track has started; queue the one after it
+            self.playlist_index += 1
+            if self.playlist_index >= len(self.playlist):
+                if not self.loop_playlist:
+                    self.playlist = []
+                    self.current = None
+                    return
+                self.playlist_index = 0
+            self.current = self.playlist[self.playlist_index]
+            self._queue_next()
+
+    def fadeout(self, fade_ms=500):
+        """Fade the music out and forget the current track."""
+        self.current = None
+        self.playlist = []
+        self._next = None
+        self.paused = False
+        if pygame.mixer.get_init():
+            pygame.mixer.music.fadeout(fade_ms)
+
+    def stop(self):
+        """Stop the music immediately."""
+        self.current = None
+        self.playlist = []
+        self._next = None
+        self.paused = False
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+
+    def pause(self):
+        """Pause streaming."""
+        if not pygame.mixer.get_init():
+            return
+        self.paused = True
+        pygame.mixer.music.pause()
+
+    def unpause(self):
+        """Resume streaming, starting the wanted track if music was disabled before."""
+        if not pygame.mixer.get_init():
+            return  # initialize() starts the wanted track once the mixer is running
+        if self.paused:
+            self.paused = False
+            pygame.mixer.music.unpause()
+        if self.current and not pygame.mixer.music.get_busy():
+            self._start(self.current, 0 if self.playlist else -1, 500)
+
+    def _forget_paused(self):
+        """Drop a paused track so unpause() starts the current one instead of resuming it."""
+        if self.paused and pygame.mixer.get_init():
+            pygame.mixer.music.stop()
+        self.paused = False
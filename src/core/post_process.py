@@ -0,0 +1,273 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from ..utils.logger import GameLogger
+
+try:
+    import numpy
+except ImportError:  # Post-processing is skipped without NumPy
+    numpy = None
+
+# Effects in the order they are applied to the finished frame
+POST_EFFECTS = ("shake", "bloom", "vignette", "scanlines")
+
+# Bloom is blurred at 1/BLOOM_SCALE resolution; band edges are aligned to this many rows
+BLOOM_SCALE = 8
+BLOOM_THRESHOLD = 160  # Channel values above this glow
+BLOOM_RADIUS = 3  # Box blur radius in downscaled pixels, applied twice
+BLOOM_STRENGTH = 1.5  # Glow added on top of the frame
+
+VIGNETTE_STRENGTH = 0.6  # Brightness removed at the corners
+SCANLINE_BRIGHTNESS = 0.75  # Brightness kept on odd rows
+
+
+def frame_pixels(surface):
+    """
+    View a 32-bit surface's pixels as a (height, width, 4) byte array, without copying.
+
+    Rows are contiguous, unlike surfarray.pixels3d whose x-major, reversed
+    channel layout keeps NumPy off its fast paths. The channel order is the
+    surface's byte order, which does not matter to effects that treat every
+    channel alike. The surface stays locked until the view is released.
+    """
+    width, height = surface.get_size()
+    return pygame.surfarray.pixels2d(surface).T.view(numpy.uint8).reshape(height, width, 4)
+
+
+class PostProcessor:
+    """Full-frame effects on the finished frame: NumPy kernels split into row bands."""
+
+    def __init__(self, settings, workers=None):
+        """
+        Create the post-processor.
+
+        Args:
+            settings: Settings providing post_effects and post_process_threads
+            workers: Threads the bands are spread over; None uses
+                post_process_threads, or one per CPU when that is 0
+        """
+        self.settings = settings
+        self.workers = workers or settings.post_process_threads or os.cpu_count() or 1
+        self.logger = GameLogger.get_logger("PostProcessor")
+        self.executor = None  # Created on first use when there are several workers
+
+        # Screen shake state
+        self.shake_strength = 0.0  # Largest offset in pixels at the start of a shake
+        self.shake_duration = 0.0
+        self.shake_time = 0.0  # Seconds left
+        self.offset = (0, 0)  # Offset the current frame is shifted by
+
+        # Buffers reused while the frame size stays the same
+        self._bands = None  # (height, [(top, bottom), ...])
+        self._glow = None  # Downscaled bright-pass, blurred in place
+        self._shade = None  # ((size, vignette, scanlines), surface) multiplied over the frame
+        self._unsupported_warned = False
+
+        if numpy is None and settings.post_effects:
+            self.logger.warning("NumPy is not installed; post effects are disabled")
+
+    def is_enabled(self):
+        """Check whether any effect is turned on and NumPy is available."""
+        return numpy is not None and bool(self.settings.post_effects)
+
+    def shake(self, strength=8.0, duration=0.3):
+        """
+        Start shaking the screen, unless a stronger shake is already running.
+
+        Args:
+            strength: Largest offset in pixels, reached at the start
+            duration: Seconds until the shake has faded out
+        """
+        remaining = 0.0
+        if self.shake_time > 0:
+            remaining = self.shake_strength * self.shake_time / self.shake_duration
+        if strength >= remaining:
+            self.shake_strength = strength
+            self.shake_duration = self.shake_time = duration
+
+    def stop_shake(self):
+        """End any running shake at once."""
+        self.shake_time = 0.0
+        self.offset = (0, 0)
+
+    def update(self, dt):
+        """Advance the shake and pick this frame's offset."""
+        if self.shake_time <= 0:
+            self.offset = (0, 0)
+            return
+        self.shake_time = max(0.0, self.shake_time - dt)
+        amount = self.shake_strength * self.shake_time / self.shake_duration
+        self.offset = (
+            round(random.uniform(-amount, amount)),
+            round(random.uniform(-amount, amount)),
+        )
+
+    def apply(self, surface):
+        """
+        Run the enabled effects on a finished frame in place.
+
+        Args:
+            surface: 32-bit frame without per-pixel alpha; others are left untouched
+        """
+        effects = self.settings.post_effects
+        if surface.get_bitsize() != 32 or surface.get_masks()[3]:
+            if not self._unsupported_warned:
+                self.logger.warning(
+                    "Skipping post effects on a %d-bit frame", surface.get_bitsize()
+                )
+                self._unsupported_warned = True
+            return
+
+        if "shake" in effects and self.offset != (0, 0):
+            self.apply_shake(surface)
+        if "bloom" in effects:
+            self.apply_bloom(surface)
+
+        # Vignette and scanlines only scale pixels by a fixed factor, so both are
+        # baked into one mask and applied by a single multiply blit
+        vignette = "vignette" in effects
+        scanlines = "scanlines" in effects
+        if vignette or scanlines:
+            shade = self.get_shade(surface, vignette, scanlines)
+            surface.blit(shade, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+    def apply_shake(self, surface):
+        """Shift the frame by the shake offset and blank the uncovered edges."""
+        dx, dy = self.offset
+        width, height = surface.get_size()
+        surface.scroll(dx, dy)
+        if dx:
+            surface.fill((0, 0, 0), (0 if dx > 0 else width + dx, 0, abs(dx), height))
+        if dy:
+            surface.fill((0, 0, 0), (0, 0 if dy > 0 else height + dy, width, abs(dy)))
+
+    def apply_bloom(self, surface):
+        """Add a blurred glow around the frame's brightest pixels."""
+        width, height = surface.get_size()
+        shape = (-(-height // BLOOM_SCALE), -(-width // BLOOM_SCALE), 4)
+        if self._glow is None or self._glow.shape != shape:
+            self._glow = numpy.zeros(shape, numpy.float32)
+        else:
+            self._glow.fill(0)  # Partial blocks at the edges are never overwritten
+
+        pixels = frame_pixels(surface)
+        bands = self.get_bands(height)
+        self.run_bands(self.extract_bright, pixels, bands)
+        self.blur_glow()
+        self.run_bands(self.add_glow, pixels, bands)
+        del pixels
+
+    def get_bands(self, height):
+        """
+        Split the frame's rows into one band per worker.
+
+        Returns:
+            List of (top, bottom) row ranges; tops are multiples of BLOOM_SCALE
+        """
+        if self._bands is None or self._bands[0] != height:
+            blocks = -(-height // BLOOM_SCALE)
+            count = max(1, min(self.workers, blocks))
+            edges = [i * blocks // count * BLOOM_SCALE for i in range(count)] + [height]
+            self._bands = (height, list(zip(edges, edges[1:])))
+        return self._bands[1]
+
+    def run_bands(self, kernel, pixels, bands):
+        """Run kernel(pixels, top, bottom) per band, on the thread pool when there are several."""
+        if len(bands) == 1:
+            kernel(pixels, *bands[0])
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="PostProcess")
+        # NumPy releases the GIL inside its loops, so bands run in parallel
+        futures = [self.executor.submit(kernel, pixels, top, bottom) for top, bottom in bands]
+        for future in futures:
+            future.result()  # Re-raises any error from the kernel
+
+    def extract_bright(self, pixels, top, bottom):
+        """Average each block of a band into the glow buffer, keeping light above the threshold."""
+        width = pixels.shape[1] - pixels.shape[1] % BLOOM_SCALE
+        bottom -= (bottom - top) % BLOOM_SCALE  # Partial blocks at the edges do not glow
+        if bottom <= top or not width:
+            return
+        rows = pixels[top:bottom, :width].reshape(-1, BLOOM_SCALE, width, 4)
+        # Sum the rows of each block, then its columns, with contiguous adds
+        sums = rows[:, 0].astype(numpy.uint16)
+        for i in range(1, BLOOM_SCALE):
+            sums += rows[:, i]
+        columns = sums.reshape(len(sums), -1, BLOOM_SCALE, 4)
+        block = columns[:, :, 0].copy()
+        for i in range(1, BLOOM_SCALE):
+            block += columns[:, :, i]
+
+        glow = self._glow[top // BLOOM_SCALE : bottom // BLOOM_SCALE, : width // BLOOM_SCALE]
+        numpy.multiply(block, 1.0 / (BLOOM_SCALE * BLOOM_SCALE), out=glow)
+        numpy.subtract(glow, BLOOM_THRESHOLD, out=glow)
+        numpy.maximum(glow, 0, out=glow)
+
+    def blur_glow(self):
+        """Spread the bright-pass with two separable box blurs, approximating a Gaussian."""
+        glow = self._glow
+        for _ in range(2):
+            for axis in (0, 1):
+                box_blur(glow, BLOOM_RADIUS, axis)
+        numpy.multiply(glow, BLOOM_STRENGTH, out=glow)
+        numpy.minimum(glow, 255, out=glow)
+
+    def add_glow(self, pixels, top, bottom):
+        """Add the upscaled glow to a band, saturating at white."""
+        width = pixels.shape[1]
+        glow = self._glow[top // BLOOM_SCALE : -(-bottom // BLOOM_SCALE)].astype(numpy.uint8)
+        glow = glow.repeat(BLOOM_SCALE, axis=1)[:, :width]
+        for i in range(BLOOM_SCALE):
+            rows = pixels[top + i : bottom : BLOOM_SCALE]
+            # Limit the glow to the headroom left in each channel, then add it in place
+            room = 255 - rows
+            numpy.minimum(glow[: len(rows)], room, out=room)
+            rows += room
+
+    def get_shade(self, surface, vignette, scanlines):
+        """Get the brightness mask for the vignette and scanlines, rebuilding it for a new size."""
+        key = (surface.get_size(), vignette, scanlines)
+        if self._shade is not None and self._shade[0] == key:
+            return self._shade[1]
+
+        width, height = surface.get_size()
+        factor = numpy.ones((width, height), numpy.float32)
+        if vignette:
+            x = numpy.linspace(-1.0, 1.0, width, dtype=numpy.float32)[:, None]
+            y = numpy.linspace(-1.0, 1.0, height, dtype=numpy.float32)[None, :]
+            distance = (x * x + y * y) / 2  # 0 at the center, 1 in the corners
+            factor *= 1.0 - VIGNETTE_STRENGTH * distance**1.5
+        if scanlines:
+            factor[:, 1::2] *= SCANLINE_BRIGHTNESS
+
+        shade = pygame.Surface((width, height), 0, surface)
+        values = (factor * 255).round().astype(numpy.uint8)
+        pygame.surfarray.blit_array(shade, numpy.repeat(values[:, :, None], 3, axis=2))
+        self._shade = (key, shade)
+        return shade
+
+    def close(self):
+        """Stop the worker threads."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def box_blur(image, radius, axis):
+    """
+    Average every element in place with its neighbours within radius along one axis.
+
+    Edges repeat the outermost values.
+    """
+    lines = numpy.moveaxis(image, axis, 0)
+    count = len(lines)
+    padded = numpy.concatenate(
+        [lines[:1].repeat(radius, axis=0), lines, lines[-1:].repeat(radius, axis=0)]
+    )
+    total = padded[:count].copy()
+    for offset in range(1, 2 * radius + 1):
+        total += padded[offset : offset + count]
+    numpy.multiply(total, 1.0 / (2 * radius + 1), out=lines)
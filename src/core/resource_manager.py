@@ -1,15 +1,22 @@
+import os
+
 import pygame
+from .sound_cache import SOUND_CACHE_DIR, DecodedSoundCache
 from ..utils.logger import GameLogger
 
 
 class ResourceManager:
     """Manages game assets and resources."""
 
-    def __init__(self):
+    def __init__(self, sound_cache_dir=SOUND_CACHE_DIR):
         self.images = {}
         self.sounds = {}
         self.fonts = {}
+        self.music = {}  # Track name -> file path; streamed, never decoded into memory
+        self.sources = {}  # Absolute file path -> list of (kind, key, load arguments)
         self.logger = GameLogger.get_logger("ResourceManager")
+        # Decoded sound effects are cached on disk unless sound_cache_dir is None
+        self.sound_cache = DecodedSoundCache(sound_cache_dir) if sound_cache_dir else None
         self.logger.info("Resource Manager initialized")
 
     def load_image(self, name, path, alpha=True):
@@ -20,35 +27,40 @@ class ResourceManager:
             else:
                 image = pygame.image.load(path).convert()
             self.images[name] = image
-            self.logger.debug(f"Loaded image: {name} from {path}")
+            self._track_source(path, "images", name, (alpha,))
+            self.logger.debug("Loaded image: %s from %s", name, path)
             return image
         except (pygame.error, FileNotFoundError) as e:
-            self.logger.error(f"Error loading image {path}: {e}")
+            self.logger.error("Error loading image %s: %s", path, e)
             raise FileNotFoundError(f"No such file or directory: '{path}'")
 
     def get_image(self, name):
         """Retrieve a loaded image."""
         image = self.images.get(name)
         if image is None:
-            self.logger.warning(f"Image not found: {name}")
+            self.logger.warning("Image not found: %s", name)
         return image
 
     def load_sound(self, name, path):
         """Load a sound effect and store it."""
         try:
-            sound = pygame.mixer.Sound(path)
+            if self.sound_cache:
+                sound = self.sound_cache.load(path)
+            else:
+                sound = pygame.mixer.Sound(path)
             self.sounds[name] = sound
-            self.logger.debug(f"Loaded sound: {name} from {path}")
+            self._track_source(path, "sounds", name, ())
+            self.logger.debug("Loaded sound: %s from %s", name, path)
             return sound
         except (pygame.error, FileNotFoundError) as e:
-            self.logger.error(f"Error loading sound {path}: {e}")
+            self.logger.error("Error loading sound %s: %s", path, e)
             return None
 
     def get_sound(self, name):
         """Retrieve a loaded sound."""
         sound = self.sounds.get(name)
         if sound is None:
-            self.logger.warning(f"Sound not found: {name}")
+            self.logger.warning("Sound not found: %s", name)
         return sound
 
     def load_font(self, name, path, size):
@@ -56,15 +68,66 @@ class ResourceManager:
         try:
             font = pygame.font.Font(path, size)
             self.fonts[(name, size)] = font
-            self.logger.debug(f"Loaded font: {name} size {size} from {path}")
+            self._track_source(path, "fonts", (name, size), ())
+            self.logger.debug("Loaded font: %s size %d from %s", name, size, path)
             return font
         except (pygame.error, FileNotFoundError) as e:
-            self.logger.error(f"Error loading font {path}: {e}")
+            self.logger.error("Error loading font %s: %s", path, e)
             return None
 
     def get_font(self, name, size):
         """Retrieve a loaded font."""
         font = self.fonts.get((name, size))
         if font is None:
-            self.logger.warning(f"Font '{name}' size {size} not found")
+            self.logger.warning("Font '%s' size %d not found", name, size)
         return font
+
+    def register_music(self, name, path):
+        """Register a music track to be streamed from disk by the music player."""
+        if not os.path.isfile(path):
+            self.logger.error("Music file not found: %s", path)
+            return False
+        self.music[name] = path
+        self.logger.debug("Registered music: %s at %s", name, path)
+        return True
+
+    def get_music_path(self, name):
+        """Retrieve the file path of a registered music track."""
+        path = self.music.get(name)
+        if path is None:
+            self.logger.warning("Music not found: %s", name)
+        return path
+
+    def _track_source(self, path, kind, key, args):
+        """Remember which file an entry was loaded from so it can be reloaded."""
+        entries = self.sources.setdefault(os.path.abspath(path), [])
+        entry = (kind, key, args)
+        if entry not in entries:
+            entries.append(entry)
+
+    def reload_path(self, path):
+        """
+        Reload every entry loaded from a changed file.
+
+        Args:
+            path: Path of the file that changed
+
+        Returns:
+            List of (kind, key, resource) for the entries that were reloaded
+        """
+        source = os.path.abspath(path)
+        reloaded = []
+        for kind, key, args in self.sources.get(source, ()):
+            try:
+                if kind == "images":
+                    resource = self.load_image(key, source, *args)
+                elif kind == "sounds":
+                    resource = self.load_sound(key, source)
+                else:
+                    resource = self.load_font(key[0], source, key[1])
+            except FileNotFoundError:
+                resource = None  # Already logged; keep the old entry until the file returns
+            if resource is not None:
+                reloaded.append((kind, key, resource))
+                self.logger.info("Reloaded %s '%s' from %s", kind[:-1], key, path)
+        return reloaded
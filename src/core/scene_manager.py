@@ -1,9 +1,16 @@
+import importlib
+
+from ..utils.startup import startup
+from ..utils.telemetry import telemetry
+
+
 class SceneManager:
     """Manages scene transitions and updates."""
 
     def __init__(self, engine):
         self.engine = engine
         self.scenes = {}
+        self.scene_factories = {}  # Lazily built scenes: name -> (factory, args, kwargs)
         self.current_scene = None
         self.current_scene_name = None
 
@@ -11,16 +18,55 @@ class SceneManager:
         """Register a scene with a name."""
         self.scenes[name] = scene
 
+    def register_scene(self, name, factory, *args, **kwargs):
+        """
+        Register a scene that is only imported and built on first use.
+
+        Args:
+            name: Name of the scene
+            factory: Callable taking the engine, or a dotted path such as
+                "src.scenes.pong_scene:PongScene"
+            *args, **kwargs: Extra arguments passed to the factory after the engine
+        """
+        self.scene_factories[name] = (factory, args, kwargs)
+
+    def has_scene(self, name):
+        """Check whether a scene is registered, built or not."""
+        return name in self.scenes or name in self.scene_factories
+
+    def get_scene(self, name):
+        """Retrieve a scene, building it if it was registered lazily."""
+        scene = self.scenes.get(name)
+        if scene is None and name in self.scene_factories:
+            factory, args, kwargs = self.scene_factories.pop(name)
+            with startup.phase(f"scene construction: {name}"):
+                if isinstance(factory, str):
+                    factory = self._resolve_factory(factory)
+                scene = factory(self.engine, *args, **kwargs)
+            self.scenes[name] = scene
+        return scene
+
+    @staticmethod
+    def _resolve_factory(path):
+        """Import a factory given as "package.module:attribute"."""
+        module_name, _, attribute = path.partition(":")
+        if not attribute:
+            module_name, _, attribute = path.rpartition(".")
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute)
+
     def switch_to(self, scene_name):
         """Switch to a different scene."""
-        if scene_name not in self.scenes:
+        scene = self.get_scene(scene_name)
+        if scene is None:
             raise ValueError(f"Scene '{scene_name}' not found")
 
         if self.current_scene:
             self.current_scene.exit()
 
+        telemetry.record("scene", **{"from": self.current_scene_name, "to": scene_name})
         self.current_scene_name = scene_name
-        self.current_scene = self.scenes[scene_name]
+        self.current_scene = scene
         self.current_scene.enter()
 
     def handle_event(self, event):
@@ -33,6 +79,16 @@ class SceneManager:
         if self.current_scene:
             self.current_scene.update(dt)
 
+    def on_resize(self, width, height):
+        """Let the current scene reflow after a window size change."""
+        if self.current_scene:
+            self.current_scene.on_resize(width, height)
+
+    def notify_resource_reloaded(self, kind, key, resource):
+        """Tell every built scene that a resource was reloaded from disk."""
+        for scene in self.scenes.values():
+            scene.on_resource_reloaded(kind, key, resource)
+
     def render(self, surface):
         """Render current scene."""
         if self.current_scene:
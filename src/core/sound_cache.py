@@ -0,0 +1,89 @@
+import hashlib
+import mmap
+import os
+
+import pygame
+from ..utils.logger import GameLogger
+
+SOUND_CACHE_DIR = os.path.join(".cache", "sounds")
+
+
+class DecodedSoundCache:
+    """Keeps decoded PCM on disk so known sound effects skip decoding at startup."""
+
+    def __init__(self, cache_dir=SOUND_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.logger = GameLogger.get_logger("SoundCache")
+        self.hits = 0
+        self.misses = 0
+
+    def get_cache_path(self, path):
+        """
+        Get the cache file for a sound in the current mixer format.
+
+        Args:
+            path: Path to the encoded sound file
+
+        Returns:
+            Cache file path, or None if the mixer is not initialized
+        """
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            return None
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        frequency, size, channels = mixer_format
+        name = f"{digest.hexdigest()}-{frequency}-{size}-{channels}.pcm"
+        return os.path.join(self.cache_dir, name)
+
+    def load(self, path):
+        """
+        Load a sound, reading decoded samples from the cache when possible.
+
+        Args:
+            path: Path to the encoded sound file
+
+        Returns:
+            pygame.mixer.Sound
+        """
+        cache_path = self.get_cache_path(path)
+        if cache_path is None:
+            return pygame.mixer.Sound(path)
+
+        sound = self._load_cached(cache_path)
+        if sound is not None:
+            self.hits += 1
+            return sound
+
+        # Decode once and keep the samples for the next launch
+        self.misses += 1
+        sound = pygame.mixer.Sound(path)
+        self._store(cache_path, sound.get_raw())
+        return sound
+
+    def _load_cached(self, cache_path):
+        """Build a sound from a memory-mapped cache file, or return None."""
+        try:
+            with open(cache_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as samples:
+                    # The mixer copies the samples, so the mapping can close right away
+                    return pygame.mixer.Sound(buffer=samples)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, pygame.error) as e:
+            # ValueError covers empty files, which cannot be mapped
+            self.logger.warning("Ignoring unreadable sound cache %s: %s", cache_path, e)
+            return None
+
+    def _store(self, cache_path, samples):
+        """Write decoded samples to the cache atomically."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(samples)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            self.logger.warning("Could not write sound cache %s: %s", cache_path, e)
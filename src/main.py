@@ -1,32 +1,37 @@
-import pygame
-from src.core.engine import Engine
-from src.scenes.credits_scene import CreditsScene
-from src.scenes.menu_scene import MainMenuScene
-from src.scenes.pong_scene import PongScene
-from src.scenes.pause_scene import PauseMenuScene
-from src.scenes.options_scene import OptionsMenuScene
-from src.scenes.game_over_scene import GameOverScene
+import sys
+
+from src.utils.startup import startup
+
+if "--trace-startup" in sys.argv:
+    startup.enable()
+
+with startup.phase("imports"):
+    import pygame
+    from src.core.engine import Engine
+
+
+def register_scenes(engine):
+    """Register every game scene; each one is imported and built on first use."""
+    scenes = engine.scene_manager
+    scenes.register_scene("main_menu", "src.scenes.menu_scene:MainMenuScene")
+    scenes.register_scene("credits", "src.scenes.credits_scene:CreditsScene")
+    scenes.register_scene("game", "src.scenes.pong_scene:PongScene")
+    scenes.register_scene("pause", "src.scenes.pause_scene:PauseMenuScene")
+    scenes.register_scene(
+        "options", "src.scenes.options_scene:OptionsMenuScene", return_scene="main_menu"
+    )
+    scenes.register_scene(
+        "options_from_pause", "src.scenes.options_scene:OptionsMenuScene", return_scene="pause"
+    )
+    scenes.register_scene("game_over", "src.scenes.game_over_scene:GameOverScene")
 
 
 def main():
-    pygame.font.init()
-    engine = Engine(width=800, height=600, title="PyGame Pong Template")
-
-    main_menu = MainMenuScene(engine)
-    game_scene = PongScene(engine)
-    pause_menu = PauseMenuScene(engine)
-    options_menu = OptionsMenuScene(engine, return_scene="main_menu")
-    options_from_pause = OptionsMenuScene(engine, return_scene="pause")
-    credits_scene = CreditsScene(engine)
-    game_over = GameOverScene(engine)
-
-    engine.scene_manager.add_scene("main_menu", main_menu)
-    engine.scene_manager.add_scene("credits", credits_scene)
-    engine.scene_manager.add_scene("game", game_scene)
-    engine.scene_manager.add_scene("pause", pause_menu)
-    engine.scene_manager.add_scene("options", options_menu)
-    engine.scene_manager.add_scene("options_from_pause", options_from_pause)
-    engine.scene_manager.add_scene("game_over", game_over)
+    with startup.phase("font init"):
+        pygame.font.init()
+    with startup.phase("engine construction"):
+        engine = Engine(width=800, height=600, title="PyGame Pong Template")
+    register_scenes(engine)
 
     engine.scene_manager.switch_to("main_menu")
 
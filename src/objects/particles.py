@@ -0,0 +1,235 @@
+import math
+import random
+from itertools import repeat
+
+import pygame
+from ..utils.logger import GameLogger
+from ..utils.surfaces import create_surface
+
+try:
+    import numpy
+except ImportError:  # Emitters stay empty without NumPy
+    numpy = None
+
+FADE_LEVELS = 8  # Pre-rendered brightness steps a particle fades through
+
+_missing_numpy_logged = False  # Warn about a missing NumPy once, not per emitter
+
+
+class ParticleEmitter:
+    """Particles kept in NumPy arrays, updated and drawn in batches instead of as entities."""
+
+    def __init__(self, capacity, palette, radius=2, gravity=(0, 0), drag=0.0, additive=True):
+        """
+        Create an emitter with room for a fixed number of live particles.
+
+        Args:
+            capacity: Most particles alive at once; further emissions are dropped
+            palette: RGB colors particles pick from at random
+            radius: Sprite radius in pixels; 0 draws single pixels straight into
+                the frame, which scales to tens of thousands of particles
+            gravity: Acceleration in pixels per second squared
+            drag: Fraction of velocity lost per second
+            additive: Add sprites onto the frame so overlaps brighten, instead of covering it
+        """
+        self.capacity = capacity
+        self.palette = [tuple(color) for color in palette]
+        self.radius = radius
+        self.drag = drag
+        self.additive = additive
+        self.count = 0  # Live particles, packed at the front of the arrays
+        self.dropped = 0  # Particles not emitted because the emitter was full
+        self._carry = 0.0  # Fractional particles owed by stream()
+        self._sprites = None  # One sprite per palette color and fade level
+        self._mapped = None  # (pixel format, mapped colors) for direct pixel writes
+
+        if numpy is None:
+            global _missing_numpy_logged
+            if not _missing_numpy_logged:
+                GameLogger.get_logger("ParticleEmitter").warning(
+                    "NumPy is not installed; particle emitters will stay empty"
+                )
+                _missing_numpy_logged = True
+            return
+        # Seeded from the random module, so seeded runs and frame captures repeat exactly
+        self.rng = numpy.random.default_rng(random.getrandbits(32))
+        self.gravity = numpy.array(gravity, numpy.float32)
+        self.position = numpy.zeros((capacity, 2), numpy.float32)
+        self.velocity = numpy.zeros((capacity, 2), numpy.float32)
+        self.age = numpy.zeros(capacity, numpy.float32)
+        self.life = numpy.ones(capacity, numpy.float32)
+        self.color = numpy.zeros(capacity, numpy.uint8)  # Index into the palette
+        self._step = numpy.zeros((capacity, 2), numpy.float32)
+
+    def emit(
+        self,
+        count,
+        position,
+        speed=(50.0, 150.0),
+        angle=(0.0, 2 * math.pi),
+        life=(0.5, 1.0),
+        spread=0.0,
+        velocity=(0.0, 0.0),
+    ):
+        """
+        Spawn a burst of particles.
+
+        Args:
+            count: Number of particles
+            position: Center of the burst
+            speed: (min, max) speed in pixels per second
+            angle: (min, max) direction in radians; 0 points right, pi/2 down
+            life: (min, max) lifetime in seconds
+            spread: Radius of the square particles start within
+            velocity: Velocity added to every particle, e.g. the emitting object's
+
+        Returns:
+            Number of particles actually emitted
+        """
+        if numpy is None:
+            return 0
+        room = self.capacity - self.count
+        if count > room:
+            self.dropped += count - room
+            count = room
+        if count <= 0:
+            return 0
+        start, stop = self.count, self.count + count
+        rng = self.rng
+
+        directions = rng.uniform(angle[0], angle[1], count)
+        speeds = rng.uniform(speed[0], speed[1], count)
+        self.position[start:stop] = position
+        if spread:
+            self.position[start:stop] += rng.uniform(-spread, spread, (count, 2))
+        self.velocity[start:stop, 0] = numpy.cos(directions) * speeds + velocity[0]
+        self.velocity[start:stop, 1] = numpy.sin(directions) * speeds + velocity[1]
+        self.age[start:stop] = 0.0
+        self.life[start:stop] = rng.uniform(life[0], life[1], count)
+        self.color[start:stop] = rng.integers(0, len(self.palette), count)
+        self.count = stop
+        return count
+
+    def stream(self, rate, dt, position, **kwargs):
+        """
+        Emit continuously at a steady rate, e.g. for a trail.
+
+        Args:
+            rate: Particles per second
+            dt: Seconds since the last call
+            position: Where to emit
+            **kwargs: Passed on to emit()
+        """
+        self._carry += rate * dt
+        count = int(self._carry)
+        self._carry -= count
+        if count:
+            self.emit(count, position, **kwargs)
+
+    def update(self, dt):
+        """Age, accelerate and move every particle, then drop the expired ones."""
+        count = self.count
+        if not count:
+            return
+        age = self.age[:count]
+        age += dt
+
+        # Keep survivors packed at the front so every array operation stays a slice
+        alive = age < self.life[:count]
+        if not alive.all():
+            keep = numpy.flatnonzero(alive)
+            count = len(keep)
+            for array in (self.position, self.velocity, self.age, self.life, self.color):
+                array[:count] = array[keep]
+            self.count = count
+
+        velocity = self.velocity[:count]
+        if self.drag:
+            velocity *= max(0.0, 1.0 - self.drag * dt)
+        if self.gravity.any():
+            velocity += self.gravity * dt
+        step = numpy.multiply(velocity, dt, out=self._step[:count])
+        self.position[:count] += step
+
+    def get_sprite_indices(self):
+        """Get each live particle's palette color and fade level as one index."""
+        count = self.count
+        remaining = 1.0 - self.age[:count] / self.life[:count]
+        level = numpy.minimum((remaining * FADE_LEVELS).astype(numpy.intp), FADE_LEVELS - 1)
+        return self.color[:count].astype(numpy.intp) * FADE_LEVELS + level
+
+    def render(self, surface):
+        """Draw every live particle in one batch."""
+        if not self.count:
+            return
+        if self.radius or surface.get_bitsize() == 24:
+            self.render_sprites(surface)
+        else:
+            self.render_pixels(surface)
+
+    def render_sprites(self, surface):
+        """Blit a pre-rendered sprite per particle with a single Surface.blits call."""
+        if self._sprites is None:
+            self._sprites = self.build_sprites()
+        sprites = self._sprites
+        radius = self.radius
+        corners = (self.position[: self.count] - radius).astype(numpy.int32).tolist()
+        sources = [sprites[index] for index in self.get_sprite_indices().tolist()]
+        if self.additive:
+            surface.blits(
+                zip(sources, corners, repeat(None), repeat(pygame.BLEND_RGB_ADD)), doreturn=0
+            )
+        else:
+            surface.blits(zip(sources, corners), doreturn=0)
+
+    def render_pixels(self, surface):
+        """Write one pixel per particle straight into the frame through a surfarray view."""
+        width, height = surface.get_size()
+        positions = self.position[: self.count].astype(numpy.intp)
+        x, y = positions[:, 0], positions[:, 1]
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+
+        pixels = pygame.surfarray.pixels2d(surface)
+        pixels[x[inside], y[inside]] = self.get_mapped_colors(surface)[
+            self.get_sprite_indices()[inside]
+        ]
+        del pixels
+
+    def get_mapped_colors(self, surface):
+        """Get every palette color at every fade level as pixel values for the surface's format."""
+        key = (surface.get_bitsize(), surface.get_masks())
+        if self._mapped is None or self._mapped[0] != key:
+            values = [surface.map_rgb(color) for color in self.get_fade_colors()]
+            self._mapped = (key, numpy.array(values, numpy.uint32))
+        return self._mapped[1]
+
+    def get_fade_colors(self):
+        """List each palette color at each fade level, dimmest first."""
+        return [
+            tuple(round(channel * (level + 1) / FADE_LEVELS) for channel in color)
+            for color in self.palette
+            for level in range(FADE_LEVELS)
+        ]
+
+    def build_sprites(self):
+        """Render a soft dot for each palette color and fade level."""
+        radius = self.radius
+        size = radius * 2 + 1
+        sprites = []
+        for color in self.get_fade_colors():
+            sprite = create_surface((size, size), (0, 0, 0))
+            # Concentric circles, brightening toward the center
+            for ring in range(radius, 0, -1):
+                weight = 1.0 - (ring - 1) / radius * 0.75
+                pygame.draw.circle(
+                    sprite, [round(channel * weight) for channel in color], (radius, radius), ring
+                )
+            if not self.additive:
+                sprite.set_colorkey((0, 0, 0))
+            sprites.append(sprite)
+        return sprites
+
+    def clear(self):
+        """Remove every particle."""
+        self.count = 0
+        self._carry = 0.0
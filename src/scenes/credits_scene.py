@@ -1,47 +1,36 @@
 import pygame
-from .scene import Scene
-from src.ui import Button, Label, Menu
+from .scene import Scene, UI_EVENTS
+from src.ui.loader import load_ui
+from src.utils.surfaces import render_text
 
 
 class CreditsScene(Scene):
     """Scene that displays game credits."""
 
+    handled_events = UI_EVENTS
+
     def __init__(self, engine):
         super().__init__(engine)
         self.title_font = None
-        self.content_font = None
         self.title_text = None
-        self.credits_menu = None
+        self.ui = None
         self.background = None
 
     def enter(self):
         """Initialize credits screen."""
         self.title_font = pygame.font.SysFont(None, 64)
-        self.content_font = pygame.font.SysFont(None, 28)
 
         # Create title text
-        self.title_text = self.title_font.render("Credits", True, (255, 255, 255))
-
-        # Create menu for credits content and back button
-        self.credits_menu = Menu(
-            x=self.engine.width // 2, y=160, width=500, height=400, centered=True
+        self.title_text = render_text(self.title_font, "Credits", (255, 255, 255))
+
+        # Build the credits from assets/ui/credits.yaml
+        self.ui = load_ui(
+            "credits",
+            self,
+            self.engine.width,
+            self.engine.height,
+            hot_reload=self.engine.settings.hot_reload,
         )
-        self.credits_menu.set_font(self.content_font)
-
-        self.credits_menu.add_label("Programming")
-        self.credits_menu.add_label("Your Team Members")
-        self.credits_menu.add_spacer(10)
-
-        self.credits_menu.add_label("Art & Sound")
-        self.credits_menu.add_label("Your Artists")
-        self.credits_menu.add_spacer(10)
-
-        self.credits_menu.add_label("Special Thanks")
-        self.credits_menu.add_label("PyGame Community")
-        self.credits_menu.add_spacer(10)
-
-        # Add back button
-        self.credits_menu.add_button("Back to Main Menu", self.on_back_clicked)
 
         print("Credits scene setup complete")
 
@@ -51,7 +40,7 @@ class CreditsScene(Scene):
 
     def handle_event(self, event):
         """Process events."""
-        self.credits_menu.handle_event(event)
+        self.ui.handle_event(event)
 
         # Allow ESC to return to main menu
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -59,7 +48,15 @@ class CreditsScene(Scene):
 
     def update(self, dt):
         """Update credits animations."""
-        self.credits_menu.update(dt)
+        self.ui.update(dt)
+
+    def on_resize(self, width, height):
+        """Keep the credits centered in the window."""
+        self.ui.resize(width, height)
+
+    def is_idle(self):
+        """Idle unless a widget is animating; the engine then waits for input."""
+        return not self.ui.is_animating()
 
     def render(self, surface):
         """Draw the credits screen."""
@@ -71,7 +68,7 @@ class CreditsScene(Scene):
         surface.blit(self.title_text, (title_x, 50))
 
         # Draw credits content
-        self.credits_menu.render(surface)
+        self.ui.render(surface)
 
     def draw_gradient_background(self, surface):
         """Draw a nice gradient background."""
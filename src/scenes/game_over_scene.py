@@ -2,25 +2,28 @@ import random
 
 import pygame
 
-from src.scenes.scene import Scene
-from src.ui.menu import Menu
+from src.scenes.scene import Scene, UI_EVENTS
+from src.ui.loader import load_ui
+from src.utils.surfaces import render_text
 
 
 class GameOverScene(Scene):
     """Scene displayed when the game ends."""
 
+    handled_events = UI_EVENTS
+
+    held_resources = {
+        ("images", "game_over_background"): "background",
+    }
+
     def __init__(self, engine):
         super().__init__(engine)
         self.title_font = None
-        self.menu_font = None
         self.score_font = None
         self.title_text = None
         self.score_text = None
-        self.menu = None
+        self.ui = None
         self.background = None
-        self.sfx_game_over = None
-        self.sfx_hover = None
-        self.sfx_select = None
 
         # Game results data
         self.final_score = 0
@@ -35,69 +38,50 @@ class GameOverScene(Scene):
         # Load resources
         res_mgr = self.engine.resource_manager
         self.title_font = pygame.font.SysFont(None, 64)
-        self.menu_font = pygame.font.SysFont(None, 32)
         self.score_font = pygame.font.SysFont(None, 48)
         self.background = res_mgr.get_image("game_over_background")
-        self.sfx_game_over = res_mgr.get_sound("game_over")
-        self.sfx_hover = res_mgr.get_sound("menu_hover")
-        self.sfx_select = res_mgr.get_sound("menu_select")
 
         # Create title text
         if self.win_state:
-            self.title_text = self.title_font.render("Victory!", True, (255, 215, 0))
+            self.title_text = render_text(self.title_font, "Victory!", (255, 215, 0))
         else:
-            self.title_text = self.title_font.render("Game Over", True, (255, 0, 0))
+            self.title_text = render_text(self.title_font, "Game Over", (255, 0, 0))
 
         # Create score text
-        self.score_text = self.score_font.render(
-            f"Score: {self.final_score}", True, (255, 255, 255)
+        self.score_text = render_text(
+            self.score_font, f"Score: {self.final_score}", (255, 255, 255)
         )
 
-        # Create menu
-        self.menu = Menu(
-            x=self.engine.width // 2,
-            y=self.engine.height // 2 + 50,
-            width=300,
-            height=200,
-            centered=True,
+        # Build the menu from assets/ui/game_over.yaml
+        self.ui = load_ui(
+            "game_over",
+            self,
+            self.engine.width,
+            self.engine.height,
+            hot_reload=self.engine.settings.hot_reload,
         )
 
-        # Add menu buttons
-        self.menu.add_button("Play Again", self.on_play_again_clicked)
-        self.menu.add_button("Main Menu", self.on_main_menu_clicked)
-
-        # Set up event handlers
-        self.menu.on_hover = self.on_button_hover
-
         # Play game over sound
-        if self.sfx_game_over and self.engine.settings.sfx_enabled:
-            self.sfx_game_over.play()
+        self.engine.audio.play("game_over")
 
         # Start appropriate music if available
-        if self.win_state:
-            win_music = res_mgr.get_sound("victory_music")
-            if win_music and self.engine.settings.music_enabled:
-                pygame.mixer.music.load(win_music)
-                pygame.mixer.music.set_volume(self.engine.settings.music_volume)
-                pygame.mixer.music.play(-1)
-        else:
-            lose_music = res_mgr.get_sound("defeat_music")
-            if lose_music and self.engine.settings.music_enabled:
-                pygame.mixer.music.load(lose_music)
-                pygame.mixer.music.set_volume(self.engine.settings.music_volume)
-                pygame.mixer.music.play(-1)
+        self.engine.music.play("victory_music" if self.win_state else "defeat_music")
 
     def exit(self):
         """Clean up resources before leaving."""
-        pygame.mixer.music.fadeout(500)
+        self.engine.music.fadeout(500)
 
     def handle_event(self, event):
         """Process events."""
-        self.menu.handle_event(event)
+        self.ui.handle_event(event)
 
     def update(self, dt):
         """Update animations and effects."""
-        self.menu.update(dt)
+        self.ui.update(dt)
+
+    def on_resize(self, width, height):
+        """Keep the menu centered in the window."""
+        self.ui.resize(width, height)
 
     def render(self, surface):
         """Draw the game over screen."""
@@ -120,7 +104,7 @@ class GameOverScene(Scene):
         surface.blit(self.score_text, (score_x, 180))
 
         # Draw menu
-        self.menu.render(surface)
+        self.ui.render(surface)
 
     def draw_background_effects(self, surface):
         """Draw different effects based on win/lose state."""
@@ -143,17 +127,14 @@ class GameOverScene(Scene):
     # Button event handlers
     def on_button_hover(self, button):
         """Handle button hover events."""
-        if self.sfx_hover and self.engine.settings.sfx_enabled:
-            self.sfx_hover.play()
+        self.engine.audio.play("menu_hover", "ui")
 
     def on_play_again_clicked(self):
         """Restart the game."""
-        if self.sfx_select and self.engine.settings.sfx_enabled:
-            self.sfx_select.play()
+        self.engine.audio.play("menu_select", "ui")
         self.engine.scene_manager.switch_to("game")
 
     def on_main_menu_clicked(self):
         """Return to main menu."""
-        if self.sfx_select and self.engine.settings.sfx_enabled:
-            self.sfx_select.play()
+        self.engine.audio.play("menu_select", "ui")
         self.engine.scene_manager.switch_to("main_menu")
@@ -1,77 +1,73 @@
 import pygame
 
-from src.scenes.scene import Scene
-from src.ui.menu import Menu
+from src.scenes.scene import Scene, UI_EVENTS
+from src.ui.loader import load_ui
+from src.utils.surfaces import render_text
 
 
 class MainMenuScene(Scene):
     """Main menu scene that serves as the entry point to the game."""
 
+    handled_events = UI_EVENTS
+
+    held_resources = {
+        ("images", "menu_background"): "background",
+    }
+
     def __init__(self, engine):
         super().__init__(engine)
         self.title_font = None
-        self.menu_font = None
         self.title_text = None
-        self.menu = None
+        self.ui = None
         self.background = None
-        self.sfx_hover = None
-        self.sfx_select = None
 
     def enter(self):
         """Initialize resources when scene becomes active."""
         # Load resources
         res_mgr = self.engine.resource_manager
         self.title_font = pygame.font.SysFont("Arial", 64)
-        self.menu_font = pygame.font.SysFont("Arial", 32)
         self.background = res_mgr.get_image("menu_background")
-        self.sfx_hover = res_mgr.get_sound("menu_hover")
-        self.sfx_select = res_mgr.get_sound("menu_select")
 
         # Create title text
-        self.title_text = self.title_font.render("Pygame Template", True, (255, 255, 255))
-
-        # Create menu
-        self.menu = Menu(
-            x=self.engine.width // 2,
-            y=self.engine.height // 2,
-            width=300,
-            height=400,
-            centered=True,
+        self.title_text = render_text(self.title_font, "Pygame Template", (255, 255, 255))
+
+        # Build the menu from assets/ui/main_menu.yaml
+        self.ui = load_ui(
+            "main_menu",
+            self,
+            self.engine.width,
+            self.engine.height,
+            hot_reload=self.engine.settings.hot_reload,
         )
 
-        # Add menu buttons
-        self.menu.add_button("Play", self.on_play_clicked)
-        self.menu.add_button("Options", self.on_options_clicked)
-        self.menu.add_button("Credits", self.on_credits_clicked)
-        self.menu.add_button("Quit", self.on_quit_clicked)
-
-        # Set up event handlers
-        self.menu.on_hover = self.on_button_hover
-
-        # Start background music if available
-        menu_music = res_mgr.get_sound("menu_music")
-        if menu_music and self.engine.settings.music_enabled:
-            pygame.mixer.music.load(menu_music)
-            pygame.mixer.music.set_volume(self.engine.settings.music_volume)
-            pygame.mixer.music.play(-1)  # Loop indefinitely
+        # Stream background music if registered, looping indefinitely
+        self.engine.music.play("menu_music")
 
     def exit(self):
         """Clean up resources when leaving this scene."""
         # Stop music when leaving menu
-        pygame.mixer.music.fadeout(500)  # Fade out over 500ms
+        self.engine.music.fadeout(500)  # Fade out over 500ms
 
     def handle_event(self, event):
         """Process incoming events."""
-        self.menu.handle_event(event)
+        self.ui.handle_event(event)
 
         # Add any additional input handling here
 
     def update(self, dt):
         """Update menu animations and effects."""
-        self.menu.update(dt)
+        self.ui.update(dt)
 
         # Add any animations or effects here
 
+    def on_resize(self, width, height):
+        """Keep the menu centered in the window."""
+        self.ui.resize(width, height)
+
+    def is_idle(self):
+        """Idle unless a widget is animating; the engine then waits for input."""
+        return not self.ui.is_animating()
+
     def render(self, surface):
         """Draw the menu to the screen."""
         if self.background:
@@ -85,7 +81,7 @@ class MainMenuScene(Scene):
         surface.blit(self.title_text, (title_x, 100))
 
         # Draw menu
-        self.menu.render(surface)
+        self.ui.render(surface)
 
     def draw_gradient_background(self, surface):
         """Draw a nice gradient background."""
@@ -97,31 +93,26 @@ class MainMenuScene(Scene):
 
     def on_button_hover(self, button):
         """Handle button hover events."""
-        if self.sfx_hover and self.engine.settings.sfx_enabled:
-            self.sfx_hover.play()
+        self.engine.audio.play("menu_hover", "ui")
 
     def on_play_clicked(self):
         """Start the game."""
-        if self.sfx_select and self.engine.settings.sfx_enabled:
-            self.sfx_select.play()
+        self.engine.audio.play("menu_select", "ui")
         self.engine.scene_manager.switch_to("game")
 
     def on_options_clicked(self):
         """Open options menu."""
-        if self.sfx_select and self.engine.settings.sfx_enabled:
-            self.sfx_select.play()
+        self.engine.audio.play("menu_select", "ui")
         self.engine.scene_manager.switch_to("options")
 
     def on_credits_clicked(self):
         """Show credits screen."""
-        if self.sfx_select and self.engine.settings.sfx_enabled:
-            self.sfx_select.play()
+        self.engine.audio.play("menu_select", "ui")
         self.engine.scene_manager.switch_to("credits")
 
     def on_quit_clicked(self):
         """Exit the game."""
-        if self.sfx_select and self.engine.settings.sfx_enabled:
-            self.sfx_select.play()
+        self.engine.audio.play("menu_select", "ui")
         # Add a small delay so the sound plays before quitting
         pygame.time.delay(200)
         self.engine.running = False
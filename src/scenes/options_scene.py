@@ -1,19 +1,21 @@
 # src/scenes/options_scene.py
 import pygame
-from .scene import Scene
-from src.ui import Button, Label, Menu, ToggleButton
+from .scene import Scene, UI_EVENTS
+from src.ui.loader import load_ui
+from src.utils.surfaces import render_text
 
 
 class OptionsMenuScene(Scene):
     """Simplified menu for adjusting game settings."""
 
+    handled_events = UI_EVENTS
+
     def __init__(self, engine, return_scene="main_menu"):
         super().__init__(engine)
         self.return_scene = return_scene  # Where to return after options
         self.title_font = None
-        self.menu_font = None
         self.title_text = None
-        self.options_menu = None
+        self.ui = None
 
         # UI controls for settings
         self.fullscreen_toggle = None
@@ -24,77 +26,41 @@ class OptionsMenuScene(Scene):
         """Initialize options menu."""
         print("==== ENTERING OPTIONS SCENE ====")
 
-        # Create fonts
+        # Create font
         self.title_font = pygame.font.SysFont(None, 48)
-        self.menu_font = pygame.font.SysFont(None, 32)
 
         # Create title text
-        self.title_text = self.title_font.render("Options", True, (255, 255, 255))
-
-        # Create options menu
-        self.options_menu = Menu(
-            x=self.engine.width // 2, y=150, width=400, height=350, centered=True
-        )
-        self.options_menu.set_font(self.menu_font)
-
-        # Add section header
-        header = Label(0, 0, 350, 40, "Game Settings", centered=True)
-        header.set_font(self.menu_font)
-        header.set_background_color((40, 40, 80))
-        self.options_menu.add_element(header)
-
-        # Add spacer
-        self.options_menu.add_spacer(20)
-
-        # Fullscreen toggle
-        self.fullscreen_toggle = ToggleButton(
-            x=0,
-            y=0,  # Will be positioned by menu
-            width=350,
-            height=40,
-            label="Fullscreen",
-            is_on=self.engine.settings.fullscreen,
+        self.title_text = render_text(self.title_font, "Options", (255, 255, 255))
+
+        # Build the menu from assets/ui/options.yaml
+        self.ui = load_ui(
+            "options",
+            self,
+            self.engine.width,
+            self.engine.height,
+            on_build=self.on_ui_built,
+            hot_reload=self.engine.settings.hot_reload,
         )
-        self.options_menu.add_element(self.fullscreen_toggle)
-
-        # Music toggle
-        self.music_toggle = ToggleButton(
-            x=0,
-            y=0,  # Will be positioned by menu
-            width=350,
-            height=40,
-            label="Music",
-            is_on=self.engine.settings.music_enabled,
-        )
-        self.options_menu.add_element(self.music_toggle)
-
-        # Sound effects toggle
-        self.sfx_toggle = ToggleButton(
-            x=0,
-            y=0,  # Will be positioned by menu
-            width=350,
-            height=40,
-            label="Sound Effects",
-            is_on=self.engine.settings.sfx_enabled,
-        )
-        self.options_menu.add_element(self.sfx_toggle)
-
-        # Add spacer
-        self.options_menu.add_spacer(30)
-
-        # Add buttons at the bottom
-        self.options_menu.add_button("Apply", self.on_apply_clicked)
-        self.options_menu.add_button("Back", self.on_back_clicked)
 
         print("Options scene setup complete")
 
+    def on_ui_built(self, ui):
+        """Show the current settings on the freshly built toggles."""
+        settings = self.engine.settings
+        self.fullscreen_toggle = ui["fullscreen"]
+        self.music_toggle = ui["music"]
+        self.sfx_toggle = ui["sfx"]
+        self.fullscreen_toggle.is_on = settings.fullscreen
+        self.music_toggle.is_on = settings.music_enabled
+        self.sfx_toggle.is_on = settings.sfx_enabled
+
     def exit(self):
         """Clean up when leaving options menu."""
         print("==== EXITING OPTIONS SCENE ====")
 
     def handle_event(self, event):
         """Process events."""
-        self.options_menu.handle_event(event)
+        self.ui.handle_event(event)
 
         # Allow ESC to return without saving
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
@@ -102,7 +68,15 @@ class OptionsMenuScene(Scene):
 
     def update(self, dt):
         """Update menu animations."""
-        self.options_menu.update(dt)
+        self.ui.update(dt)
+
+    def on_resize(self, width, height):
+        """Keep the options centered in the window."""
+        self.ui.resize(width, height)
+
+    def is_idle(self):
+        """Idle unless a widget is animating; the engine then waits for input."""
+        return not self.ui.is_animating()
 
     def render(self, surface):
         """Draw the options menu."""
@@ -114,7 +88,7 @@ class OptionsMenuScene(Scene):
         surface.blit(self.title_text, (title_x, 70))
 
         # Draw options menu
-        self.options_menu.render(surface)
+        self.ui.render(surface)
 
     def on_apply_clicked(self):
         """Apply and save settings."""
@@ -135,19 +109,20 @@ class OptionsMenuScene(Scene):
         if fullscreen_changed:
             if settings.fullscreen:
                 print("Switching to fullscreen mode")
-                pygame.display.set_mode((self.engine.width, self.engine.height), pygame.FULLSCREEN)
             else:
                 print("Switching to windowed mode")
-                pygame.display.set_mode((self.engine.width, self.engine.height))
+            # The engine keeps the logical resolution and rescales it to the new window
+            self.engine.set_fullscreen(settings.fullscreen)
 
         # Apply audio settings
+        self.engine.music.apply_volume()
         if not settings.music_enabled:
-            pygame.mixer.music.pause()
+            self.engine.music.pause()
         else:
-            pygame.mixer.music.unpause()
+            self.engine.music.unpause()
 
         # Save settings
-        settings.save()
+        settings.save(self.engine.settings_file)
 
         # Return to previous scene
         self.engine.scene_manager.switch_to(self.return_scene)
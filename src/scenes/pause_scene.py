@@ -1,19 +1,22 @@
 # src/scenes/pause_scene.py
 import pygame
-from .scene import Scene
-from src.ui import Button, Menu
+from .scene import Scene, UI_EVENTS
+from src.ui.loader import load_ui
+from src.utils.surfaces import create_surface, render_text
 
 
 class PauseMenuScene(Scene):
     """Overlay scene that pauses the game."""
 
+    handled_events = UI_EVENTS
+
     def __init__(self, engine):
         super().__init__(engine)
         self.previous_scene_name = None  # Store scene name instead of scene object
         self.overlay_surface = None
         self.menu_font = None
         self.pause_text = None
-        self.menu = None
+        self.ui = None
 
     def enter(self):
         """Set up the pause menu overlay."""
@@ -21,31 +24,25 @@ class PauseMenuScene(Scene):
         self.previous_scene_name = "game"  # Assume we're always pausing the game
 
         # Create semi-transparent overlay
-        self.overlay_surface = pygame.Surface(
-            (self.engine.width, self.engine.height), pygame.SRCALPHA
+        # Semi-transparent black, as an opaque surface with uniform alpha
+        self.overlay_surface = create_surface(
+            (self.engine.width, self.engine.height), (0, 0, 0, 128)
         )
-        self.overlay_surface.fill((0, 0, 0, 128))  # Semi-transparent black
 
         # Create font
         self.menu_font = pygame.font.SysFont(None, 36)
 
         # Create pause text
-        self.pause_text = self.menu_font.render("PAUSED", True, (255, 255, 255))
-
-        # Create menu
-        self.menu = Menu(
-            x=self.engine.width // 2,
-            y=self.engine.height // 2,
-            width=250,
-            height=300,
-            centered=True,
+        self.pause_text = render_text(self.menu_font, "PAUSED", (255, 255, 255))
+
+        # Build the menu from assets/ui/pause.yaml
+        self.ui = load_ui(
+            "pause",
+            self,
+            self.engine.width,
+            self.engine.height,
+            hot_reload=self.engine.settings.hot_reload,
         )
-        self.menu.set_font(self.menu_font)
-
-        # Add menu buttons
-        self.menu.add_button("Resume", self.on_resume_clicked)
-        self.menu.add_button("Options", self.on_options_clicked)
-        self.menu.add_button("Main Menu", self.on_main_menu_clicked)
 
     def exit(self):
         """Clean up resources when leaving pause menu."""
@@ -53,20 +50,29 @@ class PauseMenuScene(Scene):
 
     def handle_event(self, event):
         """Process events while paused."""
-        self.menu.handle_event(event)
-
-        # Allow ESC to unpause
-        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            self.on_resume_clicked()
+        self.ui.handle_event(event)
 
     def update(self, dt):
         """Update menu animations."""
-        self.menu.update(dt)
+        self.ui.update(dt)
+
+        # The pause action unpauses too
+        if self.engine.input.is_pressed("pause"):
+            self.on_resume_clicked()
+
+    def on_resize(self, width, height):
+        """Cover the whole window and keep the menu centered."""
+        self.overlay_surface = create_surface((width, height), (0, 0, 0, 128))
+        self.ui.resize(width, height)
+
+    def is_idle(self):
+        """Idle unless a widget is animating; the engine then waits for input."""
+        return not self.ui.is_animating()
 
     def render(self, surface):
         """Draw the pause menu overlay."""
         # First render the game underneath
-        game_scene = self.engine.scene_manager.scenes.get("game")
+        game_scene = self.engine.scene_manager.get_scene("game")
         if game_scene and game_scene != self:  # Prevent recursion
             # Take a snapshot of the game scene once
             game_scene.render(surface)
@@ -79,7 +85,7 @@ class PauseMenuScene(Scene):
         surface.blit(self.pause_text, (text_x, 100))
 
         # Draw menu
-        self.menu.render(surface)
+        self.ui.render(surface)
 
     # Button event handlers
     def on_resume_clicked(self):
@@ -1,14 +1,25 @@
 # src/scenes/pong_scene.py
+import math
+import random
+
 import pygame
 from .scene import Scene
+from src.utils.telemetry import telemetry
 from src.objects.paddle import Paddle
 from src.objects.ball import Ball
+from src.objects.particles import ParticleEmitter
 from src.ui import Label
 
+PADDLE_HIT_PITCH = (0.9, 1.1)  # Range paddle hits are randomly pitched within
+
 
 class PongScene(Scene):
     """Simple Pong game implementation."""
 
+    # Controls are polled through the input manager; no mouse events needed
+    handled_events = frozenset()
+    gameplay = True
+
     def __init__(self, engine):
         super().__init__(engine)
         self.ball = None
@@ -20,6 +31,12 @@ class PongScene(Scene):
         self.paused = False
         self.game_over = False
         self.max_score = 5  # First to reach this score wins
+        self.match_time = 0.0  # Seconds of play in the current match
+
+        # Particle effects
+        self.trail = None
+        self.sparks = None
+        self.fireworks = None
 
     def enter(self):
         """Initialize pong game."""
@@ -52,7 +69,6 @@ class PongScene(Scene):
         self.ball = Ball(x=width // 2, y=height // 2, size=15, speed=300)
 
         # Set up score display
-        res_mgr = self.engine.resource_manager
         self.score_font = pygame.font.SysFont(None, 64)
 
         self.player_score_label = Label(
@@ -65,51 +81,55 @@ class PongScene(Scene):
         )
         self.ai_score_label.set_font(self.score_font)
 
+        # Particle effects: ball trail, paddle-hit sparks and score fireworks
+        self.trail = ParticleEmitter(512, [(120, 180, 255), (200, 230, 255)], radius=3, drag=2.0)
+        self.sparks = ParticleEmitter(
+            2048, [(255, 220, 120), (255, 160, 60), (255, 255, 255)], radius=1, drag=3.0
+        )
+        self.fireworks = ParticleEmitter(
+            8192,
+            [(255, 80, 80), (80, 255, 120), (90, 160, 255), (255, 230, 90), (255, 255, 255)],
+            radius=0,
+            gravity=(0, 160),
+            drag=0.8,
+        )
+
+        # Resample the paddle hit variants now rather than on the first hits
+        self.engine.audio.prepare_pitches("paddle_hit", *PADDLE_HIT_PITCH)
+
         # Reset game state
         self.paused = False
         self.game_over = False
+        self.match_time = 0.0
 
-        # Play game music if available
-        game_music = res_mgr.get_sound("game_music")
-        if game_music and self.engine.settings.music_enabled:
-            pygame.mixer.music.load(game_music)
-            pygame.mixer.music.set_volume(self.engine.settings.music_volume)
-            pygame.mixer.music.play(-1)  # Loop indefinitely
+        # Stream game music if registered, looping indefinitely
+        self.engine.music.play("game_music")
 
     def exit(self):
         """Clean up resources when leaving the game."""
         # Stop music when leaving
-        pygame.mixer.music.fadeout(500)
-
-    def handle_event(self, event):
-        """Process game events."""
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                # Pause the game
-                self.engine.scene_manager.switch_to("pause")
-
-            # Player paddle controls
-            if event.key == pygame.K_UP or event.key == pygame.K_w:
-                self.player_paddle.move_up = True
-            if event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                self.player_paddle.move_down = True
-
-        elif event.type == pygame.KEYUP:
-            # Player paddle controls
-            if event.key == pygame.K_UP or event.key == pygame.K_w:
-                self.player_paddle.move_up = False
-            if event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                self.player_paddle.move_down = False
+        self.engine.music.fadeout(500)
 
     def update(self, dt):
         """Update game state."""
         if self.paused or self.game_over:
             return
 
+        # Player controls come from the key and gamepad bindings
+        actions = self.engine.input
+        if actions.is_pressed("pause"):
+            self.engine.scene_manager.switch_to("pause")
+            return
+        self.player_paddle.move_up = actions.is_held("move_up")
+        self.player_paddle.move_down = actions.is_held("move_down")
+
+        self.match_time += dt
+
         # Update entities
         self.player_paddle.update(dt)
         self.ai_paddle.update(dt, self.ball)
         self.ball.update(dt)
+        self.update_particles(dt)
 
         # Check for collisions
         self.check_collisions()
@@ -122,8 +142,15 @@ class PongScene(Scene):
             self.game_over = True
             # Determine winner and go to game over screen
             player_won = self.player_paddle.score >= self.max_score
+            telemetry.record(
+                "match",
+                player=self.player_paddle.score,
+                ai=self.ai_paddle.score,
+                won=player_won,
+                duration=round(self.match_time, 2),
+            )
             # Pass score and win state to game over scene
-            game_over_scene = self.engine.scene_manager.scenes.get("game_over")
+            game_over_scene = self.engine.scene_manager.get_scene("game_over")
             if game_over_scene:
                 final_score = max(self.player_paddle.score, self.ai_paddle.score)
                 self.engine.scene_manager.switch_to("game_over")
@@ -149,10 +176,16 @@ class PongScene(Scene):
         ):
             self.ball.bounce_horizontal()
 
-            # Play sound effect
-            bounce_sfx = self.engine.resource_manager.get_sound("paddle_hit")
-            if bounce_sfx and self.engine.settings.sfx_enabled:
-                bounce_sfx.play()
+            # Play sound effect and throw sparks back toward the play field
+            self.engine.audio.play("paddle_hit", pitch=random.uniform(*PADDLE_HIT_PITCH))
+            direction = 0.0 if self.ball.dx > 0 else math.pi
+            self.sparks.emit(
+                40,
+                self.ball.rect.center,
+                speed=(120, 420),
+                angle=(direction - 1.0, direction + 1.0),
+                life=(0.2, 0.5),
+            )
 
             # Add a little y velocity based on where the ball hit the paddle
             if self.ball.rect.colliderect(self.player_paddle.rect):
@@ -196,10 +229,10 @@ class PongScene(Scene):
             self.ball.y = self.engine.height // 2
             self.ball.reset()
 
-            # Play sound effect
-            score_sfx = self.engine.resource_manager.get_sound("score")
-            if score_sfx and self.engine.settings.sfx_enabled:
-                score_sfx.play()
+            # Play sound effect and shake the screen (if the shake effect is on)
+            self.engine.audio.play("score")
+            self.engine.post_process.shake(10, 0.4)
+            self.launch_fireworks(right_side=True)
 
         # Ball goes past right edge (player scores)
         elif self.ball.x > width:
@@ -209,10 +242,35 @@ class PongScene(Scene):
             self.ball.y = self.engine.height // 2
             self.ball.reset()
 
-            # Play sound effect
-            score_sfx = self.engine.resource_manager.get_sound("score")
-            if score_sfx and self.engine.settings.sfx_enabled:
-                score_sfx.play()
+            # Play sound effect and shake the screen (if the shake effect is on)
+            self.engine.audio.play("score")
+            self.engine.post_process.shake(10, 0.4)
+            self.launch_fireworks(right_side=False)
+
+    def update_particles(self, dt):
+        """Feed the ball trail and move every particle."""
+        self.trail.stream(
+            120,
+            dt,
+            self.ball.rect.center,
+            speed=(0, 30),
+            life=(0.15, 0.35),
+            spread=3,
+            velocity=(self.ball.dx * 0.1, self.ball.dy * 0.1),
+        )
+        for emitter in (self.trail, self.sparks, self.fireworks):
+            emitter.update(dt)
+
+    def launch_fireworks(self, right_side):
+        """Burst fireworks over the scoring side's half of the field."""
+        width, height = self.engine.width, self.engine.height
+        left = width // 2 if right_side else 0
+        for _ in range(3):
+            position = (
+                random.uniform(left + width * 0.1, left + width * 0.4),
+                random.uniform(height * 0.2, height * 0.5),
+            )
+            self.fireworks.emit(600, position, speed=(120, 260), life=(0.8, 1.6))
 
     def render(self, surface):
         """Draw the game scene."""
@@ -242,7 +300,10 @@ class PongScene(Scene):
         self.player_score_label.render(surface)
         self.ai_score_label.render(surface)
 
-        # Draw game entities
+        # Draw game entities, the trail behind the ball and the bursts above everything
+        self.trail.render(surface)
         self.player_paddle.render(surface)
         self.ai_paddle.render(surface)
         self.ball.render(surface)
+        self.sparks.render(surface)
+        self.fireworks.render(surface)
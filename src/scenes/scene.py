@@ -1,6 +1,31 @@
+import pygame
+
+# Filterable event types the UI widgets respond to
+UI_EVENTS = frozenset(
+    {
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.TEXTINPUT,
+    }
+)
+
+
 class Scene:
     """Base class for all game scenes."""
 
+    # Mouse, touch and text event types this scene uses; the engine blocks the rest
+    # while it is active. None receives everything. Keyboard, window and gamepad
+    # events always arrive. See src/core/event_filter.py.
+    handled_events = None
+
+    # Gameplay scenes always run at fps_limit; others drop to idle_fps without input
+    gameplay = False
+
+    # Resources held in attributes, swapped on hot reload: (kind, key) -> attribute name
+    held_resources = {}
+
     def __init__(self, engine):
         self.engine = engine
 
@@ -20,6 +45,32 @@ class Scene:
         """Update scene state."""
         pass
 
+    def is_idle(self):
+        """
+        Check whether the scene looks the same until the next event.
+
+        While this returns True the engine blocks on input and skips
+        update, render and flip.
+        """
+        return False
+
     def render(self, surface):
         """Render scene to the given surface."""
         pass
+
+    def on_resize(self, width, height):
+        """Called after the window size changes while this scene is active."""
+        pass
+
+    def on_resource_reloaded(self, kind, key, resource):
+        """
+        Called when a resource this scene may hold was reloaded from disk.
+
+        Args:
+            kind: "images", "sounds" or "fonts"
+            key: Name the resource was loaded under ((name, size) for fonts)
+            resource: The newly loaded resource
+        """
+        attribute = self.held_resources.get((kind, key))
+        if attribute:
+            setattr(self, attribute, resource)
@@ -5,6 +5,22 @@ from .slider import Slider
 from .toggle_button import ToggleButton
 from .dropdown import Dropdown
 from .spacer import Spacer
+from .layout import Box, VBox, HBox, AnchorBox
 from .menu import Menu
+from .scroll_list import ScrollList
 
-__all__ = ["UIElement", "Button", "Label", "Slider", "ToggleButton", "Dropdown", "Spacer", "Menu"]
+__all__ = [
+    "UIElement",
+    "Button",
+    "Label",
+    "Slider",
+    "ToggleButton",
+    "Dropdown",
+    "Spacer",
+    "Box",
+    "VBox",
+    "HBox",
+    "AnchorBox",
+    "Menu",
+    "ScrollList",
+]
@@ -1,10 +1,14 @@
 import pygame
 from .element import UIElement
+from ..utils.surfaces import render_text
 
 
 class Button(UIElement):
     """Interactive button UI element."""
 
+    focusable = True
+    retained = True
+
     def __init__(self, x, y, width, height, text="", callback=None, centered=False):
         super().__init__(x, y, width, height)
         self.text = text
@@ -47,7 +51,7 @@ class Button(UIElement):
         """Update the rendered text surface."""
         if self.font:
             color = self.disabled_text_color if not self.enabled else self.text_color
-            self.text_surface = self.font.render(self.text, True, color)
+            self.text_surface = render_text(self.font, self.text, color)
 
     def handle_event(self, event):
         """Process mouse events for this button."""
@@ -72,11 +76,23 @@ class Button(UIElement):
         """Update button state."""
         pass
 
-    def render(self, surface):
+    def get_state_key(self):
+        """Appearance depends on state, text and colors."""
+        return (
+            self.enabled,
+            self.pressed,
+            self.hover,
+            self.text,
+            self.text_surface,
+            self.bg_color,
+            self.hover_color,
+            self.pressed_color,
+            self.border_color,
+            self.disabled_color,
+        )
+
+    def draw(self, surface, rect):
         """Draw the button."""
-        if not self.visible:
-            return
-
         # Choose color based on state
         if not self.enabled:
             bg_color = self.disabled_color
@@ -88,10 +104,10 @@ class Button(UIElement):
             bg_color = self.bg_color
 
         # Draw button background with rounded corners
-        pygame.draw.rect(surface, bg_color, self.rect, 0, 5)
+        pygame.draw.rect(surface, bg_color, rect, 0, 5)
 
         # Draw border
-        pygame.draw.rect(surface, self.border_color, self.rect, 2, 5)
+        pygame.draw.rect(surface, self.border_color, rect, 2, 5)
 
         # Create text surface if it doesn't exist
         if not self.text_surface and self.text:
@@ -99,14 +115,14 @@ class Button(UIElement):
 
         # Draw text if available
         if self.text_surface:
-            text_x = self.rect.x + (self.rect.width - self.text_surface.get_width()) // 2
-            text_y = self.rect.y + (self.rect.height - self.text_surface.get_height()) // 2
+            text_x = rect.x + (rect.width - self.text_surface.get_width()) // 2
+            text_y = rect.y + (rect.height - self.text_surface.get_height()) // 2
             surface.blit(self.text_surface, (text_x, text_y))
         else:
             # Fallback - draw text directly if surface not available
             if self.text and not self.text_surface:
                 fallback_font = pygame.font.SysFont(None, 24)
-                fallback_text = fallback_font.render(self.text, True, self.text_color)
-                text_x = self.rect.x + (self.rect.width - fallback_text.get_width()) // 2
-                text_y = self.rect.y + (self.rect.height - fallback_text.get_height()) // 2
+                fallback_text = render_text(fallback_font, self.text, self.text_color)
+                text_x = rect.x + (rect.width - fallback_text.get_width()) // 2
+                text_y = rect.y + (rect.height - fallback_text.get_height()) // 2
                 surface.blit(fallback_text, (text_x, text_y))
@@ -0,0 +1,149 @@
+import pygame
+
+# Event types routed by pointer position
+POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+# Event types sent only to the focused element
+KEYBOARD_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT)
+
+
+class SpatialGrid:
+    """Uniform grid of element rects used to hit-test points."""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def clear(self):
+        """Remove all elements from the grid."""
+        self.cells.clear()
+
+    def insert(self, element, rect, order):
+        """Add an element to every cell its rect overlaps."""
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append((order, element, rect))
+
+    def query_point(self, pos):
+        """Return the topmost visible element containing the point, or None."""
+        cell = self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not cell:
+            return None
+
+        best_order = -1
+        best = None
+        for order, element, rect in cell:
+            if order > best_order and element.visible and rect.collidepoint(pos):
+                best_order = order
+                best = element
+        return best
+
+
+class EventDispatcher:
+    """
+    Routes events to a list of UI elements.
+
+    Pointer events go only to the element under the cursor (or the element
+    that captured the pointer), keyboard events go only to the focused
+    element, and anything else is broadcast.
+    """
+
+    def __init__(self, elements, cell_size=64):
+        self.elements = elements
+        self.grid = SpatialGrid(cell_size)
+        self.dirty = True
+        self.hovered = None  # Element under the pointer
+        self.focused = None  # Element receiving keyboard events
+        self.captured = None  # Element holding the pointer while a button is down
+        self.modal = None  # Element that wants every pointer event (e.g. an open dropdown)
+
+    def invalidate(self):
+        """Rebuild the spatial index before the next event."""
+        self.dirty = True
+
+    def rebuild(self):
+        """Index the hit rect of every element."""
+        self.grid.clear()
+        for order, element in enumerate(self.elements):
+            rect = element.get_hit_rect()
+            if rect.width > 0 and rect.height > 0:
+                self.grid.insert(element, rect, order)
+        self.dirty = False
+
+    def hit_test(self, pos):
+        """Return the topmost element at a position."""
+        if self.dirty:
+            self.rebuild()
+        return self.grid.query_point(pos)
+
+    def dispatch(self, event):
+        """Send an event to the elements that need it."""
+        if event.type in POINTER_EVENTS:
+            self._dispatch_pointer(event)
+        elif event.type in KEYBOARD_EVENTS:
+            if self.focused is not None and self.focused.visible:
+                self.focused.handle_event(event)
+        elif event.type == pygame.MOUSEWHEEL:
+            target = self.modal or self.captured or self.hovered
+            if target is not None:
+                target.handle_event(event)
+        else:
+            for element in self.elements:
+                element.handle_event(event)
+
+    def _dispatch_pointer(self, event):
+        """Route a mouse event by hit-testing its position."""
+        if self.modal is not None:
+            self.modal.handle_event(event)
+            if not self.modal.captures_pointer():
+                self.modal = None
+                self.invalidate()  # Its hit rect shrinks when it closes
+            return
+
+        if self.captured is not None:
+            self.captured.handle_event(event)
+            if event.type == pygame.MOUSEBUTTONUP:
+                self._release_capture(event)
+            return
+
+        target = self.hit_test(event.pos)
+
+        if event.type == pygame.MOUSEMOTION:
+            if target is not self.hovered and self.hovered is not None:
+                # Let the previous element see the pointer leave
+                self.hovered.handle_event(event)
+            self.hovered = target
+            if target is not None:
+                target.handle_event(event)
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.focused = target if target is not None and target.focusable else None
+
+        if target is None:
+            return
+
+        target.handle_event(event)
+        if target.captures_pointer():
+            self.modal = target
+            self.invalidate()
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.captured = target
+
+    def _release_capture(self, event):
+        """End a pointer capture and update hover for whatever is under the cursor."""
+        released = self.captured
+        self.captured = None
+        if released.captures_pointer():
+            self.modal = released
+            return
+
+        target = self.hit_test(event.pos)
+        if target is not released:
+            self.hovered = target
+            if target is not None:
+                motion = pygame.event.Event(
+                    pygame.MOUSEMOTION, {"pos": event.pos, "rel": (0, 0), "buttons": (0, 0, 0)}
+                )
+                target.handle_event(motion)
@@ -1,12 +1,26 @@
 import pygame
 from .element import UIElement
 from .label import Label
+from ..utils.surfaces import render_text
 
 
 class Dropdown(UIElement):
     """A dropdown selection menu."""
 
-    def __init__(self, x, y, width, height, options=None, initial_selection=None, label=None):
+    focusable = True
+    retained = True
+
+    def __init__(
+        self,
+        x,
+        y,
+        width,
+        height,
+        options=None,
+        initial_selection=None,
+        label=None,
+        max_visible_options=None,
+    ):
         super().__init__(x, y, width, height)
         self.options = options or []
         if initial_selection and initial_selection in self.options:
@@ -30,6 +44,12 @@ class Dropdown(UIElement):
         # Option rects (used when dropdown is open)
         self.option_rects = []
 
+        # Virtualized option list: only this many rows are laid out and drawn
+        self.max_visible_options = max_visible_options
+        self.scroll_index = 0  # Index of the first visible option
+        self.hover_row = None  # Visible option row under the pointer
+        self._option_surfaces = {}  # Rendered option text for recently visible rows
+
         # Create label if specified
         if label:
             self.label = Label(
@@ -39,13 +59,29 @@ class Dropdown(UIElement):
     def set_font(self, font):
         """Set font for the dropdown and its label."""
         self.font = font
+        self._option_surfaces.clear()
         if self.label:
             self.label.set_font(font)
 
+    def get_visible_count(self):
+        """Return the number of option rows shown while open."""
+        if self.max_visible_options is None:
+            return len(self.options)
+        return min(len(self.options), self.max_visible_options)
+
+    def get_visible_options(self):
+        """Return the options currently shown in the open list."""
+        return self.options[self.scroll_index : self.scroll_index + self.get_visible_count()]
+
+    def scroll_options(self, rows):
+        """Scroll the visible window of a virtualized option list."""
+        max_index = len(self.options) - self.get_visible_count()
+        self.scroll_index = max(0, min(max_index, self.scroll_index + rows))
+
     def update_option_rects(self):
-        """Update the rectangles for each option."""
+        """Update the rectangles for each visible option row."""
         self.option_rects = []
-        for i, option in enumerate(self.options):
+        for i in range(self.get_visible_count()):
             option_rect = pygame.Rect(
                 self.rect.x,
                 self.rect.y + self.rect.height + (i * self.option_height),
@@ -54,12 +90,41 @@ class Dropdown(UIElement):
             )
             self.option_rects.append(option_rect)
 
+    def apply_layout(self, rect):
+        """Move the label and any open option rows along with the dropdown."""
+        offset_x = rect.x - self.rect.x
+        offset_y = rect.y - self.rect.y
+        super().apply_layout(rect)
+        if self.label:
+            self.label.rect.move_ip(offset_x, offset_y)
+        if self.is_open:
+            self.update_option_rects()
+
     def select_option(self, option):
         """Select a specific option."""
         if option in self.options:
             self.selected_option = option
             self.is_open = False
 
+    def open(self):
+        """Open the option list scrolled to the selected option."""
+        self.is_open = True
+        self.hover_row = None
+        if self.max_visible_options is not None and self.selected_option in self.options:
+            self.scroll_index = 0
+            self.scroll_options(self.options.index(self.selected_option))
+        self.update_option_rects()
+
+    def get_hit_rect(self):
+        """Include the option list while the dropdown is open."""
+        if self.is_open and self.option_rects:
+            return self.rect.unionall(self.option_rects)
+        return self.rect
+
+    def captures_pointer(self):
+        """An open dropdown needs clicks outside it to close."""
+        return self.is_open
+
     def handle_event(self, event):
         """Process mouse events."""
         if not self.enabled:
@@ -67,54 +132,88 @@ class Dropdown(UIElement):
 
         if event.type == pygame.MOUSEMOTION:
             self.hover = self.rect.collidepoint(event.pos)
+            # Tracked from events, which are in logical pixels unlike pygame.mouse.get_pos()
+            self.hover_row = self._row_at(event.pos) if self.is_open else None
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left mouse button
                 if self.rect.collidepoint(event.pos):
                     # Toggle dropdown
-                    self.is_open = not self.is_open
                     if self.is_open:
-                        self.update_option_rects()
+                        self.is_open = False
+                    else:
+                        self.open()
                 elif self.is_open:
-                    # Check if an option was clicked
-                    for i, option_rect in enumerate(self.option_rects):
-                        if option_rect.collidepoint(event.pos):
-                            self.select_option(self.options[i])
-                            break
+                    # Option rows are stacked evenly, so the row index is arithmetic
+                    row = self._row_at(event.pos)
+                    if row is not None:
+                        self.select_option(self.options[self.scroll_index + row])
                     else:
                         # Click outside closes the dropdown
                         self.is_open = False
 
+        elif event.type == pygame.MOUSEWHEEL and self.is_open:
+            self.scroll_options(-event.y)
+
+    def _row_at(self, pos):
+        """Return the visible row index at a position, or None."""
+        if not self.option_rects:
+            return None
+        top = self.option_rects[0].top
+        if not self.rect.left <= pos[0] < self.rect.right or pos[1] < top:
+            return None
+        row = (pos[1] - top) // self.option_height
+        return row if row < len(self.option_rects) else None
+
+    def _get_option_surface(self, option):
+        """Render option text, keeping only recently visible rows cached."""
+        text_surface = self._option_surfaces.get(option)
+        if text_surface is None:
+            if len(self._option_surfaces) > 4 * max(1, len(self.option_rects)):
+                self._option_surfaces.clear()
+            text_surface = render_text(self.font, option, self.text_color)
+            self._option_surfaces[option] = text_surface
+        return text_surface
+
     def update(self, dt):
         """Update dropdown state."""
         pass
 
-    def render(self, surface):
-        """Draw the dropdown control."""
-        if not self.visible:
-            return
+    def get_cache_bounds(self):
+        """Include the label drawn above the dropdown."""
+        if self.label:
+            return self.rect.union(self.label.rect)
+        return self.rect
+
+    def get_state_key(self):
+        """Appearance of the closed box depends on hover, selection and font."""
+        label_surface = self.label.text_surface if self.label else None
+        return (self.hover, self.is_open, self.selected_option, self.font, label_surface)
+
+    def draw(self, surface, rect):
+        """Draw the dropdown box, its selected option and label."""
+        offset_x = rect.x - self.rect.x
+        offset_y = rect.y - self.rect.y
 
         # Draw label if available
         if self.label:
-            self.label.render(surface)
+            self.label.draw(surface, self.label.rect.move(offset_x, offset_y))
 
         # Draw the dropdown box
-        pygame.draw.rect(
-            surface, self.hover_color if self.hover else self.background_color, self.rect
-        )
-        pygame.draw.rect(surface, self.border_color, self.rect, 2)
+        pygame.draw.rect(surface, self.hover_color if self.hover else self.background_color, rect)
+        pygame.draw.rect(surface, self.border_color, rect, 2)
 
         # Draw the selected option
         if self.font:
-            text_surface = self.font.render(self.selected_option, True, self.text_color)
-            text_x = self.rect.x + 10  # 10px left margin
-            text_y = self.rect.y + (self.rect.height - text_surface.get_height()) // 2
+            text_surface = render_text(self.font, self.selected_option, self.text_color)
+            text_x = rect.x + 10  # 10px left margin
+            text_y = rect.y + (rect.height - text_surface.get_height()) // 2
             surface.blit(text_surface, (text_x, text_y))
 
         # Draw dropdown arrow
         arrow_size = 8
-        arrow_x = self.rect.x + self.rect.width - arrow_size - 10  # 10px right margin
-        arrow_y = self.rect.y + (self.rect.height - arrow_size) // 2
+        arrow_x = rect.x + rect.width - arrow_size - 10  # 10px right margin
+        arrow_y = rect.y + (rect.height - arrow_size) // 2
 
         # Draw triangle pointing down or up based on dropdown state
         points = []
@@ -135,24 +234,28 @@ class Dropdown(UIElement):
 
         pygame.draw.polygon(surface, self.text_color, points)
 
-        # Draw dropdown options if open
-        if self.is_open:
-            for i, (option, option_rect) in enumerate(zip(self.options, self.option_rects)):
-                # Determine if mouse is hovering over this option
-                mouse_pos = pygame.mouse.get_pos()
-                is_option_hover = option_rect.collidepoint(mouse_pos)
-
-                # Draw option background
-                pygame.draw.rect(
-                    surface,
-                    self.hover_color if is_option_hover else self.background_color,
-                    option_rect,
-                )
-                pygame.draw.rect(surface, self.border_color, option_rect, 1)
-
-                # Draw option text
-                if self.font:
-                    text_surface = self.font.render(option, True, self.text_color)
-                    text_x = option_rect.x + 10  # 10px left margin
-                    text_y = option_rect.y + (option_rect.height - text_surface.get_height()) // 2
-                    surface.blit(text_surface, (text_x, text_y))
+    def render_overlay(self, surface):
+        """Draw the option list on top of other elements while open."""
+        if not self.is_open:
+            return
+
+        for row, (option, option_rect) in enumerate(
+            zip(self.get_visible_options(), self.option_rects)
+        ):
+            # Determine if mouse is hovering over this option
+            is_option_hover = row == self.hover_row
+
+            # Draw option background
+            pygame.draw.rect(
+                surface,
+                self.hover_color if is_option_hover else self.background_color,
+                option_rect,
+            )
+            pygame.draw.rect(surface, self.border_color, option_rect, 1)
+
+            # Draw option text
+            if self.font:
+                text_surface = self._get_option_surface(option)
+                text_x = option_rect.x + 10  # 10px left margin
+                text_y = option_rect.y + (option_rect.height - text_surface.get_height()) // 2
+                surface.blit(text_surface, (text_x, text_y))
@@ -1,13 +1,23 @@
 import pygame
+from ..utils.surfaces import create_surface
 
 
 class UIElement:
     """Base class for all UI elements."""
 
+    focusable = False  # Whether clicking this element gives it keyboard focus
+    retained = False  # Whether this element is drawn once into a cached surface
+
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         self.visible = True
         self.enabled = True
+        self.parent = None  # Container holding this element, if any
+
+        # Retained-mode rendering cache
+        self._cache_surface = None
+        self._cache_key = None
+        self.redraw_count = 0
 
     def handle_event(self, event):
         """Process pygame events."""
@@ -17,19 +27,95 @@ class UIElement:
         """Update element state."""
         pass
 
+    def is_animating(self):
+        """Return True while the element changes without input, so frames must keep coming."""
+        return False
+
     def render(self, surface):
         """Draw element to the surface."""
+        if not self.visible:
+            return
+
+        if self.retained:
+            surface.blit(*self.get_blit())
+        else:
+            self.draw(surface, self.rect)
+        self.render_overlay(surface)
+
+    def draw(self, surface, rect):
+        """
+        Draw the element's appearance.
+
+        Args:
+            surface: Surface to draw on
+            rect: Where the element's rect lies on that surface
+        """
+        pass
+
+    def render_overlay(self, surface):
+        """Draw anything that changes every frame or must sit above other elements."""
         pass
 
+    def get_state_key(self):
+        """Return a value that changes whenever the element's appearance changes."""
+        return None
+
+    def get_cache_bounds(self):
+        """Return the screen area covered by the cached surface."""
+        return self.rect
+
+    def get_blit(self):
+        """
+        Get the cached appearance, redrawing it only if the state changed.
+
+        Returns:
+            (surface, position) tuple ready for Surface.blit or Surface.blits
+        """
+        bounds = self.get_cache_bounds()
+        key = (bounds.size, self.get_state_key())
+        if self._cache_surface is None or key != self._cache_key:
+            self._cache_surface = create_surface(bounds.size, per_pixel_alpha=True)
+            self.draw(self._cache_surface, self.rect.move(-bounds.x, -bounds.y))
+            self._cache_key = key
+            self.redraw_count += 1
+        return self._cache_surface, bounds.topleft
+
+    def invalidate(self):
+        """Force the cached appearance to be redrawn, e.g. after changing colors."""
+        self._cache_key = None
+
     def set_position(self, x, y):
         """Set the position of this element."""
         self.rect.x = x
         self.rect.y = y
+        self.notify_geometry_changed()
 
     def set_size(self, width, height):
         """Set the size of this element."""
         self.rect.width = width
         self.rect.height = height
+        self.notify_geometry_changed()
+
+    def apply_layout(self, rect):
+        """Move and resize this element to the rect chosen by its container."""
+        self.rect.update(rect)
+
+    def notify_geometry_changed(self):
+        """Tell the parent container this element moved or resized."""
+        if self.parent is not None:
+            self.parent.child_geometry_changed(self)
+
+    def child_geometry_changed(self, child):
+        """Called when a child element moves or resizes."""
+        pass
+
+    def get_hit_rect(self):
+        """Return the area that receives pointer events."""
+        return self.rect
+
+    def captures_pointer(self):
+        """Return True while this element needs every pointer event, e.g. an open popup."""
+        return False
 
     def show(self):
         """Make this element visible."""
@@ -1,10 +1,13 @@
 import pygame
 from .element import UIElement
+from ..utils.surfaces import create_surface, render_text
 
 
 class Label(UIElement):
     """Text display UI element."""
 
+    retained = True
+
     def __init__(self, x, y, width, height, text="", centered=False):
         super().__init__(x, y, width, height)
         self.text = text
@@ -42,7 +45,7 @@ class Label(UIElement):
     def update_text_surface(self):
         """Render the text with the current font."""
         if self.font:
-            self.text_surface = self.font.render(self.text, True, self.text_color)
+            self.text_surface = render_text(self.font, self.text, self.text_color)
 
     def handle_event(self, event):
         """Labels don't process events."""
@@ -52,27 +55,27 @@ class Label(UIElement):
         """Labels typically don't need updates."""
         pass
 
-    def render(self, surface):
-        """Draw the label to the surface."""
-        if not self.visible:
-            return
+    def get_state_key(self):
+        """Appearance depends on the rendered text and background."""
+        return (self.text_surface, self.background_color, self.centered, self.padding)
 
+    def draw(self, surface, rect):
+        """Draw the label to the surface."""
         # Draw background if specified
         if self.background_color:
             if len(self.background_color) == 4:  # RGBA color with alpha
-                bg_surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
-                bg_surface.fill(self.background_color)
-                surface.blit(bg_surface, self.rect)
+                # A uniform alpha needs no per-pixel alpha channel
+                surface.blit(create_surface(rect.size, self.background_color), rect)
             else:  # RGB color without alpha
-                pygame.draw.rect(surface, self.background_color, self.rect)
+                pygame.draw.rect(surface, self.background_color, rect)
 
         # Draw text if available
         if self.text_surface:
             if self.centered:
-                text_x = self.rect.x + (self.rect.width - self.text_surface.get_width()) // 2
-                text_y = self.rect.y + (self.rect.height - self.text_surface.get_height()) // 2
+                text_x = rect.x + (rect.width - self.text_surface.get_width()) // 2
+                text_y = rect.y + (rect.height - self.text_surface.get_height()) // 2
             else:
-                text_x = self.rect.x + self.padding
-                text_y = self.rect.y + (self.rect.height - self.text_surface.get_height()) // 2
+                text_x = rect.x + self.padding
+                text_y = rect.y + (rect.height - self.text_surface.get_height()) // 2
 
             surface.blit(self.text_surface, (text_x, text_y))
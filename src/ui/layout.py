@@ -0,0 +1,301 @@
+import pygame
+from .element import UIElement
+from .dispatcher import EventDispatcher
+
+# Box directions
+VERTICAL = "vertical"
+HORIZONTAL = "horizontal"
+OVERLAY = "overlay"  # Children are placed by anchor instead of stacked
+
+# Cross-axis alignment for stacked children
+ALIGN_START = "start"
+ALIGN_CENTER = "center"
+ALIGN_END = "end"
+
+# Anchor names match pygame.Rect attributes
+ANCHORS = (
+    "topleft",
+    "midtop",
+    "topright",
+    "midleft",
+    "center",
+    "midright",
+    "bottomleft",
+    "midbottom",
+    "bottomright",
+)
+
+
+def resolve_length(value, available):
+    """
+    Convert a layout length to pixels.
+
+    Args:
+        value: Pixels as an int, a percentage string such as "50%", or None
+        available: Pixel length that percentages refer to
+
+    Returns:
+        Length in pixels, or None if value is None
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith("%"):
+            return int(available * float(text[:-1]) / 100)
+        return int(text)
+    return int(value)
+
+
+def normalize_padding(padding):
+    """Expand an int, (horizontal, vertical) or (left, top, right, bottom) padding."""
+    if isinstance(padding, int):
+        return (padding, padding, padding, padding)
+    if len(padding) == 2:
+        return (padding[0], padding[1], padding[0], padding[1])
+    return tuple(padding)
+
+
+class LayoutItem:
+    """Sizing and placement options for one child of a Box."""
+
+    __slots__ = ("element", "width", "height", "align", "anchor", "offset", "size")
+
+    def __init__(self, element, width=None, height=None, align=None, anchor=None, offset=(0, 0)):
+        if anchor is not None and anchor not in ANCHORS:
+            raise ValueError(f"Unknown anchor '{anchor}'")
+        self.element = element
+        self.width = width  # None keeps the element's own width
+        self.height = height
+        self.align = align  # None uses the box alignment
+        self.anchor = anchor
+        self.offset = offset
+        self.size = None  # Size given by the last layout pass
+
+
+class Box(UIElement):
+    """Container that sizes and positions its children in a row, column or by anchor."""
+
+    def __init__(
+        self, x, y, width, height, direction=VERTICAL, spacing=0, padding=0, align=ALIGN_START
+    ):
+        super().__init__(x, y, width, height)
+        if direction not in (VERTICAL, HORIZONTAL, OVERLAY):
+            raise ValueError(f"Unknown layout direction '{direction}'")
+        self.direction = direction
+        self.spacing = spacing
+        self.padding = normalize_padding(padding)
+        self.align = align
+        self.elements = []
+        self.items = []
+        self.dispatcher = EventDispatcher(self.elements)
+
+        # Layout cache: an empty box is trivially laid out
+        self.layout_dirty = False  # This box must re-place its children
+        self.needs_layout = False  # This box or a descendant is dirty
+        self.layout_count = 0  # Number of passes this box has run
+        self._cursor = 0  # Where the next stacked child goes along the main axis
+
+    def add(self, element, width=None, height=None, align=None, anchor=None, offset=(0, 0)):
+        """
+        Add a child element.
+
+        Args:
+            element: UI element to add
+            width, height: Pixels or percentage of the content area; None keeps the
+                element's own size
+            align: Cross-axis alignment overriding the box alignment
+            anchor: Rect attribute such as "center" pinning the child in an overlay box
+            offset: (x, y) pixels or percentages added after anchoring
+        """
+        item = LayoutItem(element, width, height, align, anchor, offset)
+        element.parent = self
+        self.elements.append(element)
+        self.items.append(item)
+
+        # Appending to a clean box only needs the new child placed
+        if self.layout_dirty:
+            self.mark_layout_dirty()
+        else:
+            self._place(item, self.get_content_rect())
+
+        self.dispatcher.invalidate()
+        return element
+
+    def remove(self, element):
+        """Remove a child element."""
+        index = self.elements.index(element)
+        del self.elements[index]
+        del self.items[index]
+        element.parent = None
+        self.dispatcher.invalidate()
+        self.mark_layout_dirty()
+
+    def get_content_rect(self):
+        """Return the area inside the padding."""
+        left, top, right, bottom = self.padding
+        return pygame.Rect(
+            self.rect.x + left,
+            self.rect.y + top,
+            max(0, self.rect.width - left - right),
+            max(0, self.rect.height - top - bottom),
+        )
+
+    def mark_layout_dirty(self):
+        """Schedule this box's children to be placed again on the next layout pass."""
+        self.layout_dirty = True
+        self._mark_needs_layout()
+
+    def _mark_needs_layout(self):
+        """Flag this box and its ancestors so the next pass reaches it."""
+        box = self
+        while isinstance(box, Box) and not box.needs_layout:
+            box.needs_layout = True
+            box = box.parent
+
+    def layout(self):
+        """Run a layout pass, skipping every subtree that is not dirty."""
+        if not self.needs_layout:
+            return
+        if self.layout_dirty:
+            content = self.get_content_rect()
+            self._cursor = 0
+            for item in self.items:
+                self._place(item, content)
+            self.layout_dirty = False
+            self.layout_count += 1
+            self.dispatcher.invalidate()
+
+        self.needs_layout = False
+        for element in self.elements:
+            if isinstance(element, Box) and element.needs_layout:
+                element.layout()
+
+    def _place(self, item, content):
+        """Compute one child's rect inside the content area."""
+        element = item.element
+        width = resolve_length(item.width, content.width)
+        height = resolve_length(item.height, content.height)
+        rect = pygame.Rect(
+            0,
+            0,
+            element.rect.width if width is None else width,
+            element.rect.height if height is None else height,
+        )
+
+        if self.direction == OVERLAY:
+            anchor = item.anchor or "topleft"
+            setattr(rect, anchor, getattr(content, anchor))
+        elif self.direction == VERTICAL:
+            rect.y = content.y + self._cursor
+            rect.x = self._align(item, content.x, content.width, rect.width)
+            self._cursor += rect.height + self.spacing
+        else:
+            rect.x = content.x + self._cursor
+            rect.y = self._align(item, content.y, content.height, rect.height)
+            self._cursor += rect.width + self.spacing
+
+        offset_x, offset_y = item.offset
+        rect.x += resolve_length(offset_x, content.width)
+        rect.y += resolve_length(offset_y, content.height)
+
+        item.size = rect.size
+        if rect != element.rect:
+            element.apply_layout(rect)
+            if isinstance(element, Box):
+                element.mark_layout_dirty()
+
+    def _align(self, item, start, available, size):
+        """Position a child along the cross axis."""
+        align = item.align or self.align
+        if align == ALIGN_CENTER:
+            return start + (available - size) // 2
+        if align == ALIGN_END:
+            return start + available - size
+        return start
+
+    def notify_geometry_changed(self):
+        """Re-place children when this box moves or resizes."""
+        self.mark_layout_dirty()
+        super().notify_geometry_changed()
+
+    def child_geometry_changed(self, child):
+        """Re-index element rects, and re-place children if one was resized."""
+        self.dispatcher.invalidate()
+        # A moved child keeps its position until the box next reflows
+        item = self.items[self.elements.index(child)]
+        if child.rect.size != item.size:
+            self.mark_layout_dirty()
+
+    def get_hit_rect(self):
+        """Cover every child so nested containers receive their pointer events."""
+        self.layout()
+        if not self.elements:
+            return self.rect
+        return self.rect.unionall([element.get_hit_rect() for element in self.elements])
+
+    def captures_pointer(self):
+        """Keep receiving pointer events while a child is captured or open."""
+        return self.dispatcher.captured is not None or self.dispatcher.modal is not None
+
+    def handle_event(self, event):
+        """Route events to the elements they concern."""
+        self.layout()
+        self.dispatcher.dispatch(event)
+
+    def update(self, dt):
+        """Update all elements."""
+        for element in self.elements:
+            if hasattr(element, "update"):
+                element.update(dt)
+
+    def is_animating(self):
+        """Return True while any visible child is animating."""
+        return any(element.visible and element.is_animating() for element in self.elements)
+
+    def render(self, surface):
+        """Composite all elements, blitting cached appearances in batches."""
+        if not self.visible:
+            return
+        self.layout()
+
+        batch = []
+        for element in self.elements:
+            if not element.visible:
+                continue
+            if element.retained:
+                batch.append(element.get_blit())
+            else:
+                # Keep stacking order: flush cached surfaces before drawing directly
+                if batch:
+                    surface.blits(batch, doreturn=False)
+                    batch = []
+                element.render(surface)
+        if batch:
+            surface.blits(batch, doreturn=False)
+
+        # Popups such as open dropdown lists go above everything else
+        for element in self.elements:
+            if element.visible and element.retained:
+                element.render_overlay(surface)
+
+
+class VBox(Box):
+    """Box that stacks its children top to bottom."""
+
+    def __init__(self, x, y, width, height, spacing=0, padding=0, align=ALIGN_START):
+        super().__init__(x, y, width, height, VERTICAL, spacing, padding, align)
+
+
+class HBox(Box):
+    """Box that stacks its children left to right."""
+
+    def __init__(self, x, y, width, height, spacing=0, padding=0, align=ALIGN_START):
+        super().__init__(x, y, width, height, HORIZONTAL, spacing, padding, align)
+
+
+class AnchorBox(Box):
+    """Box that pins each child to an anchor point, e.g. a screen-sized scene root."""
+
+    def __init__(self, x, y, width, height, padding=0):
+        super().__init__(x, y, width, height, OVERLAY, padding=padding)
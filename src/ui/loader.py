@@ -0,0 +1,381 @@
+import hashlib
+import os
+import pickle
+import weakref
+
+import pygame
+import yaml
+
+from .button import Button
+from .dropdown import Dropdown
+from .label import Label
+from .layout import AnchorBox, HBox, VBox, resolve_length
+from .menu import Menu
+from .slider import Slider
+from .spacer import Spacer
+from .toggle_button import ToggleButton
+from ..utils.logger import GameLogger
+
+UI_DIR = os.path.join("assets", "ui")
+CACHE_DIR = os.path.join(".cache", "ui")
+CACHE_VERSION = 1  # Bump when the cached definition format changes
+
+# Documents built with hot_reload, reloaded by reload_changed_definitions()
+_live_documents = weakref.WeakSet()
+
+logger = GameLogger.get_logger("UILoader")
+
+
+def get_definition_path(name):
+    """Return the path of a named UI definition in the assets folder."""
+    return os.path.join(UI_DIR, f"{name}.yaml")
+
+
+def load_definition(path, cache_dir=CACHE_DIR):
+    """
+    Load a parsed UI definition, using the compiled cache when the file is unchanged.
+
+    Args:
+        path: Path to the YAML definition
+        cache_dir: Folder holding pickled definitions keyed by file hash, or None
+            to always parse the YAML
+
+    Returns:
+        The definition as plain dicts and lists
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+
+    cache_path = None
+    if cache_dir:
+        digest = hashlib.sha1(source).hexdigest()
+        cache_path = os.path.join(cache_dir, f"{digest}.v{CACHE_VERSION}.pickle")
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning("Ignoring unreadable UI cache %s: %s", cache_path, e)
+
+    definition = yaml.safe_load(source)
+    if not isinstance(definition, dict) or not isinstance(definition.get("elements"), list):
+        raise ValueError(f"UI definition '{path}' needs an 'elements' list")
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump(definition, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write UI cache %s: %s", cache_path, e)
+
+    return definition
+
+
+class UIBuilder:
+    """Turns definition nodes into UI elements, binding callbacks by name."""
+
+    # Sizes used when a node does not give one; None fills the parent's width
+    DEFAULT_HEIGHTS = {
+        "button": 40,
+        "label": 30,
+        "toggle": 40,
+        "slider": 20,
+        "dropdown": 30,
+    }
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.ids = {}
+        self._fonts = {}
+
+    def get_font(self, spec):
+        """Return a font for a [name, size] or {name, size} spec, creating it once."""
+        if isinstance(spec, dict):
+            key = (spec.get("name"), spec["size"])
+        else:
+            key = (spec[0], spec[1])
+        font = self._fonts.get(key)
+        if font is None:
+            name, size = key
+            if name and os.path.splitext(name)[1]:
+                font = pygame.font.Font(name, size)
+            else:
+                font = pygame.font.SysFont(name, size)
+            self._fonts[key] = font
+        return font
+
+    def get_callback(self, name):
+        """Look up a handler method by name."""
+        if name is None:
+            return None
+        callback = getattr(self.handler, name, None)
+        if not callable(callback):
+            raise ValueError(f"UI callback '{name}' not found on {type(self.handler).__name__}")
+        return callback
+
+    def add_children(self, container, nodes):
+        """Build nodes and add them to a container."""
+        content = container.get_content_rect()
+        for node in nodes or ():
+            element = self.build(node, content)
+            layout = {
+                "width": node.get("width"),
+                "height": node.get("height"),
+                "align": node.get("align"),
+                "anchor": node.get("anchor"),
+                "offset": tuple(node.get("offset", (0, 0))),
+            }
+            if isinstance(container, Menu):
+                container.add_element(element, **layout)
+            else:
+                container.add(element, **layout)
+            if "font" in node and hasattr(element, "set_font"):
+                element.set_font(self.get_font(node["font"]))
+
+    def build(self, node, parent_rect):
+        """
+        Build one element and its children.
+
+        Args:
+            node: Definition dict with a "type" key
+            parent_rect: Content area of the parent, used for percentage sizes
+
+        Returns:
+            The built UI element
+        """
+        kind = node.get("type")
+        builder = getattr(self, f"build_{kind}", None)
+        if builder is None:
+            raise ValueError(f"Unknown UI element type '{kind}'")
+
+        default_height = self.DEFAULT_HEIGHTS.get(kind, parent_rect.height)
+        width = resolve_length(node.get("width"), parent_rect.width)
+        height = resolve_length(node.get("height"), parent_rect.height)
+        element = builder(
+            node,
+            parent_rect.width if width is None else width,
+            default_height if height is None else height,
+        )
+
+        element.visible = node.get("visible", True)
+        element.enabled = node.get("enabled", True)
+        if "id" in node:
+            self.ids[node["id"]] = element
+        return element
+
+    def build_menu(self, node, width, height):
+        menu = Menu(0, 0, width, height, centered=node.get("centered", False))
+        menu.spacing = node.get("spacing", menu.spacing)
+        menu.on_hover = self.get_callback(node.get("on_hover"))
+        if "font" in node:
+            menu.set_font(self.get_font(node["font"]))
+        self.add_children(menu, node.get("children"))
+        return menu
+
+    def _build_box(self, box_class, node, width, height):
+        box = box_class(
+            0,
+            0,
+            width,
+            height,
+            spacing=node.get("spacing", 0),
+            padding=node.get("padding", 0),
+            align=node.get("box_align", "start"),
+        )
+        self.add_children(box, node.get("children"))
+        return box
+
+    def build_vbox(self, node, width, height):
+        return self._build_box(VBox, node, width, height)
+
+    def build_hbox(self, node, width, height):
+        return self._build_box(HBox, node, width, height)
+
+    def build_anchor(self, node, width, height):
+        box = AnchorBox(0, 0, width, height, padding=node.get("padding", 0))
+        self.add_children(box, node.get("children"))
+        return box
+
+    def build_button(self, node, width, height):
+        return Button(
+            0,
+            0,
+            width,
+            height,
+            text=node.get("text", ""),
+            callback=self.get_callback(node.get("on_click")),
+        )
+
+    def build_label(self, node, width, height):
+        label = Label(0, 0, width, height, text=node.get("text", ""))
+        label.centered = node.get("centered", False)
+        if "background" in node:
+            label.set_background_color(tuple(node["background"]))
+        if "color" in node:
+            label.set_text_color(tuple(node["color"]))
+        return label
+
+    def build_toggle(self, node, width, height):
+        return ToggleButton(
+            0, 0, width, height, label=node.get("label", "Toggle"), is_on=node.get("value", False)
+        )
+
+    def build_slider(self, node, width, height):
+        return Slider(
+            0,
+            0,
+            width,
+            height,
+            min_value=node.get("min", 0.0),
+            max_value=node.get("max", 1.0),
+            initial_value=node.get("value", 0.5),
+            label=node.get("label"),
+        )
+
+    def build_dropdown(self, node, width, height):
+        return Dropdown(
+            0,
+            0,
+            width,
+            height,
+            options=list(node.get("options", ())),
+            initial_selection=node.get("selected"),
+            label=node.get("label"),
+            max_visible_options=node.get("max_visible"),
+        )
+
+    def build_spacer(self, node, width, height):
+        return Spacer(0, 0, width, node.get("height", 0))
+
+
+class UIDocument:
+    """A screen-sized UI tree built from a definition file."""
+
+    def __init__(
+        self, path, handler, width, height, on_build=None, hot_reload=False, cache_dir=CACHE_DIR
+    ):
+        """
+        Load and build a UI definition.
+
+        Args:
+            path: Path to the YAML definition
+            handler: Object whose methods are bound to callbacks named in the file
+            width, height: Size of the root area, normally the window
+            on_build: Called with this document after every (re)build, e.g. to look up
+                elements by id and apply current settings
+            hot_reload: Rebuild when the engine's file watcher reports the file changed
+            cache_dir: Folder for compiled definitions, or None to disable the cache
+        """
+        self.path = path
+        self.handler = handler
+        self.on_build = on_build
+        self.hot_reload = hot_reload
+        self.cache_dir = cache_dir
+        self.root = AnchorBox(0, 0, width, height)
+        self.ids = {}
+        self.mtime = None
+        self.build()
+        if hot_reload:
+            _live_documents.add(self)
+
+    def __getitem__(self, element_id):
+        """Return the element with the given id."""
+        return self.ids[element_id]
+
+    def get(self, element_id, default=None):
+        """Return the element with the given id, or default."""
+        return self.ids.get(element_id, default)
+
+    def build(self):
+        """(Re)build the element tree from the definition file."""
+        self.mtime = os.stat(self.path).st_mtime_ns
+        definition = load_definition(self.path, self.cache_dir)
+
+        root = AnchorBox(0, 0, self.root.rect.width, self.root.rect.height)
+        builder = UIBuilder(self.handler)
+        builder.add_children(root, definition["elements"])
+        root.layout()
+        self.root = root
+        self.ids = builder.ids
+
+        if self.on_build:
+            self.on_build(self)
+
+    def reload_if_changed(self):
+        """Rebuild if the definition file changed on disk; return True if it did."""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+        if mtime == self.mtime:
+            return False
+        try:
+            self.build()
+        except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError) as e:
+            # Keep the current tree while the file is being edited
+            self.mtime = mtime
+            logger.error("Failed to reload UI definition %s: %s", self.path, e)
+            return False
+        logger.info("Reloaded UI definition %s", self.path)
+        return True
+
+    def resize(self, width, height):
+        """Reflow the tree for a new window size."""
+        self.root.set_size(width, height)
+
+    def handle_event(self, event):
+        """Route an event into the tree."""
+        self.root.handle_event(event)
+
+    def update(self, dt):
+        """Update the tree."""
+        self.root.update(dt)
+
+    def is_animating(self):
+        """Return True while any element in the tree is animating."""
+        return self.root.is_animating()
+
+    def render(self, surface):
+        """Draw the tree."""
+        self.root.render(surface)
+
+
+def load_ui(name, handler, width, height, on_build=None, hot_reload=False):
+    """
+    Build a named UI definition from assets/ui.
+
+    Args:
+        name: File name without the .yaml extension
+        handler: Object whose methods are bound to callbacks named in the file
+        width, height: Size of the root area, normally the window
+        on_build: Called with the document after every (re)build
+        hot_reload: Rebuild when the engine's file watcher reports the file changed
+
+    Returns:
+        UIDocument holding the built tree
+    """
+    return UIDocument(
+        get_definition_path(name), handler, width, height, on_build=on_build, hot_reload=hot_reload
+    )
+
+
+def reload_changed_definitions(path):
+    """
+    Rebuild live hot-reload documents built from a changed file.
+
+    Args:
+        path: Path of the file that changed
+
+    Returns:
+        Number of documents rebuilt
+    """
+    source = os.path.abspath(path)
+    return sum(
+        1
+        for document in list(_live_documents)
+        if os.path.abspath(document.path) == source and document.reload_if_changed()
+    )
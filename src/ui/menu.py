@@ -1,23 +1,29 @@
-import pygame
-from .element import UIElement
 from .button import Button
 from .label import Label
 from .spacer import Spacer
+from .layout import ALIGN_CENTER, ALIGN_START, VBox
 
 
-class Menu(UIElement):
+class Menu(VBox):
     """Container for UI elements arranged vertically."""
 
     def __init__(self, x, y, width, height, centered=False):
-        super().__init__(x, y, width, height)
+        # A centered menu is a column whose center line sits at x
+        if centered:
+            x -= width // 2
+        super().__init__(
+            x, y, width, height, spacing=10, align=ALIGN_CENTER if centered else ALIGN_START
+        )
         self.centered = centered
-        self.elements = []
         self.font = None
-        self.spacing = 10  # Space between elements
 
         # Event handlers
         self.on_hover = None  # Called when a button is hovered
 
+    def move_to(self, x, y):
+        """Move the menu, treating x as the center line if the menu is centered."""
+        self.set_position(x - self.rect.width // 2 if self.centered else x, y)
+
     def set_font(self, font):
         """Set font for all menu elements."""
         self.font = font
@@ -25,23 +31,11 @@ class Menu(UIElement):
             if hasattr(element, "set_font"):
                 element.set_font(font)
 
-    def add_element(self, element):
-        """Add a UI element to the menu."""
+    def add_element(self, element, **layout):
+        """Add a UI element to the menu; layout options are passed to Box.add."""
         if self.font and hasattr(element, "set_font"):
             element.set_font(self.font)
-
-        # Position the element
-        if len(self.elements) == 0:
-            next_y = self.rect.y
-        else:
-            last_element = self.elements[-1]
-            next_y = last_element.rect.y + last_element.rect.height + self.spacing
-
-        element.rect.x = self.rect.x - (element.rect.width // 2 if self.centered else 0)
-        element.rect.y = next_y
-
-        self.elements.append(element)
-        return element
+        return self.add(element, **layout)
 
     def add_button(self, text, callback=None):
         """Add a button with the given text and callback."""
@@ -74,23 +68,11 @@ class Menu(UIElement):
         return self.add_element(spacer)
 
     def handle_event(self, event):
-        """Pass events to all elements."""
-        for element in self.elements:
-            if hasattr(element, "handle_event"):
-                element.handle_event(event)
-
-                # Check for hover state change on buttons
-                if isinstance(element, Button) and element.hover and self.on_hover:
-                    self.on_hover(element)
-
-    def update(self, dt):
-        """Update all elements."""
-        for element in self.elements:
-            if hasattr(element, "update"):
-                element.update(dt)
-
-    def render(self, surface):
-        """Draw all elements."""
-        for element in self.elements:
-            if hasattr(element, "render"):
-                element.render(surface)
+        """Route events to the elements they concern."""
+        previous_hover = self.dispatcher.hovered
+        super().handle_event(event)
+
+        # Notify when the pointer enters a button
+        hovered = self.dispatcher.hovered
+        if hovered is not previous_hover and isinstance(hovered, Button) and self.on_hover:
+            self.on_hover(hovered)
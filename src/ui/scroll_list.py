@@ -0,0 +1,213 @@
+import pygame
+from .element import UIElement
+from .button import Button
+
+
+class ScrollList(UIElement):
+    """
+    A virtualized, smoothly scrolling list of items.
+
+    Only the rows inside the visible window are laid out, drawn and
+    hit-tested. Row widgets are recycled: a small pool is rebound to
+    whichever items scroll into view, so the cost per frame depends on the
+    list height rather than the number of items.
+    """
+
+    focusable = True
+
+    def __init__(
+        self,
+        x,
+        y,
+        width,
+        height,
+        items=None,
+        row_height=40,
+        row_factory=None,
+        bind_row=None,
+        on_select=None,
+    ):
+        super().__init__(x, y, width, height)
+        self.items = list(items or [])
+        self.row_height = row_height
+        self.row_factory = row_factory or self._default_row_factory
+        self.bind_row = bind_row or self._default_bind_row
+        self.on_select = on_select  # Called with (index, item) when a row is clicked
+        self.font = None
+
+        # Scrolling
+        self.scroll_offset = 0.0  # Pixels scrolled from the top
+        self.target_offset = 0.0  # Offset being eased towards
+        self.scroll_step = row_height * 3  # Pixels per mouse wheel notch
+        self.scroll_smoothing = 15.0  # Higher values reach the target faster
+
+        # Interaction state
+        self.hover_index = None
+        self.pressed_index = None
+        self.selected_index = None
+
+        # Recycled row widgets and the item index each one is bound to
+        self.rows = []
+        self.row_indices = []
+
+        # Colors
+        self.background_color = (40, 40, 40)
+        self.border_color = (120, 120, 120)
+
+    def _default_row_factory(self):
+        """Create a plain button row."""
+        return Button(0, 0, self.rect.width, self.row_height)
+
+    @staticmethod
+    def _default_bind_row(row, item, index):
+        """Show the item as the row's text."""
+        row.set_text(str(item))
+
+    def set_font(self, font):
+        """Set the font used by row widgets."""
+        self.font = font
+        for row in self.rows:
+            if hasattr(row, "set_font"):
+                row.set_font(font)
+
+    def set_items(self, items):
+        """Replace the list contents."""
+        self.items = list(items)
+        self.row_indices = [None] * len(self.rows)  # Force every row to rebind
+        self.selected_index = None
+        self.target_offset = min(self.target_offset, self.get_max_offset())
+        self.scroll_offset = min(self.scroll_offset, self.get_max_offset())
+
+    def get_max_offset(self):
+        """Return the largest valid scroll offset."""
+        return max(0, len(self.items) * self.row_height - self.rect.height)
+
+    def get_visible_range(self):
+        """Return the (first, end) item indices inside the visible window."""
+        first = int(self.scroll_offset // self.row_height)
+        end = int((self.scroll_offset + self.rect.height) // self.row_height) + 1
+        return first, min(end, len(self.items))
+
+    def index_at(self, pos):
+        """Return the item index at a screen position, or None."""
+        if not self.rect.collidepoint(pos):
+            return None
+        index = int((pos[1] - self.rect.y + self.scroll_offset) // self.row_height)
+        return index if index < len(self.items) else None
+
+    def scroll_by(self, pixels):
+        """Scroll smoothly by a number of pixels."""
+        self.target_offset = max(0, min(self.get_max_offset(), self.target_offset + pixels))
+
+    def scroll_to(self, index):
+        """Scroll smoothly so that an item is fully visible."""
+        top = index * self.row_height
+        if top < self.target_offset:
+            self.target_offset = top
+        elif top + self.row_height > self.target_offset + self.rect.height:
+            self.target_offset = top + self.row_height - self.rect.height
+        self.target_offset = max(0, min(self.get_max_offset(), self.target_offset))
+
+    def select(self, index):
+        """Select an item and notify the callback."""
+        self.selected_index = index
+        if self.on_select:
+            self.on_select(index, self.items[index])
+
+    def is_animating(self):
+        """Return True while a smooth scroll is in progress."""
+        return abs(self.target_offset - self.scroll_offset) > 0.5
+
+    def handle_event(self, event):
+        """Process scrolling, hover, clicks and arrow keys."""
+        if not self.enabled or not self.visible:
+            return
+
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y * self.scroll_step)
+
+        elif event.type == pygame.MOUSEMOTION:
+            self.hover_index = self.index_at(event.pos)
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left mouse button
+                self.pressed_index = self.index_at(event.pos)
+
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:  # Left mouse button
+                index = self.index_at(event.pos)
+                if index is not None and index == self.pressed_index:
+                    self.select(index)
+                self.pressed_index = None
+
+        elif event.type == pygame.KEYDOWN and self.items:
+            if event.key == pygame.K_DOWN:
+                current = -1 if self.selected_index is None else self.selected_index
+                self.select(min(len(self.items) - 1, current + 1))
+                self.scroll_to(self.selected_index)
+            elif event.key == pygame.K_UP:
+                current = len(self.items) if self.selected_index is None else self.selected_index
+                self.select(max(0, current - 1))
+                self.scroll_to(self.selected_index)
+
+    def update(self, dt):
+        """Ease the scroll offset towards its target."""
+        if self.is_animating():
+            step = min(1.0, dt * self.scroll_smoothing)
+            self.scroll_offset += (self.target_offset - self.scroll_offset) * step
+        else:
+            self.scroll_offset = self.target_offset
+
+    def _sync_rows(self):
+        """Bind pooled row widgets to the visible items and position them."""
+        first, end = self.get_visible_range()
+        needed = end - first
+
+        while len(self.rows) < needed:
+            row = self.row_factory()
+            if self.font and hasattr(row, "set_font"):
+                row.set_font(self.font)
+            self.rows.append(row)
+            self.row_indices.append(None)
+
+        # Reuse a row already bound to an item when possible, so scrolling
+        # only rebinds rows for items that just came into view
+        bound = {index: slot for slot, index in enumerate(self.row_indices) if index is not None}
+        free = [
+            slot
+            for slot, index in enumerate(self.row_indices)
+            if index is None or not first <= index < end
+        ]
+        visible = []
+        for index in range(first, end):
+            slot = bound.get(index)
+            if slot is None:
+                slot = free.pop()
+                self.bind_row(self.rows[slot], self.items[index], index)
+                self.row_indices[slot] = index
+
+            row = self.rows[slot]
+            row.rect.x = self.rect.x
+            row.rect.y = self.rect.y + index * self.row_height - int(self.scroll_offset)
+            row.hover = index == self.hover_index or index == self.selected_index
+            row.pressed = index == self.pressed_index
+            visible.append(row)
+        return visible
+
+    def render(self, surface):
+        """Draw only the rows inside the visible window."""
+        if not self.visible:
+            return
+
+        pygame.draw.rect(surface, self.background_color, self.rect)
+
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.rect.clip(previous_clip))
+        rows = self._sync_rows()
+        surface.blits([row.get_blit() for row in rows if row.retained], doreturn=False)
+        for row in rows:
+            if not row.retained:
+                row.render(surface)
+        surface.set_clip(previous_clip)
+
+        pygame.draw.rect(surface, self.border_color, self.rect, 1)
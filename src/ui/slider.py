@@ -6,6 +6,9 @@ from .label import Label
 class Slider(UIElement):
     """Interactive slider control for numeric values."""
 
+    focusable = True
+    retained = True
+
     def __init__(
         self, x, y, width, height, min_value=0.0, max_value=1.0, initial_value=0.5, label=None
     ):
@@ -47,6 +50,18 @@ class Slider(UIElement):
         if self.label:
             self.label.set_font(font)
 
+    def apply_layout(self, rect):
+        """Move the label and handle along with the slider."""
+        offset_x = rect.x - self.rect.x
+        offset_y = rect.y - self.rect.y
+        super().apply_layout(rect)
+        if self.label:
+            self.label.rect.move_ip(offset_x, offset_y)
+        self.handle_height = self.rect.height
+        self.handle_rect.update(
+            self.get_handle_x_position(), self.rect.y, self.handle_width, self.handle_height
+        )
+
     def get_handle_x_position(self):
         """Calculate the handle's x position based on the current value."""
         value_range = self.max_value - self.min_value
@@ -104,29 +119,38 @@ class Slider(UIElement):
         # Update handle position from value
         self.handle_rect.x = self.get_handle_x_position()
 
-    def render(self, surface):
+    def get_cache_bounds(self):
+        """Include the label drawn above the slider."""
+        if self.label:
+            return self.rect.union(self.label.rect)
+        return self.rect
+
+    def get_state_key(self):
+        """Appearance depends on the handle position, drag state and label."""
+        label_surface = self.label.text_surface if self.label else None
+        return (self.handle_rect.x - self.rect.x, self.dragging, label_surface)
+
+    def draw(self, surface, rect):
         """Draw the slider control."""
-        if not self.visible:
-            return
+        offset_x = rect.x - self.rect.x
+        offset_y = rect.y - self.rect.y
 
         # Draw slider bar
-        bar_rect = pygame.Rect(
-            self.rect.x, self.rect.y + (self.rect.height - 4) // 2, self.rect.width, 4
-        )
+        bar_rect = pygame.Rect(rect.x, rect.y + (rect.height - 4) // 2, rect.width, 4)
         pygame.draw.rect(surface, self.bar_color, bar_rect)
 
         # Draw filled portion
         filled_width = self.handle_rect.x - self.rect.x + self.handle_width // 2
-        filled_rect = pygame.Rect(self.rect.x, bar_rect.y, filled_width, bar_rect.height)
+        filled_rect = pygame.Rect(rect.x, bar_rect.y, filled_width, bar_rect.height)
         pygame.draw.rect(surface, self.handle_color, filled_rect)
 
         # Draw handle
         pygame.draw.rect(
             surface,
             self.handle_active_color if self.dragging else self.handle_color,
-            self.handle_rect,
+            self.handle_rect.move(offset_x, offset_y),
         )
 
         # Draw label if available
         if self.label:
-            self.label.render(surface)
+            self.label.draw(surface, self.label.rect.move(offset_x, offset_y))
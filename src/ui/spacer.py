@@ -15,6 +15,6 @@ class Spacer(UIElement):
         """Spacers don't need updates."""
         pass
 
-    def render(self, surface):
-        """Spacers are invisible, so they don't render anything."""
+    def draw(self, surface, rect):
+        """Spacers are invisible, so they don't draw anything."""
         pass
@@ -1,10 +1,14 @@
 import pygame
 from .element import UIElement
+from ..utils.surfaces import render_text
 
 
 class ToggleButton(UIElement):
     """A button that can be toggled on or off."""
 
+    focusable = True
+    retained = True
+
     def __init__(self, x, y, width, height, label="Toggle", is_on=False):
         super().__init__(x, y, width, height)
         self.label_text = label
@@ -32,7 +36,7 @@ class ToggleButton(UIElement):
     def update_label_surface(self):
         """Update the rendered label text."""
         if self.font and self.label_text:
-            self.label_surface = self.font.render(self.label_text, True, self.text_color)
+            self.label_surface = render_text(self.font, self.label_text, self.text_color)
 
     def toggle(self):
         """Toggle the button state."""
@@ -58,20 +62,21 @@ class ToggleButton(UIElement):
         """Update toggle state."""
         pass
 
-    def render(self, surface):
-        """Draw the toggle button."""
-        if not self.visible:
-            return
+    def get_state_key(self):
+        """Appearance depends on the toggle state, hover and label."""
+        return (self.is_on, self.hover, self.label_surface)
 
+    def draw(self, surface, rect):
+        """Draw the toggle button."""
         # Draw label
         if self.label_surface:
-            label_x = self.rect.x + 10  # Left margin
-            label_y = self.rect.y + (self.rect.height - self.label_surface.get_height()) // 2
+            label_x = rect.x + 10  # Left margin
+            label_y = rect.y + (rect.height - self.label_surface.get_height()) // 2
             surface.blit(self.label_surface, (label_x, label_y))
 
         # Calculate toggle position (right side of the button)
-        toggle_x = self.rect.x + self.rect.width - self.toggle_width - 10
-        toggle_y = self.rect.y + (self.rect.height - self.toggle_height) // 2
+        toggle_x = rect.x + rect.width - self.toggle_width - 10
+        toggle_y = rect.y + (rect.height - self.toggle_height) // 2
         toggle_rect = pygame.Rect(toggle_x, toggle_y, self.toggle_width, self.toggle_height)
 
         # Choose toggle color based on state
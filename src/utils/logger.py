@@ -1,9 +1,11 @@
 import logging
 import os
+import copy
 import datetime
+import queue
 import sys
 import threading
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, RotatingFileHandler
 
 # Log levels
 DEBUG = logging.DEBUG
@@ -16,13 +18,25 @@ CRITICAL = logging.CRITICAL
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 SIMPLE_FORMAT = "%(levelname)s: %(message)s"
 
-# Create logs directory if it doesn't exist
+# Overflow policies for asynchronous logging when the queue is full
+OVERFLOW_DROP_NEWEST = "drop_newest"  # Discard the record being logged
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # Discard the oldest queued record
+OVERFLOW_BLOCK = "block"  # Wait for space (adds latency to the caller)
+
+# Directory for log files, created when the first file logger is set up
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
 
-# Default log file with timestamp
-current_time = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-DEFAULT_LOG_FILE = os.path.join(LOG_DIR, f"game_{current_time}.log")
+# Default log file with timestamp, computed on first use
+_default_log_file = None
+
+
+def get_default_log_file():
+    """Return the timestamped log file path for this session."""
+    global _default_log_file
+    if _default_log_file is None:
+        current_time = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        _default_log_file = os.path.join(LOG_DIR, f"game_{current_time}.log")
+    return _default_log_file
 
 
 class SafeRotatingFileHandler(RotatingFileHandler):
@@ -31,6 +45,16 @@ class SafeRotatingFileHandler(RotatingFileHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.lock = threading.RLock()
+        self.defer_flush = False  # Set by the async listener, which flushes once per batch
+
+    def flush(self):
+        """Flush the stream unless flushing is deferred to the end of a batch."""
+        if not self.defer_flush:
+            super().flush()
+
+    def flush_batch(self):
+        """Flush buffered records written since the last batch."""
+        super().flush()
 
     def emit(self, record):
         """
@@ -54,6 +78,202 @@ class SafeRotatingFileHandler(RotatingFileHandler):
                 pass
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    Rate limits repeated messages from the same call site.
+
+    A message is identified by its source line, format string and arguments.
+    Only `burst` copies are let through per `period` seconds; the first copy
+    after the window closes reports how many were suppressed, and flush()
+    reports the counts of repeats that never came back.
+    """
+
+    def __init__(self, period=5.0, burst=3, max_sites=1024):
+        super().__init__()
+        self.period = period
+        self.burst = burst
+        self.max_sites = max_sites
+        # key -> [window start, records let through, records suppressed, last suppressed record]
+        self._sites = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(record):
+        """Build the deduplication key for a record."""
+        try:
+            args = record.args
+            hash(args)
+        except TypeError:
+            args = repr(record.args)
+        return (record.pathname, record.lineno, record.msg, args)
+
+    def filter(self, record):
+        """Return False for records that exceed the rate limit."""
+        key = self._make_key(record)
+        now = record.created
+
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.period:
+                suppressed = site[2] if site else 0
+                if site is None and len(self._sites) >= self.max_sites:
+                    self._prune(now)
+                self._sites[key] = [now, 1, 0, None]
+                if suppressed:
+                    record.msg = f"{record.msg} (repeated {suppressed} more times)"
+                return True
+
+            if site[1] < self.burst:
+                site[1] += 1
+                return True
+
+            site[2] += 1
+            site[3] = record
+            return False
+
+    def flush(self, logger):
+        """
+        Log how many repeats are still suppressed, so the counts are not lost at shutdown.
+
+        Args:
+            logger: Logger this filter is attached to; its handlers receive the reports
+        """
+        with self._lock:
+            pending = [site[2:] for site in self._sites.values() if site[2]]
+            for site in self._sites.values():
+                site[2], site[3] = 0, None
+
+        for suppressed, record in pending:
+            report = copy.copy(record)
+            report.msg = f"{record.msg} (repeated {suppressed} more times)"
+            logger.callHandlers(report)
+
+    def _prune(self, now):
+        """Forget call sites whose window has closed."""
+        expired = [key for key, site in self._sites.items() if now - site[0] >= self.period]
+        for key in expired:
+            del self._sites[key]
+        if len(self._sites) >= self.max_sites:
+            self._sites.clear()
+
+    def get_suppressed_count(self):
+        """Return the number of records currently being suppressed."""
+        with self._lock:
+            return sum(site[2] for site in self._sites.values())
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that applies an overflow policy instead of blocking the caller."""
+
+    def __init__(self, log_queue, overflow=OVERFLOW_DROP_NEWEST):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.enqueued = 0
+        self.dropped = 0
+
+    def enqueue(self, record):
+        """Queue a record, dropping one if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == OVERFLOW_BLOCK:
+                self.queue.put(record)
+            elif self.overflow == OVERFLOW_DROP_OLDEST:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.dropped += 1
+                try:
+                    self.queue.put_nowait(record)
+                except queue.Full:
+                    self.dropped += 1
+                    return
+            else:
+                self.dropped += 1
+                return
+        self.enqueued += 1
+
+
+class BatchingQueueListener:
+    """Background thread that writes queued records in batches and flushes once per batch."""
+
+    _STOP = object()  # Queued by stop(); records queued before it are still written
+
+    def __init__(self, log_queue, *handlers, batch_size=64):
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.processed = 0
+        self._thread = None
+
+    def start(self):
+        """Start the writer thread."""
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Write everything queued so far, then stop the thread."""
+        if self._thread is None:
+            return
+        self.queue.put(self._STOP)  # Waits for space if the queue is full
+        self._thread.join()
+        self._thread = None
+
+    def handle(self, record):
+        """Pass one record to every handler."""
+        for handler in self.handlers:
+            handler.handle(record)
+
+    def _run(self):
+        """Drain the queue in batches until the stop marker arrives."""
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                try:
+                    if record is self._STOP:
+                        running = False
+                    else:
+                        self.handle(record)
+                        self.processed += 1
+                finally:
+                    self.queue.task_done()
+
+            for handler in self.handlers:
+                handler.flush()
+
+
+class LoggerDispatchHandler(logging.Handler):
+    """Routes records from the shared queue to the original handlers of their logger."""
+
+    def __init__(self, sink_handlers):
+        super().__init__()
+        self.sink_handlers = sink_handlers
+
+    def handle(self, record):
+        """Pass the record to every handler of the logger that created it."""
+        for handler in self.sink_handlers.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def flush(self):
+        """Flush every sink handler once for the whole batch."""
+        for handlers in list(self.sink_handlers.values()):
+            for handler in handlers:
+                if isinstance(handler, SafeRotatingFileHandler):
+                    handler.flush_batch()
+                else:
+                    handler.flush()
+
+
 class GameLogger:
     """
     Custom logger for the game that provides consistent formatting and behavior.
@@ -62,16 +282,24 @@ class GameLogger:
     _loggers = {}  # Cache to store created loggers
     _logger_lock = threading.Lock()  # Lock for creating loggers
 
+    # Asynchronous logging state
+    _queue_handler = None
+    _listener = None
+    _sink_handlers = {}  # Logger name -> handlers moved behind the queue
+
     @staticmethod
     def get_logger(
         name,
         level=INFO,
         log_to_file=True,
         log_to_console=True,
-        file_path=DEFAULT_LOG_FILE,
+        file_path=None,
         max_file_size=5 * 1024 * 1024,
         backup_count=3,
         format_string=DEFAULT_FORMAT,
+        rate_limit=True,
+        rate_limit_period=5.0,
+        rate_limit_burst=3,
     ):
         """
         Get or create a logger with the specified name and configuration.
@@ -81,10 +309,17 @@ class GameLogger:
             level: Logging level (DEBUG, INFO, etc.)
             log_to_file: Whether to log to a file
             log_to_console: Whether to log to console
-            file_path: Path to log file
+            file_path: Path to log file (defaults to a timestamped file in LOG_DIR)
             max_file_size: Maximum size of log file before rotating
             backup_count: Number of backup log files to keep
             format_string: Format string for log messages
+            rate_limit: Whether to coalesce repeated messages from the same call site
+            rate_limit_period: Window in seconds for rate limiting
+            rate_limit_burst: Identical messages let through per window
+
+        Log calls should pass arguments %-style (logger.debug("x=%s", x)) rather
+        than as f-strings, so records for disabled levels or suppressed repeats
+        are never formatted.
 
         Returns:
             Logger instance
@@ -104,9 +339,15 @@ class GameLogger:
             logger.setLevel(level)
             logger.propagate = False  # Don't propagate to parent loggers
 
-            # Clear existing handlers if any
+            # Clear existing handlers and filters if any
             if logger.handlers:
                 logger.handlers.clear()
+            for existing_filter in list(logger.filters):
+                logger.removeFilter(existing_filter)
+
+            # Drop repeats before they reach any handler or the async queue
+            if rate_limit:
+                logger.addFilter(RateLimitFilter(rate_limit_period, rate_limit_burst))
 
             # Create formatter
             formatter = logging.Formatter(format_string)
@@ -114,6 +355,12 @@ class GameLogger:
             # Add file handler if needed with our safe handler
             if log_to_file:
                 try:
+                    if file_path is None:
+                        file_path = get_default_log_file()
+                    log_dir = os.path.dirname(file_path)
+                    if log_dir:
+                        os.makedirs(log_dir, exist_ok=True)
+
                     file_handler = SafeRotatingFileHandler(
                         file_path,
                         maxBytes=max_file_size,
@@ -135,6 +382,10 @@ class GameLogger:
                 console_handler.setFormatter(formatter)
                 logger.addHandler(console_handler)
 
+            # Route through the shared queue if async logging is active
+            if GameLogger._listener is not None:
+                GameLogger._make_async(logger)
+
             # Cache the logger
             GameLogger._loggers[name] = logger
             return logger
@@ -145,6 +396,99 @@ class GameLogger:
         for logger in GameLogger._loggers.values():
             logger.setLevel(level)
 
+    @staticmethod
+    def enable_async(max_queue_size=10000, overflow=OVERFLOW_DROP_NEWEST, batch_size=64):
+        """
+        Move all file and console output onto a background thread.
+
+        Loggers only put records on a bounded queue; a listener thread writes
+        them in batches and flushes once per batch.
+
+        Args:
+            max_queue_size: Maximum number of queued records
+            overflow: Policy when the queue is full (OVERFLOW_DROP_NEWEST,
+                OVERFLOW_DROP_OLDEST or OVERFLOW_BLOCK)
+            batch_size: Maximum number of records written per flush
+        """
+        with GameLogger._logger_lock:
+            if GameLogger._listener is not None:
+                return
+
+            log_queue = queue.Queue(maxsize=max_queue_size)
+            GameLogger._queue_handler = BoundedQueueHandler(log_queue, overflow)
+            GameLogger._listener = BatchingQueueListener(
+                log_queue,
+                LoggerDispatchHandler(GameLogger._sink_handlers),
+                batch_size=batch_size,
+            )
+            for logger in GameLogger._loggers.values():
+                GameLogger._make_async(logger)
+            GameLogger._listener.start()
+
+    @staticmethod
+    def _make_async(logger):
+        """Replace a logger's handlers with the shared queue handler."""
+        sinks = list(logger.handlers)
+        for handler in sinks:
+            if isinstance(handler, SafeRotatingFileHandler):
+                handler.defer_flush = True
+        GameLogger._sink_handlers[logger.name] = sinks
+        logger.handlers = [GameLogger._queue_handler]
+
+    @staticmethod
+    def flush_suppressed():
+        """Log the outstanding counts of every logger's rate-limited repeats."""
+        for logger in list(GameLogger._loggers.values()):
+            for log_filter in logger.filters:
+                if isinstance(log_filter, RateLimitFilter):
+                    log_filter.flush(logger)
+
+    @staticmethod
+    def disable_async():
+        """Report suppressed repeats, flush all queued records and restore synchronous logging."""
+        GameLogger.flush_suppressed()
+        with GameLogger._logger_lock:
+            if GameLogger._listener is None:
+                return
+
+            # Stopping the listener drains everything queued before the sentinel
+            GameLogger._listener.stop()
+            GameLogger._listener = None
+
+            for name, sinks in GameLogger._sink_handlers.items():
+                for handler in sinks:
+                    if isinstance(handler, SafeRotatingFileHandler):
+                        handler.defer_flush = False
+                    handler.flush()
+                if name in GameLogger._loggers:
+                    GameLogger._loggers[name].handlers = sinks
+            GameLogger._sink_handlers.clear()
+
+    @staticmethod
+    def is_async():
+        """Check whether asynchronous logging is active."""
+        return GameLogger._listener is not None
+
+    @staticmethod
+    def get_async_stats():
+        """
+        Get counters for asynchronous logging.
+
+        Returns:
+            Dictionary with enqueued, dropped, processed and currently queued records
+        """
+        handler = GameLogger._queue_handler
+        listener = GameLogger._listener
+        if handler is None:
+            return {"enqueued": 0, "dropped": 0, "processed": 0, "queued": 0}
+
+        return {
+            "enqueued": handler.enqueued,
+            "dropped": handler.dropped,
+            "processed": listener.processed if listener else handler.enqueued,
+            "queued": handler.queue.qsize(),
+        }
+
 
 # Example usage
 if __name__ == "__main__":
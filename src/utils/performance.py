@@ -1,5 +1,10 @@
+import gc
+import json
+import sys
 import time
-from typing import Dict, List, Optional
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
 import pygame
 
 
@@ -24,12 +29,38 @@ class PerformanceMonitor:
         self._font: Optional[pygame.font.Font] = None
         self.show_metrics = False
 
+        # Garbage collector instrumentation
+        self.gc_pauses: Dict[int, List[float]] = {0: [], 1: [], 2: []}
+        self.gc_collections: Dict[int, int] = {0: 0, 1: 0, 2: 0}
+        self._gc_start_time = 0.0
+        self._gc_tracking = False
+
+        # Allocation tracking
+        self.frame_allocations: List[int] = []
+        self._last_allocated_blocks: Optional[int] = None
+        self.last_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._memory_tracing = False  # Whether tracing was started by this monitor
+
+        # Idle-time garbage collection
+        self.idle_gc = False
+
+        # Time from sampling input to presenting the frame it affected
+        self.input_latencies: List[float] = []
+
     def start_frame(self) -> None:
         """Start timing a new frame."""
         self.frame_times.append(time.perf_counter())
         if len(self.frame_times) > self.max_frame_samples:
             self.frame_times.pop(0)
 
+        # Net memory blocks allocated since the previous frame started
+        blocks = sys.getallocatedblocks()
+        if self._last_allocated_blocks is not None:
+            self.frame_allocations.append(blocks - self._last_allocated_blocks)
+            if len(self.frame_allocations) > self.max_frame_samples:
+                self.frame_allocations.pop(0)
+        self._last_allocated_blocks = blocks
+
     def start_section(self, name: str) -> None:
         """
         Start timing a section of code.
@@ -45,17 +76,25 @@ class PerformanceMonitor:
         if self.current_section is None:
             return
 
-        elapsed = time.perf_counter() - self.section_start_time
-        if self.current_section not in self.section_times:
-            self.section_times[self.current_section] = []
+        self.record_section(self.current_section, time.perf_counter() - self.section_start_time)
+        self.current_section = None
+
+    def record_section(self, name: str, elapsed: float) -> None:
+        """
+        Record a time measured outside start_section/end_section, e.g. a part of another section.
 
-        times = self.section_times[self.current_section]
+        Args:
+            name: Name of the section
+            elapsed: Seconds taken
+        """
+        if name not in self.section_times:
+            self.section_times[name] = []
+
+        times = self.section_times[name]
         times.append(elapsed)
         if len(times) > self.max_frame_samples:
             times.pop(0)
 
-        self.current_section = None
-
     def get_fps(self) -> float:
         """Calculate current FPS based on frame times."""
         if len(self.frame_times) < 2:
@@ -92,6 +131,241 @@ class PerformanceMonitor:
             "avg": sum(times) / len(times) * 1000,
         }
 
+    def get_last_section_times(self) -> Dict[str, float]:
+        """
+        Get the most recent time recorded for each section.
+
+        Returns:
+            Dictionary mapping section name to milliseconds
+        """
+        return {name: times[-1] * 1000 for name, times in self.section_times.items() if times}
+
+    def start_gc_tracking(self) -> None:
+        """Start recording garbage collection pauses through gc.callbacks."""
+        if not self._gc_tracking:
+            gc.callbacks.append(self._on_gc_event)
+            self._gc_tracking = True
+
+    def stop_gc_tracking(self) -> None:
+        """Stop recording garbage collection pauses."""
+        if self._gc_tracking:
+            gc.callbacks.remove(self._on_gc_event)
+            self._gc_tracking = False
+
+    def _on_gc_event(self, phase: str, info: Dict[str, Any]) -> None:
+        """Record the duration of a single collection."""
+        if phase == "start":
+            self._gc_start_time = time.perf_counter()
+            return
+
+        generation = info.get("generation", 0)
+        pauses = self.gc_pauses.setdefault(generation, [])
+        pauses.append(time.perf_counter() - self._gc_start_time)
+        if len(pauses) > self.max_frame_samples:
+            pauses.pop(0)
+        self.gc_collections[generation] = self.gc_collections.get(generation, 0) + 1
+
+    def get_gc_stats(self) -> Dict[int, Dict[str, float]]:
+        """
+        Get garbage collection pause statistics per generation.
+
+        Returns:
+            Dictionary mapping generation to collection count and max/avg pause in ms
+        """
+        stats = {}
+        for generation, pauses in sorted(self.gc_pauses.items()):
+            stats[generation] = {
+                "count": self.gc_collections.get(generation, 0),
+                "max": max(pauses) * 1000 if pauses else 0.0,
+                "avg": sum(pauses) / len(pauses) * 1000 if pauses else 0.0,
+            }
+        return stats
+
+    def get_allocation_stats(self) -> Dict[str, float]:
+        """
+        Get statistics for net memory blocks allocated per frame.
+
+        Returns:
+            Dictionary containing the last, max, and average block counts
+        """
+        if not self.frame_allocations:
+            return {"last": 0.0, "max": 0.0, "avg": 0.0}
+
+        allocations = self.frame_allocations
+        return {
+            "last": float(allocations[-1]),
+            "max": float(max(allocations)),
+            "avg": sum(allocations) / len(allocations),
+        }
+
+    def record_input_latency(self, seconds: float) -> None:
+        """
+        Record the time between sampling input and presenting the resulting frame.
+
+        Args:
+            seconds: Elapsed time from the input poll to the end of the flip
+        """
+        self.input_latencies.append(seconds)
+        if len(self.input_latencies) > self.max_frame_samples:
+            self.input_latencies.pop(0)
+
+    def get_input_latency_stats(self) -> Dict[str, float]:
+        """
+        Get statistics for input-to-present latency.
+
+        Returns:
+            Dictionary containing the last, max, and average latency in milliseconds
+        """
+        if not self.input_latencies:
+            return {"last": 0.0, "max": 0.0, "avg": 0.0}
+
+        latencies = self.input_latencies
+        return {
+            "last": latencies[-1] * 1000,
+            "max": max(latencies) * 1000,
+            "avg": sum(latencies) / len(latencies) * 1000,
+        }
+
+    def start_memory_tracing(self, frames: int = 1) -> None:
+        """
+        Start tracing allocations so memory snapshots can attribute them.
+
+        Every allocation is slower while tracing, so this is only done when
+        asked for, and stopped again with stop_memory_tracing().
+
+        Args:
+            frames: Stack frames stored per allocation
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._memory_tracing = True
+
+    def stop_memory_tracing(self) -> None:
+        """Stop tracing allocations, if this monitor started it."""
+        if self._memory_tracing:
+            tracemalloc.stop()
+            self._memory_tracing = False
+        self.last_snapshot = None
+
+    def take_memory_snapshot(self, limit: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        Take a tracemalloc snapshot and return the top allocation sites.
+
+        Snapshots cover allocations made since tracing was started with
+        start_memory_tracing(); without tracing nothing is returned.
+
+        Args:
+            limit: Number of allocation sites to return
+
+        Returns:
+            List of (location, size in bytes, block count) tuples
+        """
+        if not tracemalloc.is_tracing():
+            return []
+
+        self.last_snapshot = tracemalloc.take_snapshot()
+        top_stats = self.last_snapshot.statistics("lineno")[:limit]
+        return [(str(stat.traceback), stat.size, stat.count) for stat in top_stats]
+
+    def get_type_counts(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Count live objects tracked by the garbage collector per Python type.
+
+        This walks every tracked object, so call it on demand rather than per frame.
+
+        Args:
+            limit: Number of types to return
+
+        Returns:
+            List of (type name, count) tuples, most common first
+        """
+        counts = Counter(type(obj).__name__ for obj in gc.get_objects())
+        return counts.most_common(limit)
+
+    def enable_idle_gc(self) -> None:
+        """
+        Move garbage collection out of the frame and into idle time.
+
+        Objects that exist now (assets, scenes, UI) are frozen into the permanent
+        generation and automatic collection is disabled; the engine then calls
+        collect_idle() between frames.
+        """
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+        self.idle_gc = True
+
+    def disable_idle_gc(self) -> None:
+        """Restore automatic garbage collection."""
+        gc.unfreeze()
+        gc.enable()
+        self.idle_gc = False
+
+    def collect_idle(self) -> Optional[int]:
+        """
+        Run a manual collection if the allocation thresholds have been exceeded.
+
+        Mirrors the interpreter's generational policy: the oldest generation whose
+        count exceeds its threshold is collected.
+
+        Returns:
+            The collected generation, or None if no collection was needed
+        """
+        if not self.idle_gc:
+            return None
+
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        for generation in (2, 1, 0):
+            if thresholds[generation] and counts[generation] > thresholds[generation]:
+                gc.collect(generation)
+                return generation
+        return None
+
+    def get_report(self, include_memory: bool = False) -> Dict[str, Any]:
+        """
+        Build a report of all collected metrics.
+
+        Args:
+            include_memory: Also include per-type counts, and a tracemalloc
+                snapshot while memory tracing is on
+
+        Returns:
+            Dictionary suitable for JSON serialization
+        """
+        report: Dict[str, Any] = {
+            "fps": self.get_fps(),
+            "sections": {name: self.get_section_stats(name) for name in self.section_times},
+            "gc": {str(gen): stats for gen, stats in self.get_gc_stats().items()},
+            "gc_frozen_objects": gc.get_freeze_count(),
+            "idle_gc": self.idle_gc,
+            "allocations_per_frame": self.get_allocation_stats(),
+            "input_latency": self.get_input_latency_stats(),
+        }
+        if include_memory:
+            report["memory_tracing"] = tracemalloc.is_tracing()
+            report["top_allocations"] = [
+                {"location": location, "size": size, "count": count}
+                for location, size, count in self.take_memory_snapshot()
+            ]
+            report["type_counts"] = dict(self.get_type_counts())
+        return report
+
+    def export_report(self, path: str, include_memory: bool = True) -> str:
+        """
+        Write the performance report to a JSON file.
+
+        Args:
+            path: Destination file path
+            include_memory: Also include a tracemalloc snapshot and per-type counts
+
+        Returns:
+            The path that was written
+        """
+        with open(path, "w") as f:
+            json.dump(self.get_report(include_memory=include_memory), f, indent=4)
+        return path
+
     def draw_metrics(self, surface: pygame.Surface) -> None:
         """
         Draw performance metrics on screen.
@@ -122,6 +396,26 @@ class PerformanceMonitor:
             surface.blit(stats_surface, (10, y))
             y += 25
 
+        # Draw allocation and garbage collection stats
+        allocations = self.get_allocation_stats()
+        alloc_text = f"allocs/frame: {allocations['avg']:.0f} (max {allocations['max']:.0f})"
+        alloc_surface = self._font.render(alloc_text, True, (255, 255, 255))
+        surface.blit(alloc_surface, (10, y))
+        y += 25
+
+        if self.input_latencies:
+            latency = self.get_input_latency_stats()
+            latency_text = f"input->present: {latency['avg']:.1f}ms (max {latency['max']:.1f})"
+            latency_surface = self._font.render(latency_text, True, (255, 255, 255))
+            surface.blit(latency_surface, (10, y))
+            y += 25
+
+        for generation, stats in self.get_gc_stats().items():
+            gc_text = f"gc{generation}: {stats['count']:.0f}x max {stats['max']:.2f}ms"
+            gc_surface = self._font.render(gc_text, True, (255, 255, 255))
+            surface.blit(gc_surface, (10, y))
+            y += 25
+
     def toggle_metrics_display(self) -> None:
         """Toggle the display of performance metrics."""
         self.show_metrics = not self.show_metrics
@@ -130,6 +424,12 @@ class PerformanceMonitor:
         """Clear all performance data."""
         self.frame_times.clear()
         self.section_times.clear()
+        self.frame_allocations.clear()
+        self.input_latencies.clear()
+        self._last_allocated_blocks = None
+        for generation in self.gc_pauses:
+            self.gc_pauses[generation].clear()
+            self.gc_collections[generation] = 0
 
 
 # Global performance monitor instance
@@ -0,0 +1,68 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+
+class StartupTracer:
+    """Records how long each phase of game startup takes."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.start_time = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+        self.first_frame_time: Optional[float] = None
+
+    def enable(self) -> None:
+        """Start tracing startup phases."""
+        self.enabled = True
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a startup phase.
+
+        Args:
+            name: Name of the phase shown in the report
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def mark_first_frame(self) -> bool:
+        """
+        Record that the first frame has been presented.
+
+        Returns:
+            True the first time it is called while tracing, False afterwards
+        """
+        if not self.enabled or self.first_frame_time is not None:
+            return False
+
+        self.first_frame_time = time.perf_counter()
+        return True
+
+    def report(self) -> List[str]:
+        """
+        Build a human readable startup report.
+
+        Returns:
+            List of report lines, slowest phases first
+        """
+        lines = []
+        for name, elapsed in sorted(self.phases, key=lambda phase: phase[1], reverse=True):
+            lines.append(f"{name}: {elapsed * 1000:.1f}ms")
+
+        if self.first_frame_time is not None:
+            total = self.first_frame_time - self.start_time
+            lines.append(f"time to first frame: {total * 1000:.1f}ms")
+        return lines
+
+
+# Global startup tracer instance
+startup = StartupTracer()
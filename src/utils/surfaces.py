@@ -0,0 +1,181 @@
+import os
+import sys
+from collections import Counter
+from typing import Optional, Sequence, Tuple
+
+import pygame
+from .logger import GameLogger
+
+Color = Sequence[int]
+
+
+def is_display_format(surface: pygame.Surface) -> bool:
+    """
+    Check whether a surface can be blitted to the display without converting pixels.
+
+    Surfaces match when they share the display's bit depth and color masks;
+    an extra alpha channel from convert_alpha() still counts as a match.
+    Always True while no display mode is set.
+    """
+    display = pygame.display.get_surface()
+    if display is None:
+        return True
+    return (
+        surface.get_bitsize() == display.get_bitsize()
+        and surface.get_masks()[:3] == display.get_masks()[:3]
+    )
+
+
+def optimize_surface(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Convert a surface to the display format, keeping per-pixel alpha if it has any.
+
+    Returns the surface unchanged while no display mode is set.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_masks()[3]:  # Per-pixel alpha; SRCALPHA is also set by set_alpha()
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def create_surface(
+    size: Tuple[int, int],
+    color: Optional[Color] = None,
+    alpha: Optional[int] = None,
+    per_pixel_alpha: bool = False,
+) -> pygame.Surface:
+    """
+    Create a surface in the display format.
+
+    Prefer a uniform alpha over per-pixel alpha: a translucent fill such as
+    (0, 0, 0, 128) becomes an opaque surface blitted with set_alpha(128),
+    which blends faster than a per-pixel alpha surface.
+
+    Args:
+        size: Width and height
+        color: Fill color; a fourth component is applied as surface alpha
+        alpha: Surface alpha (0-255), overriding the color's alpha
+        per_pixel_alpha: Create a transparent surface with an alpha channel instead,
+            for content with varying transparency
+
+    Returns:
+        The new surface
+    """
+    if per_pixel_alpha:
+        surface = optimize_surface(pygame.Surface(size, pygame.SRCALPHA))
+        if color is not None:
+            surface.fill(color)
+        return surface
+
+    surface = optimize_surface(pygame.Surface(size))
+    if color is not None:
+        surface.fill(color[:3])
+        if len(color) == 4 and alpha is None:
+            alpha = color[3]
+    if alpha is not None and alpha < 255:
+        surface.set_alpha(alpha)
+    return surface
+
+
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: Color,
+    antialias: bool = True,
+    background: Optional[Color] = None,
+) -> pygame.Surface:
+    """
+    Render text into a display-format surface.
+
+    Args:
+        font: Font to render with
+        text: Text to render
+        color: Text color
+        antialias: Smooth the glyph edges
+        background: Opaque background color; None leaves it transparent
+
+    Returns:
+        The rendered text
+    """
+    return optimize_surface(font.render(text, antialias, color, background))
+
+
+class AuditSurface(pygame.Surface):
+    """Surface that reports blits of sources not in the display format."""
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if not is_display_format(source):
+            surface_audit.record(source)
+        return super().blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        for item in blit_sequence:
+            if not is_display_format(item[0]):
+                surface_audit.record(item[0])
+        return super().blits(blit_sequence, doreturn)
+
+
+class SurfaceAudit:
+    """Counts blits of non-display-format surfaces per call site."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.logger = GameLogger.get_logger("SurfaceAudit")
+        self.frame_counts: Counter = Counter()  # Call site -> offending blits this frame
+        self.total_counts: Counter = Counter()  # Call site -> offending blits this session
+        self.frames_with_offenders = 0
+
+    def enable(self) -> None:
+        """Start auditing; the display then renders through an AuditSurface."""
+        self.enabled = True
+        self.logger.info("Surface format audit enabled")
+
+    def disable(self) -> None:
+        """Stop auditing."""
+        self.enabled = False
+
+    def record(self, source: pygame.Surface) -> None:
+        """Count an offending blit against the code that issued it."""
+        # Skip this method and the AuditSurface blit wrapper
+        frame = sys._getframe(2)
+        site = (
+            f"{os.path.relpath(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+        )
+        if site not in self.total_counts:
+            self.logger.warning(
+                "Blit of %d-bit %s surface at %s; convert it to the display format",
+                source.get_bitsize(),
+                "per-pixel alpha" if source.get_masks()[3] else "opaque",
+                site,
+            )
+        self.frame_counts[site] += 1
+        self.total_counts[site] += 1
+
+    def end_frame(self) -> None:
+        """Log the frame's offending blits by call site, then reset the frame counts."""
+        if not self.frame_counts:
+            return
+        self.frames_with_offenders += 1
+        self.logger.debug(
+            "Frame blitted %d non-display-format surfaces: %s",
+            sum(self.frame_counts.values()),
+            ", ".join(f"{site} x{count}" for site, count in self.frame_counts.most_common()),
+        )
+        self.frame_counts.clear()
+
+    def report(self, limit: int = 10) -> None:
+        """Log the call sites with the most offending blits this session."""
+        if not self.total_counts:
+            self.logger.info("No blits of non-display-format surfaces")
+            return
+        self.logger.info(
+            "Non-display-format blits in %d frames; top call sites:", self.frames_with_offenders
+        )
+        for site, count in self.total_counts.most_common(limit):
+            self.logger.info("  %6d  %s", count, site)
+
+
+# Global surface audit instance
+surface_audit = SurfaceAudit()
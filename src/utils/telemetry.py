@@ -0,0 +1,207 @@
+import json
+import os
+import struct
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Record formats
+FORMAT_JSONL = "jsonl"  # One compact JSON object per line
+FORMAT_BINARY = "binary"  # Little-endian uint32 length prefix followed by a JSON payload
+
+TELEMETRY_VERSION = 1
+BINARY_MAGIC = b"PGTL"  # Marks the start of a binary telemetry file
+_LENGTH_PREFIX = struct.Struct("<I")
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    """Encode a record as compact JSON."""
+    return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+
+class TelemetryWriter:
+    """Writes structured telemetry records to a size-rotated file."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.format = FORMAT_JSONL
+        self.max_bytes = 0
+        self.backup_count = 0
+        self.session_id: Optional[str] = None
+        self.records_written = 0
+        self._file = None
+        self._bytes_written = 0
+
+    def open(
+        self,
+        path: str,
+        format: str = FORMAT_JSONL,
+        max_bytes: int = 64 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        """
+        Start writing telemetry.
+
+        Args:
+            path: Path of the active telemetry file
+            format: FORMAT_JSONL or FORMAT_BINARY
+            max_bytes: Size at which the file is rotated (0 disables rotation)
+            backup_count: Number of rotated files to keep
+        """
+        if format not in (FORMAT_JSONL, FORMAT_BINARY):
+            raise ValueError(f"Unknown telemetry format '{format}'")
+
+        self.close()
+        self.path = path
+        self.format = format
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.session_id = uuid.uuid4().hex[:12]
+        self.records_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open_file()
+        self.enabled = True
+
+    def _open_file(self) -> None:
+        """Open the active file and write the session header."""
+        self._file = open(self.path, "ab")
+        self._bytes_written = self._file.tell()
+        if self.format == FORMAT_BINARY and self._bytes_written == 0:
+            self._file.write(BINARY_MAGIC)
+            self._bytes_written += len(BINARY_MAGIC)
+        # Every file starts with a header so rotated files can be read on their own
+        self._write(
+            {
+                "k": "session",
+                "id": self.session_id,
+                "v": TELEMETRY_VERSION,
+                "t": round(time.time(), 3),
+            }
+        )
+
+    def record(self, kind: str, **fields: Any) -> None:
+        """
+        Write a single record.
+
+        Args:
+            kind: Record type, such as "frame", "scene" or "match"
+            **fields: JSON serializable record fields
+        """
+        if not self.enabled:
+            return
+
+        fields["k"] = kind
+        fields["t"] = round(time.time(), 3)
+        self._write(fields)
+        self.records_written += 1
+
+        if self.max_bytes and self._bytes_written >= self.max_bytes:
+            self._rotate()
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        """Encode and write a record in the configured format."""
+        payload = _encode(record)
+        if self.format == FORMAT_BINARY:
+            data = _LENGTH_PREFIX.pack(len(payload)) + payload
+        else:
+            data = payload + b"\n"
+        self._file.write(data)
+        self._bytes_written += len(data)
+
+    def _rotate(self) -> None:
+        """Rotate the active file the same way RotatingFileHandler does."""
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open_file()
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        if self._file:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Stop writing telemetry and close the file."""
+        if self._file:
+            self._file.close()
+            self._file = None
+        self.enabled = False
+
+
+def rotated_files(path: str) -> List[str]:
+    """
+    List a telemetry file and its rotated backups, oldest first.
+
+    Args:
+        path: Path of the active telemetry file
+
+    Returns:
+        Existing file paths in chronological order
+    """
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        backups.append(f"{path}.{index}")
+        index += 1
+    files = list(reversed(backups))
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def _read_binary(f) -> Iterator[Dict[str, Any]]:
+    """Yield records from a length-prefixed binary stream."""
+    while True:
+        header = f.read(_LENGTH_PREFIX.size)
+        if len(header) < _LENGTH_PREFIX.size:
+            return
+        (length,) = _LENGTH_PREFIX.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length:
+            return  # Truncated final record from an interrupted session
+        yield json.loads(payload)
+
+
+def _read_jsonl(f) -> Iterator[Dict[str, Any]]:
+    """Yield records from a JSONL stream, skipping a truncated final line."""
+    for line in f:
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+
+def read_records(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from telemetry files one at a time.
+
+    The format of each file is detected from its header, so JSONL and
+    binary files can be mixed.
+
+    Args:
+        paths: Telemetry files in chronological order
+
+    Yields:
+        Decoded records
+    """
+    for path in paths:
+        with open(path, "rb") as f:
+            if f.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+                yield from _read_binary(f)
+            else:
+                f.seek(0)
+                yield from _read_jsonl(f)
+
+
+# Global telemetry writer instance
+telemetry = TelemetryWriter()
@@ -0,0 +1,209 @@
+"""Offline analyzer for telemetry files written by TelemetryWriter.
+
+Records are streamed through a generator pipeline, so memory use stays
+constant no matter how large the input is.
+
+Usage:
+    python -m src.utils.telemetry_analyzer logs/telemetry.jsonl [--hitch-ms 33.3] [--json]
+"""
+
+import argparse
+import heapq
+import json
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.telemetry import read_records, rotated_files
+
+
+class FrameHistogram:
+    """Fixed-size frame time histogram used for streaming percentiles."""
+
+    BUCKET_MS = 0.25
+    MAX_MS = 1000.0
+
+    def __init__(self) -> None:
+        self.counts = [0] * (int(self.MAX_MS / self.BUCKET_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float) -> None:
+        """Add a frame time in milliseconds."""
+        index = min(int(ms / self.BUCKET_MS), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def percentile(self, percent: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Upper edge of the bucket containing the percentile, in milliseconds
+        """
+        if self.count == 0:
+            return 0.0
+
+        target = self.count * percent / 100.0
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min((index + 1) * self.BUCKET_MS, self.max)
+        return self.max
+
+
+class SessionReport:
+    """Accumulates statistics for a single game session."""
+
+    def __init__(self, session_id: str, hitch_ms: float, top: int) -> None:
+        self.session_id = session_id
+        self.hitch_ms = hitch_ms
+        self.top = top
+        self.frames = FrameHistogram()
+        self.sections: Dict[str, FrameHistogram] = {}
+        self.hitches = 0
+        self.worst: List[Tuple[float, int, Optional[str]]] = []  # Min-heap of the worst frames
+        self.scene: Optional[str] = None
+        self.scene_switches = 0
+        self.matches = 0
+        self.wins = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold a record into the session statistics."""
+        kind = record.get("k")
+        if kind == "frame":
+            self._add_frame(record)
+        elif kind == "scene":
+            self.scene = record.get("to")
+            self.scene_switches += 1
+        elif kind == "match":
+            self.matches += 1
+            self.wins += bool(record.get("won"))
+
+    def _add_frame(self, record: Dict[str, Any]) -> None:
+        """Record frame and section times."""
+        dt = record.get("dt", 0.0)
+        frame_index = self.frames.count
+        self.frames.add(dt)
+
+        for name, ms in record.get("s", {}).items():
+            histogram = self.sections.get(name)
+            if histogram is None:
+                histogram = self.sections[name] = FrameHistogram()
+            histogram.add(ms)
+
+        if dt >= self.hitch_ms:
+            self.hitches += 1
+            entry = (dt, frame_index, self.scene)
+            if len(self.worst) < self.top:
+                heapq.heappush(self.worst, entry)
+            elif entry > self.worst[0]:
+                heapq.heapreplace(self.worst, entry)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the session."""
+        frames = self.frames
+        return {
+            "session": self.session_id,
+            "frames": frames.count,
+            "avg_ms": frames.total / frames.count if frames.count else 0.0,
+            "p50_ms": frames.percentile(50),
+            "p95_ms": frames.percentile(95),
+            "p99_ms": frames.percentile(99),
+            "max_ms": frames.max,
+            "sections_p95_ms": {
+                name: histogram.percentile(95) for name, histogram in sorted(self.sections.items())
+            },
+            "hitches": self.hitches,
+            "worst_frames": [
+                {"dt_ms": dt, "frame": index, "scene": scene}
+                for dt, index, scene in sorted(self.worst, reverse=True)
+            ],
+            "scene_switches": self.scene_switches,
+            "matches": self.matches,
+            "wins": self.wins,
+        }
+
+
+def tag_sessions(records: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Pair every record with the id of the session it belongs to."""
+    session_id = "unknown"
+    for record in records:
+        if record.get("k") == "session":
+            session_id = record.get("id", session_id)
+            continue
+        yield session_id, record
+
+
+def analyze(
+    records: Iterable[Dict[str, Any]], hitch_ms: float = 33.3, top: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Build per-session reports from a stream of records.
+
+    Args:
+        records: Telemetry records in chronological order
+        hitch_ms: Frame time at or above which a frame counts as a hitch
+        top: Number of worst frames to keep per session
+
+    Returns:
+        One summary dictionary per session, in the order sessions first appear
+    """
+    sessions: Dict[str, SessionReport] = {}
+    for session_id, record in tag_sessions(records):
+        report = sessions.get(session_id)
+        if report is None:
+            report = sessions[session_id] = SessionReport(session_id, hitch_ms, top)
+        report.add(record)
+    return [report.to_dict() for report in sessions.values()]
+
+
+def expand_paths(paths: Iterable[str]) -> Iterator[str]:
+    """Expand each active telemetry file into itself plus its rotated backups."""
+    for path in paths:
+        yield from rotated_files(path) or [path]
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """Format a session summary as text."""
+    lines = [
+        f"Session {summary['session']}: {summary['frames']} frames",
+        f"  frame time avg {summary['avg_ms']:.2f}ms  p50 {summary['p50_ms']:.2f}ms  "
+        f"p95 {summary['p95_ms']:.2f}ms  p99 {summary['p99_ms']:.2f}ms  "
+        f"max {summary['max_ms']:.2f}ms",
+        f"  hitches: {summary['hitches']}  scene switches: {summary['scene_switches']}  "
+        f"matches: {summary['matches']} ({summary['wins']} won)",
+    ]
+    for name, p95 in summary["sections_p95_ms"].items():
+        lines.append(f"  {name} p95 {p95:.2f}ms")
+    for frame in summary["worst_frames"]:
+        lines.append(f"  hitch {frame['dt_ms']:.2f}ms at frame {frame['frame']} ({frame['scene']})")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Summarize telemetry files per session.")
+    parser.add_argument("paths", nargs="+", help="Telemetry files (rotated backups are included)")
+    parser.add_argument("--hitch-ms", type=float, default=33.3, help="Hitch threshold in ms")
+    parser.add_argument("--top", type=int, default=10, help="Worst frames listed per session")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    summaries = analyze(read_records(expand_paths(args.paths)), args.hitch_ms, args.top)
+    if args.json:
+        print(json.dumps(summaries, indent=4))
+    else:
+        print("\n\n".join(format_report(summary) for summary in summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
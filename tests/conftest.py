@@ -21,7 +21,9 @@ def test_logger():
 
 
 @pytest.fixture
-def mock_engine():
-    """Create a mock game engine instance."""
-    engine = Engine(width=800, height=600, title="Test Engine")
+def mock_engine(tmp_path):
+    """Create a mock game engine instance that keeps its settings file out of the project."""
+    engine = Engine(
+        width=800, height=600, title="Test Engine", settings_file=str(tmp_path / "settings.json")
+    )
     return engine
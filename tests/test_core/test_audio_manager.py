@@ -0,0 +1,99 @@
+"""Test suite for the audio manager."""
+
+import os
+
+import pygame
+import pytest
+from config.settings import Settings
+from src.core.audio_manager import AudioManager, numpy
+from src.core.resource_manager import ResourceManager
+
+
+@pytest.fixture
+def audio():
+    """Create an audio manager with a loaded click sound."""
+    pygame.mixer.init()
+    resources = ResourceManager()
+    resources.load_sound("click", os.path.join("assets", "sounds", "ui_sounds", "click-a.ogg"))
+    manager = AudioManager(resources, Settings(), categories={"ui": 1, "sfx": 2})
+    manager.initialize()
+    yield manager
+    manager.stop()
+    pygame.mixer.set_reserved(0)
+
+
+def test_categories_get_separate_channels(audio):
+    """Test that each category plays on its own reserved channels."""
+    assert len(audio.pools["ui"]) == 1
+    assert len(audio.pools["sfx"]) == 2
+    channel = audio.play("click", "ui")
+    assert channel in audio.pools["ui"]
+
+
+def test_volume_settings_are_applied(audio):
+    """Test that master and effects volume scale the channel volume."""
+    audio.settings.master_volume = 0.5
+    audio.settings.sfx_volume = 0.5
+    channel = audio.play("click", volume=0.8)
+    assert channel.get_volume() == pytest.approx(0.2, abs=0.01)
+
+
+def test_retrigger_and_instance_limits(audio):
+    """Test that rapid repeats of one sound are throttled."""
+    assert audio.play("click") is not None
+    assert audio.play("click") is None
+    assert audio.stats["throttled"] == 1
+
+    audio.retrigger_interval = 0
+    audio.max_instances = 1
+    if audio.pools["sfx"][0].get_busy():
+        assert audio.play("click") is None
+        assert audio.stats["throttled"] == 2
+
+
+def test_full_pool_steals_oldest_channel(audio):
+    """Test that a full pool reuses its longest-playing channel."""
+    audio.retrigger_interval = 0
+    audio.max_instances = 10
+    channels = [audio.play("click", "ui") for _ in range(3)]
+    assert all(channel is audio.pools["ui"][0] for channel in channels)
+    if channels[0].get_busy():
+        assert audio.stats["stolen"] >= 1
+
+
+def test_disabled_and_missing_sounds(audio):
+    """Test that nothing plays when effects are off or the sound is unknown."""
+    assert audio.play("unknown") is None
+    assert audio.stats["missing"] == 1
+    audio.settings.sfx_enabled = False
+    assert audio.play("click") is None
+
+
+@pytest.mark.skipif(numpy is None, reason="pitch variants need NumPy")
+def test_prepared_pitches_are_ready_at_once(audio):
+    """Test that prepared pitch steps are resampled up front and shared by nearby pitches."""
+    audio.prepare_pitches("click", 0.9, 1.1)
+    assert audio.get_stats()["variants"] == 4
+
+    base = audio.get_sound("click")
+    higher = audio.get_sound("click", 1.07)
+    assert higher is not base
+    assert higher.get_length() < base.get_length()
+    assert audio.get_sound("click", 1.04) is higher
+
+
+@pytest.mark.skipif(numpy is None, reason="pitch variants need NumPy")
+def test_unprepared_pitch_resamples_in_background(audio):
+    """Test that an unprepared pitch plays unpitched until its variant is ready."""
+    base = audio.get_sound("click")
+    assert audio.get_sound("click", 1.5) is base
+    audio._pending[("click", 1.5)].result()
+
+    higher = audio.get_sound("click", 1.51)
+    assert higher is not base
+    assert higher.get_length() < base.get_length()
+    assert audio.get_stats()["variants"] == 1
+
+    audio.discard_variants("click")
+    assert audio.get_stats()["variants"] == 0
+    audio.close()
@@ -0,0 +1,110 @@
+"""Test suite for the logical framebuffer and its presentation."""
+
+import pygame
+import pytest
+from config.settings import Settings
+from src.core.display import Display
+
+
+@pytest.fixture
+def display():
+    """Create a display with an 80x60 logical resolution."""
+    pygame.display.init()
+    settings = Settings()
+    settings.vsync = False
+    return Display(settings, 80, 60, "Test")
+
+
+def open_window(display, monkeypatch, window_size):
+    """Open the display with set_mode forced to return a window of the given size."""
+    real_set_mode = pygame.display.set_mode
+    monkeypatch.setattr(
+        pygame.display, "set_mode", lambda size, flags=0, **kwargs: real_set_mode(window_size)
+    )
+    monkeypatch.setattr(pygame.display, "get_surface", lambda: display.window)
+    display.open(fullscreen=False)
+
+
+def test_vsync_falls_back_when_unsupported(display, monkeypatch):
+    """Test that the window is created without vsync if the driver refuses it."""
+    calls = []
+
+    def set_mode(size, flags=0, **kwargs):
+        calls.append(kwargs)
+        if kwargs.get("vsync"):
+            raise pygame.error("vsync not supported")
+        return pygame.Surface(size)
+
+    display.settings.vsync = True
+    monkeypatch.setattr(pygame.display, "set_mode", set_mode)
+    screen = display.set_mode((320, 240))
+
+    assert screen.get_size() == (320, 240)
+    assert calls == [{"vsync": 1}, {}]
+
+
+def test_matching_window_is_drawn_directly(display, monkeypatch):
+    """Test that no framebuffer or scaling is used when the window is the logical size."""
+    display.settings.scaling = "smooth"
+    open_window(display, monkeypatch, (80, 60))
+
+    assert display.surface is display.window
+    assert not display.mapped
+
+
+def test_smooth_scaling_letterboxes_and_maps_pointer(display, monkeypatch):
+    """Test that the frame keeps its aspect ratio and mouse events are converted."""
+    display.settings.scaling = "smooth"
+    open_window(display, monkeypatch, (200, 120))
+
+    assert display.surface.get_size() == (80, 60)
+    assert display.viewport == pygame.Rect(20, 0, 160, 120)
+
+    display.surface.fill((255, 0, 0))
+    display.present()
+    assert display.window.get_at((100, 60))[:3] == (255, 0, 0)
+    assert display.window.get_at((5, 60))[:3] == (0, 0, 0)
+
+    event = pygame.event.Event(
+        pygame.MOUSEMOTION, {"pos": (100, 60), "rel": (4, 2), "buttons": (0, 0, 0)}
+    )
+    mapped = display.map_event(event)
+    assert mapped.pos == (40, 30)
+    assert mapped.rel == (2, 1)
+
+
+def test_integer_scaling_uses_whole_factors(display, monkeypatch):
+    """Test that integer scaling picks the largest whole factor that fits."""
+    display.settings.scaling = "integer"
+    open_window(display, monkeypatch, (250, 130))
+
+    assert display.viewport.size == (160, 120)
+    assert display.to_logical(display.viewport.topleft) == (0, 0)
+
+
+def test_none_scaling_follows_the_window(display, monkeypatch):
+    """Test that without scaling the logical size is the window size."""
+    display.settings.scaling = "none"
+    open_window(display, monkeypatch, (200, 120))
+
+    assert display.logical_size == (200, 120)
+    assert display.surface is display.window
+
+
+def test_dynamic_resolution_steps_quality(display, monkeypatch):
+    """Test that slow frames switch to cheaper upscaling and fast ones switch back."""
+    display.settings.scaling = "smooth"
+    open_window(display, monkeypatch, (250, 130))
+    assert display.get_filter() == "smooth"
+
+    for _ in range(30):
+        display.adapt_quality(0.02, 1 / 60)
+    assert display.get_filter() == "nearest"
+    for _ in range(30):
+        display.adapt_quality(0.02, 1 / 60)
+    assert display.get_filter() == "integer"
+    assert display.viewport.size == (160, 120)
+
+    for _ in range(600):
+        display.adapt_quality(0.001, 1 / 60)
+    assert display.get_filter() == "smooth"
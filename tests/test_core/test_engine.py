@@ -25,6 +25,21 @@ def test_engine_settings(mock_engine):
     assert mock_engine.settings.fullscreen is False
 
 
+def test_saved_settings_are_loaded(tmp_path):
+    """Test that settings saved on exit are read back by the next engine."""
+    path = str(tmp_path / "settings.json")
+    first = Engine(settings_file=path)
+    first.settings.scaling = "smooth"
+    first.settings.post_effects = ["vignette"]
+    first.settings.key_bindings["pause"] = pygame.K_p
+    first.settings.save(first.settings_file)
+
+    settings = Engine(settings_file=path).settings
+    assert settings.scaling == "smooth"
+    assert settings.post_effects == ["vignette"]
+    assert settings.key_bindings["pause"] == pygame.K_p
+
+
 def test_debug_logging_toggle(mock_engine):
     """Test debug logging toggle functionality."""
     initial_level = mock_engine.logger.level
@@ -62,3 +77,46 @@ def test_event_handling(mock_engine, monkeypatch):
 def mock_pygame_quit(mocker):
     """Mock pygame.quit to avoid actual cleanup."""
     return mocker.patch("pygame.quit")
+
+
+def test_low_latency_wait_samples_input_late(mock_engine):
+    """Test that the low-latency loop sleeps until only the frame's work is left."""
+    import time
+
+    mock_engine.settings.fps_limit = 50  # 20 ms frames
+    mock_engine.work_estimate = 0.008
+    mock_engine.last_present = time.perf_counter()
+
+    mock_engine.wait_for_input()
+    waited = time.perf_counter() - mock_engine.last_present
+
+    # 20 ms budget - 8 ms work - 2 ms margin
+    assert 0.009 <= waited < 0.02
+
+
+def test_idle_scene_waits_for_input(mock_engine, monkeypatch):
+    """Test that an idle scene blocks on the queue and keeps the waking event."""
+    from src.core import engine as engine_module
+    from src.scenes.scene import Scene
+
+    class StaticScene(Scene):
+        def is_idle(self):
+            return True
+
+    monkeypatch.setattr(engine_module, "IDLE_WAIT_MS", 10)
+    monkeypatch.setattr(engine_module.performance, "show_metrics", False)
+    mock_engine.scene_manager.add_scene("static", StaticScene(mock_engine))
+    mock_engine.scene_manager.switch_to("static")
+    assert not mock_engine.is_idle()  # Nothing presented yet
+
+    mock_engine.last_present = 0.0
+    assert mock_engine.is_idle()
+
+    pygame.display.init()
+    pygame.event.clear()
+    assert not mock_engine.wait_while_idle()
+
+    event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a, "mod": 0})
+    pygame.event.post(event)
+    assert mock_engine.wait_while_idle()
+    assert mock_engine.pending_events[0].key == pygame.K_a
@@ -0,0 +1,105 @@
+"""Test suite for event filtering and coalescing."""
+
+import pygame
+import pytest
+from src.core.event_filter import EventFilter, coalesce_events
+from src.scenes.scene import Scene, UI_EVENTS
+
+
+def motion(pos, rel, buttons=(0, 0, 0)):
+    return pygame.event.Event(pygame.MOUSEMOTION, {"pos": pos, "rel": rel, "buttons": buttons})
+
+
+def key(key_code):
+    return pygame.event.Event(pygame.KEYDOWN, {"key": key_code, "mod": 0})
+
+
+@pytest.fixture
+def event_filter():
+    """Create a filter and restore the blocked event types afterwards."""
+    pygame.display.init()
+    yield EventFilter()
+    pygame.event.set_allowed(None)
+
+
+def test_consecutive_motion_is_merged():
+    """Test that a burst of motion becomes one event with the summed rel."""
+    events = [
+        motion((10, 10), (1, 2)),
+        motion((13, 9), (3, -1)),
+        motion((15, 9), (2, 0), (1, 0, 0)),
+    ]
+    merged = coalesce_events(events)
+
+    assert len(merged) == 1
+    assert merged[0].type == pygame.MOUSEMOTION
+    assert merged[0].pos == (15, 9)
+    assert merged[0].rel == (6, 1)
+    assert merged[0].buttons == (1, 0, 0)
+
+
+def test_motion_is_not_merged_across_other_events():
+    """Test that coalescing keeps motion ordered around clicks and keys."""
+    events = [
+        motion((1, 1), (1, 1)),
+        key(pygame.K_a),
+        motion((2, 2), (1, 1)),
+        motion((3, 3), (1, 1)),
+    ]
+    merged = coalesce_events(events)
+
+    assert [event.type for event in merged] == [
+        pygame.MOUSEMOTION,
+        pygame.KEYDOWN,
+        pygame.MOUSEMOTION,
+    ]
+    assert merged[2].rel == (2, 2)
+
+
+def test_wheel_and_resize_are_coalesced():
+    """Test that wheel scroll is summed and only the last resize is kept."""
+    wheel = {"x": 0, "y": 1, "precise_x": 0.0, "precise_y": 1.0, "flipped": False}
+    events = [
+        pygame.event.Event(pygame.MOUSEWHEEL, wheel),
+        pygame.event.Event(pygame.MOUSEWHEEL, wheel),
+        pygame.event.Event(pygame.VIDEORESIZE, {"w": 640, "h": 480, "size": (640, 480)}),
+        pygame.event.Event(pygame.VIDEORESIZE, {"w": 800, "h": 600, "size": (800, 600)}),
+    ]
+    merged = coalesce_events(events)
+
+    assert len(merged) == 2
+    assert merged[0].y == 2
+    assert merged[0].precise_y == 2.0
+    assert merged[1].size == (800, 600)
+
+
+def test_process_counts_received_and_dispatched(event_filter):
+    """Test the per-frame and session event counters."""
+    event_filter.process([motion((1, 1), (1, 1)) for _ in range(5)] + [key(pygame.K_a)])
+    event_filter.process([key(pygame.K_b)])
+
+    stats = event_filter.get_stats()
+    assert stats["received"] == 7
+    assert stats["dispatched"] == 3
+    assert stats["frame_received"] == 1
+    assert stats["frame_dispatched"] == 1
+
+
+def test_apply_blocks_events_the_scene_ignores(event_filter):
+    """Test that the queue only keeps event types the active scene handles."""
+    scene = Scene(None)
+    scene.handled_events = frozenset()
+    event_filter.apply(scene)
+    assert pygame.event.get_blocked(pygame.MOUSEMOTION)
+    assert not pygame.event.get_blocked(pygame.KEYDOWN)
+    assert not pygame.event.get_blocked(pygame.QUIT)
+
+    menu = Scene(None)
+    menu.handled_events = UI_EVENTS
+    event_filter.apply(menu)
+    assert not pygame.event.get_blocked(pygame.MOUSEMOTION)
+    assert pygame.event.get_blocked(pygame.FINGERDOWN)
+
+    # Scenes that declare nothing receive everything
+    event_filter.apply(Scene(None))
+    assert not pygame.event.get_blocked(pygame.FINGERDOWN)
@@ -0,0 +1,61 @@
+"""Test suite for the hot-reload file watcher."""
+
+import os
+import time
+
+import pytest
+from src.core.file_watcher import FileWatcher
+
+
+def touch(path, content="x"):
+    """Write a file and push its modification time forward."""
+    with open(path, "w") as f:
+        f.write(content)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def asset_dir(tmp_path):
+    """Create a small asset tree."""
+    (tmp_path / "images").mkdir()
+    touch(tmp_path / "images" / "a.png")
+    touch(tmp_path / "notes.txt")
+    return tmp_path
+
+
+def test_check_reports_added_changed_and_removed(asset_dir):
+    """Test that scans diff file stats against the previous snapshot."""
+    watcher = FileWatcher([str(asset_dir)], extensions={".png", ".yaml"})
+    watcher._snapshot = watcher.scan()
+    assert watcher.poll_changes() == []
+
+    touch(asset_dir / "images" / "a.png", "changed")
+    touch(asset_dir / "menu.yaml")
+    touch(asset_dir / "notes.txt", "ignored")
+    watcher.check()
+    assert watcher.poll_changes() == sorted(
+        [str(asset_dir / "images" / "a.png"), str(asset_dir / "menu.yaml")]
+    )
+    assert watcher.poll_changes() == []
+
+    os.remove(asset_dir / "menu.yaml")
+    watcher.check()
+    assert watcher.poll_changes() == [str(asset_dir / "menu.yaml")]
+
+
+def test_background_thread_picks_up_changes(asset_dir):
+    """Test that the polling thread queues changes for the main thread."""
+    watcher = FileWatcher([str(asset_dir)], interval=0.01)
+    watcher.start()
+    try:
+        touch(asset_dir / "images" / "a.png", "changed")
+        deadline = time.time() + 2
+        changes = []
+        while not changes and time.time() < deadline:
+            changes = watcher.poll_changes()
+            time.sleep(0.01)
+        assert changes == [str(asset_dir / "images" / "a.png")]
+    finally:
+        watcher.stop()
+    assert not watcher.is_running()
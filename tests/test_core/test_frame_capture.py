@@ -0,0 +1,83 @@
+"""Test suite for offscreen rendering and frame capture."""
+
+import random
+
+import pygame
+import pytest
+from src.core.frame_capture import FrameWriter, create_capture_surface, frame_hash
+from src.scenes.scene import Scene
+
+
+class DriftScene(Scene):
+    """Square that starts at a random position and moves one pixel per tick."""
+
+    def enter(self):
+        self.x = random.randint(0, 20)
+        self.entered = getattr(self, "entered", 0) + 1
+
+    def update(self, dt):
+        self.x += 1
+
+    def render(self, surface):
+        surface.fill((255, 0, 0), (self.x, 5, 4, 4))
+
+
+@pytest.fixture
+def capture_engine(mock_engine):
+    """Create an engine with a small logical size and the drift scene registered."""
+    mock_engine.width, mock_engine.height = 40, 20
+    mock_engine.scene_manager.register_scene("drift", DriftScene)
+    return mock_engine
+
+
+def test_frame_hash_tracks_pixels():
+    """Test that equal frames hash equally and a single pixel changes the hash."""
+    first = create_capture_surface((16, 16))
+    second = create_capture_surface((16, 16))
+    assert frame_hash(first) == frame_hash(second)
+
+    second.set_at((3, 3), (1, 0, 0))
+    assert frame_hash(first) != frame_hash(second)
+
+
+def test_capture_is_deterministic(capture_engine):
+    """Test that a seeded capture repeats exactly and each tick differs."""
+    state = random.getstate()
+    hashes = capture_engine.capture_frames("drift", 5, seed=3)
+
+    assert capture_engine.capture_frames("drift", 5, seed=3) == hashes
+    assert len(set(hashes)) == 5
+    assert capture_engine.capture_frames("drift", 5, seed=5) != hashes
+    assert random.getstate() == state  # Game randomness is left untouched
+
+
+def test_capture_frame_matches_sequence(capture_engine):
+    """Test that a single tick renders the same frame as within a sequence."""
+    hashes = capture_engine.capture_frames("drift", 3, start=2)
+    frame = capture_engine.capture_frame("drift", tick=3)
+
+    assert frame.get_size() == (40, 20)
+    assert frame_hash(frame) == hashes[1]
+    assert capture_engine.scene_manager.get_scene("drift").entered == 2
+
+
+def test_frames_are_written_in_background(capture_engine, tmp_path):
+    """Test that every captured frame is saved and matches what was hashed."""
+    hashes = capture_engine.capture_frames("drift", 4, directory=str(tmp_path))
+
+    paths = sorted(tmp_path.iterdir())
+    assert [path.name for path in paths] == [f"frame_{tick:05d}.png" for tick in range(4)]
+    loaded = pygame.image.load(str(paths[2]))
+    frame = create_capture_surface(loaded.get_size())
+    frame.blit(loaded, (0, 0))
+    assert frame_hash(frame) == hashes[2]
+
+
+def test_writer_counts_failures(tmp_path):
+    """Test that a frame that cannot be written is counted, not raised."""
+    writer = FrameWriter(str(tmp_path), pattern="missing/{}.png")
+    with writer:
+        writer.submit(create_capture_surface((4, 4)), 0)
+
+    assert writer.written == 0
+    assert writer.failed == 1
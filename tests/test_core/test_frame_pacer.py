@@ -0,0 +1,69 @@
+"""Test suite for frame pacing."""
+
+import time
+
+import pytest
+from config.settings import Settings
+from src.core.frame_pacer import FramePacer
+
+
+@pytest.fixture
+def pacer():
+    """Create a frame pacer using hybrid sleep-then-spin waits."""
+    settings = Settings()
+    settings.frame_pacing = "hybrid"
+    return FramePacer(settings, idle_after=0.05)
+
+
+@pytest.mark.parametrize("mode", ["sdl", "busy_loop", "hybrid"])
+def test_tick_holds_the_frame_rate(pacer, mode):
+    """Test that every pacing mode waits out the frame interval."""
+    pacer.settings.frame_pacing = mode
+    pacer.tick(100)
+    start = time.perf_counter()
+    for _ in range(5):
+        pacer.tick(100)
+
+    assert time.perf_counter() - start >= 0.045
+    assert len(pacer.intervals) == 5
+
+
+def test_hybrid_sleep_until_is_precise(pacer):
+    """Test that the hybrid wait does not overshoot its deadline by much."""
+    deadline = time.perf_counter() + 0.01
+    pacer.sleep_until(deadline)
+    assert 0 <= time.perf_counter() - deadline < 0.002
+
+
+def test_idle_menus_are_capped(pacer):
+    """Test the adaptive cap for non-gameplay scenes without input."""
+    pacer.settings.fps_limit = 60
+    pacer.settings.idle_fps = 20
+    pacer.notify_activity()
+    assert pacer.get_frame_rate(gameplay=False) == 60
+
+    time.sleep(0.06)
+    assert pacer.get_frame_rate(gameplay=False) == 20
+    assert pacer.get_frame_rate(gameplay=True) == 60
+
+    pacer.notify_activity()
+    assert pacer.get_frame_rate(gameplay=False) == 60
+
+    pacer.settings.idle_fps = 0
+    time.sleep(0.06)
+    assert pacer.get_frame_rate(gameplay=False) == 60
+
+
+def test_jitter_stats(pacer):
+    """Test frame interval statistics."""
+    assert pacer.get_jitter_stats()["jitter"] == 0.0
+
+    pacer.intervals.extend([0.016, 0.017, 0.016, 0.030])
+    pacer.target = 1 / 60
+    stats = pacer.get_jitter_stats()
+
+    assert stats["target"] == pytest.approx(16.667, abs=0.001)
+    assert stats["avg"] == pytest.approx(19.75)
+    assert stats["max"] == pytest.approx(30.0)
+    assert stats["p99"] == pytest.approx(30.0)
+    assert stats["jitter"] > 5
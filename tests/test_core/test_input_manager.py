@@ -0,0 +1,96 @@
+"""Test suite for the input manager."""
+
+import pygame
+import pytest
+from config.settings import Settings
+from src.core.input_manager import InputManager
+
+
+def key(event_type, key_code):
+    return pygame.event.Event(event_type, {"key": key_code, "mod": 0})
+
+
+@pytest.fixture
+def input_manager():
+    """Create an input manager with default bindings."""
+    return InputManager(Settings())
+
+
+def test_pressed_held_released(input_manager):
+    """Test the per-frame action states for a key bound to an action."""
+    input_manager.begin_frame()
+    input_manager.process_event(key(pygame.KEYDOWN, pygame.K_w))
+    assert input_manager.is_pressed("move_up")
+    assert input_manager.is_held("move_up")
+
+    input_manager.begin_frame()
+    assert not input_manager.is_pressed("move_up")
+    assert input_manager.is_held("move_up")
+
+    input_manager.process_event(key(pygame.KEYUP, pygame.K_w))
+    assert input_manager.is_released("move_up")
+    assert not input_manager.is_held("move_up")
+
+
+def test_action_held_until_every_key_is_released(input_manager):
+    """Test that an action bound to two keys stays held while either is down."""
+    input_manager.process_event(key(pygame.KEYDOWN, pygame.K_UP))
+    input_manager.process_event(key(pygame.KEYDOWN, pygame.K_w))
+    input_manager.process_event(key(pygame.KEYUP, pygame.K_UP))
+    assert input_manager.is_held("move_up")
+    assert not input_manager.is_released("move_up")
+
+
+def test_bindings_are_rebuilt_when_settings_change(input_manager):
+    """Test that rebinding an action takes effect on the next frame."""
+    input_manager.settings.key_bindings["pause"] = pygame.K_p
+    input_manager.begin_frame()
+    input_manager.process_event(key(pygame.KEYDOWN, pygame.K_p))
+    assert input_manager.is_pressed("pause")
+
+
+def test_keys_added_to_binding_list_are_picked_up(input_manager):
+    """Test that appending a key to an action's key list in place rebinds it."""
+    input_manager.settings.key_bindings["move_up"].append(pygame.K_i)
+    input_manager.begin_frame()
+    input_manager.process_event(key(pygame.KEYDOWN, pygame.K_i))
+    assert input_manager.is_pressed("move_up")
+
+
+def test_joystick_hat_and_axis(input_manager):
+    """Test that gamepad hats and sticks drive the same actions."""
+    hat = pygame.event.Event(pygame.JOYHATMOTION, {"instance_id": 0, "hat": 0, "value": (0, 1)})
+    input_manager.process_event(hat)
+    assert input_manager.is_held("move_up")
+
+    centered = pygame.event.Event(
+        pygame.JOYHATMOTION, {"instance_id": 0, "hat": 0, "value": (0, 0)}
+    )
+    input_manager.process_event(centered)
+    assert not input_manager.is_held("move_up")
+
+    stick = pygame.event.Event(pygame.JOYAXISMOTION, {"instance_id": 0, "axis": 1, "value": 0.9})
+    input_manager.process_event(stick)
+    assert input_manager.is_held("move_down")
+
+
+def test_mouse_motion_is_coalesced(input_manager):
+    """Test that a frame's motion events collapse into one with summed rel."""
+    input_manager.begin_frame()
+    assert input_manager.get_mouse_motion() is None
+    for pos, rel in (((10, 10), (2, 0)), ((13, 14), (3, 4))):
+        input_manager.process_event(
+            pygame.event.Event(pygame.MOUSEMOTION, {"pos": pos, "rel": rel, "buttons": (0, 0, 0)})
+        )
+
+    motion = input_manager.get_mouse_motion()
+    assert motion.pos == (13, 14)
+    assert motion.rel == (5, 4)
+
+
+def test_reset_releases_everything(input_manager):
+    """Test that losing focus releases held actions."""
+    input_manager.process_event(key(pygame.KEYDOWN, pygame.K_SPACE))
+    input_manager.reset()
+    assert not input_manager.is_held("jump")
+    assert input_manager.is_released("jump")
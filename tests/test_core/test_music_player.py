@@ -0,0 +1,121 @@
+"""Test suite for streamed music playback."""
+
+import os
+import time
+
+import pygame
+import pytest
+from config.settings import Settings
+from src.core.music_player import MusicPlayer
+from src.core.resource_manager import ResourceManager
+
+TRACK = os.path.join("assets", "sounds", "ui_sounds", "click-a.ogg")
+
+
+@pytest.fixture
+def music():
+    """Create a music player with two registered tracks."""
+    pygame.mixer.init()
+    resources = ResourceManager()
+    resources.register_music("intro", TRACK)
+    resources.register_music("loop", TRACK)
+    player = MusicPlayer(resources, Settings())
+    player.initialize()
+    yield player
+    player.stop()
+    pygame.mixer.music.unload()
+
+
+def test_register_music_keeps_paths_only(music):
+    """Test that tracks are registered as paths rather than decoded sounds."""
+    resources = music.resource_manager
+    assert resources.music == {"intro": TRACK, "loop": TRACK}
+    assert resources.sounds == {}
+    assert not resources.register_music("missing", "missing.ogg")
+    assert resources.get_music_path("missing") is None
+
+
+def test_play_streams_and_ignores_repeat_requests(music):
+    """Test that playing the current track again does not restart it."""
+    music.play("intro", fade_ms=0)
+    assert music.current == "intro"
+    assert pygame.mixer.music.get_busy()
+
+    music.play("intro")
+    assert music._next is None
+
+
+def test_switching_fades_out_before_next_track(music):
+    """Test that a new track starts when the previous one has faded out."""
+    music.play("intro", fade_ms=0)
+    music.play("loop", fade_ms=100)
+    assert music._next == ("loop", -1, 100)
+
+    music.handle_event(pygame.event.Event(music.end_event))
+    assert music._next is None
+    assert music.current == "loop"
+
+
+def test_playlist_advances_on_track_end(music):
+    """Test that playlists move to the queued track and wrap around."""
+    music.play_playlist(["intro", "loop"], fade_ms=0)
+    assert music.current == "intro"
+
+    music.handle_event(pygame.event.Event(music.end_event))
+    assert music.current == "loop"
+    music.handle_event(pygame.event.Event(music.end_event))
+    assert music.current == "intro"
+
+
+def test_disabled_music_remembers_track(music):
+    """Test that a track requested while music is off starts when resumed."""
+    music.settings.music_enabled = False
+    music.play("intro")
+    assert not pygame.mixer.music.get_busy()
+
+    music.settings.music_enabled = True
+    music.unpause()
+    assert pygame.mixer.music.get_busy()
+
+
+def test_track_requested_before_mixer_init_starts_later(music):
+    """Test that a scene entered before the mixer is running gets its music."""
+    music.stop()
+    pygame.mixer.quit()
+    music.play("intro")
+    music.play("intro")
+    assert music.current == "intro"
+
+    pygame.mixer.init()
+    music.initialize()
+    assert pygame.mixer.music.get_busy()
+
+
+def test_scene_change_while_disabled_starts_new_track(music):
+    """Test that re-enabling music plays the track wanted now, not the one paused."""
+    music.play("intro", fade_ms=0)
+    music.settings.music_enabled = False
+    music.pause()
+    music.fadeout(fade_ms=50)
+    music.play("loop")
+    assert music.current == "loop"
+    assert not music.paused
+
+    music.settings.music_enabled = True
+    music.unpause()
+    time.sleep(0.2)  # Long enough for a resumed fade-out to have finished
+    assert pygame.mixer.music.get_busy()
+
+
+def test_controls_are_safe_without_mixer(music):
+    """Test that the options controls do nothing rather than fail when there is no audio device."""
+    music.stop()
+    pygame.mixer.quit()
+    music.play("intro")
+
+    music.apply_volume()
+    music.pause()
+    music.unpause()
+    assert not music.paused
+    assert music.current == "intro"
+    pygame.mixer.init()
@@ -0,0 +1,98 @@
+"""Test suite for the post-processing effects."""
+
+import pygame
+import pytest
+from config.settings import Settings
+from src.core.post_process import PostProcessor, numpy
+
+pytestmark = pytest.mark.skipif(numpy is None, reason="post effects need NumPy")
+
+
+def make_processor(effects, workers=1):
+    """Create a post-processor with the given effects enabled."""
+    settings = Settings()
+    settings.post_effects = effects
+    return PostProcessor(settings, workers)
+
+
+def make_frame(color=(100, 100, 100), size=(64, 48)):
+    """Create a 32-bit frame filled with one color."""
+    frame = pygame.Surface(size, 0, 32)
+    frame.fill(color)
+    return frame
+
+
+def test_disabled_without_effects():
+    """Test that the stage is skipped until an effect is chosen."""
+    assert not make_processor([]).is_enabled()
+    assert make_processor(["vignette"]).is_enabled()
+
+
+def test_scanlines_dim_odd_rows():
+    """Test that only odd rows lose brightness."""
+    frame = make_frame()
+    make_processor(["scanlines"]).apply(frame)
+
+    assert frame.get_at((10, 10))[:3] == (100, 100, 100)
+    assert frame.get_at((10, 11))[:3] == (75, 75, 75)
+
+
+def test_vignette_darkens_corners():
+    """Test that the center keeps its brightness while the corners fade."""
+    frame = make_frame((200, 200, 200))
+    make_processor(["vignette"]).apply(frame)
+
+    assert frame.get_at((32, 24)).r >= 198
+    assert frame.get_at((0, 0)).r < 100
+
+
+def test_bloom_spreads_light_into_dark_areas():
+    """Test that bright pixels glow onto their neighbours but not across the frame."""
+    frame = make_frame((0, 0, 0), (128, 96))
+    frame.fill((255, 255, 255), (56, 40, 16, 16))
+    make_processor(["bloom"]).apply(frame)
+
+    assert frame.get_at((52, 48)).r > 0
+    assert frame.get_at((64, 48)).r == 255
+    assert frame.get_at((0, 0)).r == 0
+
+
+def test_bands_match_single_pass():
+    """Test that splitting the frame across threads gives the same pixels."""
+    frames = []
+    for workers in (1, 3):
+        frame = make_frame((30, 30, 60), (160, 100))
+        pygame.draw.circle(frame, (255, 240, 200), (80, 50), 12)
+        processor = make_processor(["bloom", "vignette", "scanlines"], workers)
+        processor.apply(frame)
+        processor.close()
+        frames.append(pygame.image.tobytes(frame, "RGB"))
+
+    assert frames[0] == frames[1]
+
+
+def test_shake_offsets_frame_and_fades():
+    """Test that a shake moves the frame, blanks the uncovered edge and dies out."""
+    processor = make_processor(["shake"])
+    processor.shake(strength=6, duration=0.1)
+    processor.offset = (4, 0)
+    frame = make_frame()
+    frame.fill((255, 0, 0), (0, 0, 1, 48))
+    processor.apply(frame)
+
+    assert frame.get_at((0, 10))[:3] == (0, 0, 0)
+    assert frame.get_at((4, 10))[:3] == (255, 0, 0)
+
+    processor.update(0.2)
+    assert processor.offset == (0, 0)
+    processor.update(0.1)
+    assert processor.offset == (0, 0)
+
+
+def test_unsupported_depth_is_left_alone():
+    """Test that frames the kernels cannot view are skipped."""
+    frame = pygame.Surface((16, 16), 0, 16)
+    frame.fill((100, 100, 100))
+    make_processor(["scanlines"]).apply(frame)
+
+    assert frame.get_at((3, 3))[:3] == frame.get_at((3, 4))[:3]
@@ -7,9 +7,9 @@ from src.core.resource_manager import ResourceManager
 
 
 @pytest.fixture
-def resource_manager():
+def resource_manager(tmp_path):
     """Create a resource manager instance for testing."""
-    return ResourceManager()
+    return ResourceManager(sound_cache_dir=str(tmp_path / "sounds"))
 
 
 @pytest.fixture
@@ -78,3 +78,18 @@ def test_get_nonexistent_font(resource_manager):
     """Test retrieving a non-existent font."""
     font = resource_manager.get_font("nonexistent", 24)
     assert font is None
+
+
+def test_reload_path(resource_manager, test_sound_path, test_font_path):
+    """Test reloading every entry loaded from a changed file."""
+    old_sound = resource_manager.load_sound("click", test_sound_path)
+    resource_manager.load_font("future", test_font_path, 24)
+    resource_manager.load_font("future", test_font_path, 32)
+
+    reloaded = resource_manager.reload_path(test_sound_path)
+    assert [(kind, key) for kind, key, _ in reloaded] == [("sounds", "click")]
+    assert resource_manager.get_sound("click") is not old_sound
+
+    reloaded = resource_manager.reload_path(os.path.abspath(test_font_path))
+    assert [key for _, key, _ in reloaded] == [("future", 24), ("future", 32)]
+    assert resource_manager.reload_path("untracked.png") == []
@@ -117,3 +117,56 @@ def test_scene_render(scene_manager, mock_scene):
     surface = pygame.Surface((800, 600))
     scene_manager.render(surface)
     assert mock_scene.rendered
+
+
+def test_register_scene_is_lazy(scene_manager):
+    """Test that lazily registered scenes are only built on first switch."""
+    built = []
+
+    def factory(engine, label):
+        built.append(label)
+        return MockScene()
+
+    scene_manager.register_scene("lazy", factory, label="lazy")
+    assert scene_manager.has_scene("lazy")
+    assert "lazy" not in scene_manager.scenes
+    assert built == []
+
+    scene_manager.switch_to("lazy")
+    scene_manager.switch_to("lazy")
+
+    assert built == ["lazy"]
+    assert scene_manager.current_scene is scene_manager.scenes["lazy"]
+    assert scene_manager.current_scene.entered
+
+
+def test_register_scene_dotted_path(scene_manager):
+    """Test registering a scene by dotted import path."""
+    scene_manager.register_scene("base", "src.scenes.scene:Scene")
+    scene = scene_manager.get_scene("base")
+
+    assert isinstance(scene, Scene)
+    assert scene.engine is scene_manager.engine
+
+
+def test_get_unknown_scene(scene_manager):
+    """Test retrieving an unregistered scene."""
+    assert scene_manager.get_scene("missing") is None
+    assert not scene_manager.has_scene("missing")
+
+
+def test_lazy_scene_modules_are_bundled(mock_engine):
+    """Test that every scene module main.py registers by path is a hidden import of the build."""
+    from src.main import register_scenes
+
+    register_scenes(mock_engine)
+    modules = {
+        factory.partition(":")[0]
+        for factory, _, _ in mock_engine.scene_manager.scene_factories.values()
+        if isinstance(factory, str)
+    }
+    with open("pygame_template.spec") as f:
+        spec = f.read()
+
+    assert modules
+    assert all(f"'{module}'" in spec for module in modules)
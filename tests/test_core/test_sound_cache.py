@@ -0,0 +1,52 @@
+"""Test suite for the decoded sound cache."""
+
+import os
+
+import pygame
+import pytest
+from src.core.sound_cache import DecodedSoundCache
+
+SOUND_PATH = os.path.join("assets", "sounds", "ui_sounds", "click-a.ogg")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a sound cache in a temporary folder."""
+    pygame.mixer.init()
+    return DecodedSoundCache(str(tmp_path / "sounds"))
+
+
+def test_second_load_reads_cached_samples(cache, monkeypatch):
+    """Test that a cached sound is rebuilt from its samples without decoding."""
+    decoded = cache.load(SOUND_PATH)
+    assert cache.misses == 1
+    assert os.path.getsize(cache.get_cache_path(SOUND_PATH)) == len(decoded.get_raw())
+
+    real_sound = pygame.mixer.Sound
+
+    def no_decode(*args, **kwargs):
+        assert not args and "file" not in kwargs, "sound was decoded again"
+        return real_sound(**kwargs)
+
+    monkeypatch.setattr(pygame.mixer, "Sound", no_decode)
+    cached = cache.load(SOUND_PATH)
+    assert cache.hits == 1
+    assert cached.get_raw() == decoded.get_raw()
+
+
+def test_key_includes_mixer_format(cache):
+    """Test that cache entries are separated by mixer format."""
+    path = cache.get_cache_path(SOUND_PATH)
+    frequency, size, channels = pygame.mixer.get_init()
+    assert path.endswith(f"-{frequency}-{size}-{channels}.pcm")
+
+
+def test_unreadable_entry_falls_back_to_decoding(cache):
+    """Test that an empty cache file is ignored and replaced."""
+    cache_path = cache.get_cache_path(SOUND_PATH)
+    os.makedirs(os.path.dirname(cache_path))
+    open(cache_path, "wb").close()
+
+    sound = cache.load(SOUND_PATH)
+    assert cache.misses == 1
+    assert os.path.getsize(cache_path) == len(sound.get_raw())
@@ -0,0 +1,84 @@
+"""Test suite for the array-backed particle emitters."""
+
+import random
+
+import pygame
+import pytest
+from src.objects.particles import ParticleEmitter, numpy
+
+pytestmark = pytest.mark.skipif(numpy is None, reason="particles need NumPy")
+
+
+def test_emit_respects_capacity():
+    """Test that bursts beyond the capacity are dropped and counted."""
+    emitter = ParticleEmitter(100, [(255, 255, 255)])
+
+    assert emitter.emit(60, (0, 0)) == 60
+    assert emitter.emit(60, (0, 0)) == 40
+    assert emitter.count == 100
+    assert emitter.dropped == 20
+
+
+def test_update_moves_and_expires_particles():
+    """Test that particles move by their velocity and expired ones are compacted away."""
+    emitter = ParticleEmitter(10, [(255, 255, 255)], gravity=(0, 100))
+    emitter.emit(3, (50, 50), speed=(10, 10), angle=(0, 0), life=(1.0, 1.0))
+    emitter.emit(2, (0, 0), life=(0.05, 0.05))
+
+    emitter.update(0.1)
+
+    assert emitter.count == 3
+    assert emitter.position[:3, 0] == pytest.approx([51, 51, 51])
+    assert emitter.velocity[:3, 1] == pytest.approx([10, 10, 10])
+
+
+def test_stream_carries_fractional_particles():
+    """Test that a steady rate emits the right total across short frames."""
+    emitter = ParticleEmitter(100, [(255, 255, 255)])
+    for _ in range(60):
+        emitter.stream(30, 1 / 60, (0, 0), life=(10, 10))
+
+    assert emitter.count in (29, 30)
+
+
+def test_seeded_runs_repeat():
+    """Test that emitters built after seeding the random module produce the same particles."""
+    runs = []
+    for _ in range(2):
+        random.seed(7)
+        emitter = ParticleEmitter(50, [(255, 0, 0), (0, 255, 0)])
+        emitter.emit(50, (10, 10))
+        runs.append((emitter.velocity.copy(), emitter.color.copy()))
+
+    assert (runs[0][0] == runs[1][0]).all()
+    assert (runs[0][1] == runs[1][1]).all()
+
+
+def test_pixel_mode_writes_particles_into_frame():
+    """Test that radius 0 particles are written straight into the pixels, fading with age."""
+    frame = pygame.Surface((20, 20), 0, 32)
+    emitter = ParticleEmitter(10, [(200, 100, 0)], radius=0)
+    emitter.emit(1, (5, 5), speed=(0, 0), life=(1.0, 1.0))
+    emitter.emit(1, (50, 50), speed=(0, 0))  # Off screen, skipped
+
+    emitter.render(frame)
+    assert frame.get_at((5, 5))[:3] == (200, 100, 0)
+
+    emitter.update(0.6)
+    frame.fill((0, 0, 0))
+    emitter.render(frame)
+    assert 0 < frame.get_at((5, 5)).r < 200
+
+
+def test_sprites_are_added_onto_the_frame():
+    """Test that additive sprites brighten the frame without covering it in black."""
+    frame = pygame.Surface((20, 20), 0, 32)
+    frame.fill((0, 0, 80))
+    emitter = ParticleEmitter(10, [(200, 0, 0)], radius=2)
+    emitter.emit(1, (10, 10), speed=(0, 0), life=(1.0, 1.0))
+
+    emitter.render(frame)
+
+    assert frame.get_at((10, 10))[:3] == (200, 0, 80)
+    assert frame.get_at((8, 10)).r > 0
+    assert frame.get_at((0, 0))[:3] == (0, 0, 80)
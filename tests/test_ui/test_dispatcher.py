@@ -0,0 +1,159 @@
+"""Test suite for UI event dispatch."""
+
+import pygame
+import pytest
+from src.ui import Button, Dropdown, Menu, Slider
+from src.ui.dispatcher import SpatialGrid
+
+
+class CountingButton(Button):
+    """Button that counts the events it receives."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = []
+
+    def handle_event(self, event):
+        self.events.append(event.type)
+        super().handle_event(event)
+
+
+def motion(pos):
+    return pygame.event.Event(pygame.MOUSEMOTION, {"pos": pos, "rel": (0, 0), "buttons": (0, 0, 0)})
+
+
+def click(pos, down=True):
+    event_type = pygame.MOUSEBUTTONDOWN if down else pygame.MOUSEBUTTONUP
+    return pygame.event.Event(event_type, {"pos": pos, "button": 1})
+
+
+@pytest.fixture
+def menu():
+    """Create a menu with many counting buttons."""
+    menu = Menu(x=0, y=0, width=220, height=600)
+    for i in range(50):
+        menu.add_element(CountingButton(0, 0, 200, 40, text=f"Button {i}"))
+    return menu
+
+
+def test_spatial_grid_topmost():
+    """Test that point queries return the topmost element."""
+    grid = SpatialGrid(cell_size=32)
+    lower = Button(0, 0, 100, 100)
+    upper = Button(50, 50, 100, 100)
+    grid.insert(lower, lower.rect, 0)
+    grid.insert(upper, upper.rect, 1)
+
+    assert grid.query_point((10, 10)) is lower
+    assert grid.query_point((75, 75)) is upper
+    assert grid.query_point((500, 500)) is None
+
+
+def test_motion_only_reaches_hit_element(menu):
+    """Test that pointer events are not broadcast to every element."""
+    target = menu.elements[3]
+    menu.handle_event(motion(target.rect.center))
+
+    assert target.hover
+    receivers = [element for element in menu.elements if element.events]
+    assert receivers == [target]
+
+
+def test_hover_leave(menu):
+    """Test that the previously hovered element sees the pointer leave."""
+    first, second = menu.elements[0], menu.elements[1]
+    menu.handle_event(motion(first.rect.center))
+    menu.handle_event(motion(second.rect.center))
+
+    assert not first.hover
+    assert second.hover
+
+
+def test_on_hover_fires_on_enter(menu):
+    """Test the menu hover callback fires once per element entered."""
+    hovered = []
+    menu.on_hover = hovered.append
+    target = menu.elements[5]
+
+    menu.handle_event(motion(target.rect.center))
+    menu.handle_event(motion((target.rect.centerx + 1, target.rect.centery)))
+
+    assert hovered == [target]
+
+
+def test_button_click(menu):
+    """Test clicking a button through the dispatcher."""
+    clicked = []
+    target = menu.elements[2]
+    target.set_callback(lambda: clicked.append(True))
+
+    menu.handle_event(motion(target.rect.center))
+    menu.handle_event(click(target.rect.center))
+    menu.handle_event(click(target.rect.center, down=False))
+
+    assert clicked == [True]
+    assert menu.dispatcher.focused is target
+
+
+def test_slider_drag_capture():
+    """Test that a dragged slider keeps receiving motion outside its rect."""
+    menu = Menu(x=0, y=0, width=300, height=100)
+    slider = menu.add_element(Slider(0, 0, 200, 20, initial_value=0.0))
+
+    menu.handle_event(click(slider.rect.midleft))
+    menu.handle_event(motion((1000, 500)))
+    assert slider.value == pytest.approx(1.0)
+
+    menu.handle_event(click((1000, 500), down=False))
+    assert not slider.dragging
+    assert menu.dispatcher.captured is None
+
+
+def test_keyboard_goes_to_focused(menu):
+    """Test that keyboard events only reach the focused element."""
+    target = menu.elements[1]
+    menu.handle_event(click(target.rect.center))
+    menu.handle_event(click(target.rect.center, down=False))
+    for element in menu.elements:
+        element.events.clear()
+
+    menu.handle_event(pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_a}))
+
+    assert [element for element in menu.elements if element.events] == [target]
+
+
+def test_open_dropdown_receives_outside_click():
+    """Test that an open dropdown closes when clicking elsewhere."""
+    menu = Menu(x=0, y=0, width=300, height=300)
+    dropdown = menu.add_element(Dropdown(0, 0, 200, 30, options=["a", "b", "c"]))
+    button = menu.add_element(CountingButton(0, 0, 200, 40, text="Other"))
+
+    menu.handle_event(click(dropdown.rect.center))
+    menu.handle_event(click(dropdown.rect.center, down=False))
+    assert dropdown.is_open
+
+    menu.handle_event(click((290, 290)))
+    assert not dropdown.is_open
+    assert pygame.MOUSEBUTTONDOWN not in button.events
+
+
+def test_select_dropdown_option():
+    """Test selecting an option that lies outside the dropdown rect."""
+    menu = Menu(x=0, y=0, width=300, height=300)
+    dropdown = menu.add_element(Dropdown(0, 0, 200, 30, options=["a", "b", "c"]))
+
+    menu.handle_event(click(dropdown.rect.center))
+    menu.handle_event(click(dropdown.rect.center, down=False))
+    menu.handle_event(click(dropdown.option_rects[2].center))
+
+    assert dropdown.selected_option == "c"
+    assert not dropdown.is_open
+
+
+def test_moved_element_is_reindexed(menu):
+    """Test that moving an element updates hit-testing."""
+    target = menu.elements[0]
+    target.set_position(500, 500)
+    menu.handle_event(motion((510, 510)))
+
+    assert target.hover
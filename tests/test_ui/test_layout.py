@@ -0,0 +1,127 @@
+"""Test suite for the UI layout engine."""
+
+import pygame
+import pytest
+from src.ui import AnchorBox, Button, HBox, Label, Menu, Slider, VBox
+from src.ui.layout import resolve_length
+
+
+def test_resolve_length():
+    """Test pixel, percentage and missing lengths."""
+    assert resolve_length(40, 200) == 40
+    assert resolve_length("25%", 200) == 50
+    assert resolve_length(None, 200) is None
+
+
+def test_vbox_stacks_with_padding_and_spacing():
+    """Test that a column places children below each other inside the padding."""
+    box = VBox(10, 20, 200, 300, spacing=5, padding=10)
+    first = box.add(Button(0, 0, 100, 40))
+    second = box.add(Button(0, 0, 100, 30), width="50%")
+
+    assert first.rect.topleft == (20, 30)
+    assert second.rect.topleft == (20, 75)
+    assert second.rect.width == 90
+
+
+def test_hbox_aligns_on_cross_axis():
+    """Test that a row stacks horizontally and honors alignment."""
+    box = HBox(0, 0, 300, 100, spacing=10, align="center")
+    left = box.add(Button(0, 0, 50, 20))
+    right = box.add(Button(0, 0, 50, 40), align="end")
+
+    assert left.rect.topleft == (0, 40)
+    assert right.rect.topleft == (60, 60)
+
+
+def test_anchor_box_percentage_offsets():
+    """Test anchoring children to the box with percentage offsets."""
+    root = AnchorBox(0, 0, 800, 600)
+    centered = root.add(Button(0, 0, 100, 50), anchor="center")
+    corner = root.add(Button(0, 0, 100, 50), anchor="bottomright", offset=(-10, "-10%"))
+
+    assert centered.rect.center == (400, 300)
+    assert corner.rect.bottomright == (790, 540)
+
+    with pytest.raises(ValueError):
+        root.add(Button(0, 0, 10, 10), anchor="middle")
+
+
+def test_resize_reflows_nested_boxes():
+    """Test that resizing the root reflows percentage sizes in nested boxes."""
+    root = AnchorBox(0, 0, 800, 600)
+    column = VBox(0, 0, 200, 400)
+    root.add(column, width="50%", anchor="midtop", offset=(0, "10%"))
+    button = column.add(Button(0, 0, 10, 40), width="100%")
+    root.layout()
+    assert button.rect.width == 400
+    assert button.rect.topleft == (200, 60)
+
+    root.set_size(1000, 500)
+    root.layout()
+    assert button.rect.width == 500
+    assert button.rect.topleft == (250, 50)
+
+
+def test_layout_skips_clean_subtrees():
+    """Test that only dirty subtrees run a layout pass."""
+    root = VBox(0, 0, 400, 400)
+    left = root.add(VBox(0, 0, 200, 100))
+    right = root.add(VBox(0, 0, 200, 100))
+    left.add(Label(0, 0, 100, 20))
+    right.add(Label(0, 0, 100, 20))
+    root.layout()
+    passes = (root.layout_count, left.layout_count, right.layout_count)
+
+    # Resizing a child inside one column only relayouts that column
+    left.elements[0].set_size(150, 30)
+    root.layout()
+    assert root.layout_count == passes[0]
+    assert left.layout_count == passes[1] + 1
+    assert right.layout_count == passes[2]
+
+    # Nothing is dirty, so another pass does nothing
+    root.layout()
+    assert left.layout_count == passes[1] + 1
+
+
+def test_layout_moves_composite_widgets():
+    """Test that a slider's label and handle follow the slider."""
+    box = VBox(100, 100, 300, 300)
+    slider = Slider(0, 0, 200, 20, label="Volume")
+    box.add(slider)
+
+    assert slider.handle_rect.y == slider.rect.y
+    assert slider.label.rect.y == slider.rect.y - 20
+    assert slider.label.rect.x == slider.rect.x
+
+
+def test_centered_menu_reflows_after_move():
+    """Test that moving a centered menu keeps its children centered."""
+    menu = Menu(x=400, y=100, width=300, height=400, centered=True)
+    button = menu.add_button("Play")
+    assert button.rect.centerx == 400
+    assert button.rect.y == 100
+
+    menu.move_to(600, 200)
+    menu.layout()
+    menu.handle_event(pygame.event.Event(pygame.MOUSEMOTION, {"pos": button.rect.center}))
+    assert button.rect.centerx == 600
+    assert button.rect.y == 200
+    assert button.hover
+
+
+def test_box_reports_animating_children():
+    """Test that a container animates while any visible child does."""
+    from src.ui import ScrollList
+
+    box = VBox(0, 0, 200, 400)
+    box.add(Button(0, 0, 100, 40))
+    scroll_list = box.add(ScrollList(0, 0, 200, 200, items=range(100), row_height=40))
+    assert not box.is_animating()
+
+    scroll_list.handle_event(pygame.event.Event(pygame.MOUSEWHEEL, {"x": 0, "y": -1}))
+    assert box.is_animating()
+
+    scroll_list.hide()
+    assert not box.is_animating()
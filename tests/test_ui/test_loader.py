@@ -0,0 +1,158 @@
+"""Test suite for YAML UI definitions."""
+
+import os
+
+import pygame
+import pytest
+from src.ui import Button, Menu, ToggleButton
+from src.ui.loader import (
+    UIDocument,
+    get_definition_path,
+    load_definition,
+    reload_changed_definitions,
+)
+
+DEFINITION = """
+elements:
+  - type: menu
+    id: menu
+    width: 300
+    height: 400
+    centered: true
+    anchor: midtop
+    offset: [0, "50%"]
+    on_hover: on_hover
+    children:
+      - {type: button, id: play, text: Play, width: 280, on_click: on_play}
+      - {type: toggle, id: music, label: Music, width: "50%"}
+"""
+
+
+class Handler:
+    """Object providing callbacks named in the definition."""
+
+    def __init__(self):
+        self.played = 0
+        self.hovered = []
+
+    def on_play(self):
+        self.played += 1
+
+    def on_hover(self, button):
+        self.hovered.append(button)
+
+
+@pytest.fixture
+def definition_file(tmp_path):
+    """Write a small UI definition."""
+    path = tmp_path / "menu.yaml"
+    path.write_text(DEFINITION)
+    return str(path)
+
+
+def click(pos):
+    return [
+        pygame.event.Event(pygame.MOUSEMOTION, {"pos": pos, "rel": (0, 0), "buttons": (0, 0, 0)}),
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, {"pos": pos, "button": 1}),
+        pygame.event.Event(pygame.MOUSEBUTTONUP, {"pos": pos, "button": 1}),
+    ]
+
+
+def test_builds_tree_with_ids_and_layout(definition_file, tmp_path):
+    """Test that the definition builds positioned elements reachable by id."""
+    handler = Handler()
+    ui = UIDocument(definition_file, handler, 800, 600, cache_dir=str(tmp_path / "cache"))
+
+    assert isinstance(ui["menu"], Menu)
+    assert isinstance(ui["play"], Button)
+    assert isinstance(ui["music"], ToggleButton)
+    assert ui["play"].rect.midtop == (400, 300)
+    assert ui["music"].rect.width == 150
+
+    for event in click(ui["play"].rect.center):
+        ui.handle_event(event)
+    assert handler.played == 1
+    assert handler.hovered == [ui["play"]]
+
+
+def test_missing_callback_raises(definition_file, tmp_path):
+    """Test that an unknown callback name is reported."""
+    with pytest.raises(ValueError, match="not found"):
+        UIDocument(definition_file, object(), 800, 600, cache_dir=str(tmp_path / "cache"))
+
+
+@pytest.mark.parametrize("source", ["", "- type: button\n", "just text\n", "elements: 3\n"])
+def test_malformed_definition_raises(tmp_path, source):
+    """Test that a file without a top-level elements list is reported as a ValueError."""
+    path = tmp_path / "broken.yaml"
+    path.write_text(source)
+    with pytest.raises(ValueError, match="elements"):
+        load_definition(str(path), None)
+
+
+def test_compiled_cache_skips_parsing(definition_file, tmp_path, monkeypatch):
+    """Test that an unchanged file is loaded from the pickled cache."""
+    cache_dir = str(tmp_path / "cache")
+    first = load_definition(definition_file, cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed despite a cached definition")
+
+    monkeypatch.setattr("src.ui.loader.yaml.safe_load", fail)
+    assert load_definition(definition_file, cache_dir) == first
+
+
+def test_hot_reload_rebuilds_changed_file(definition_file, tmp_path):
+    """Test that editing the file rebuilds the tree and calls on_build."""
+    builds = []
+    ui = UIDocument(
+        definition_file,
+        Handler(),
+        800,
+        600,
+        on_build=builds.append,
+        hot_reload=True,
+        cache_dir=str(tmp_path / "cache"),
+    )
+    assert not ui.reload_if_changed()
+
+    with open(definition_file, "w") as f:
+        f.write(DEFINITION.replace("text: Play", "text: Start"))
+    stat = os.stat(definition_file)
+    os.utime(definition_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert ui.reload_if_changed()
+    assert ui["play"].text == "Start"
+    assert len(builds) == 2
+
+
+def test_resize_reflows_root(definition_file, tmp_path):
+    """Test that resizing the document moves anchored elements."""
+    ui = UIDocument(definition_file, Handler(), 800, 600, cache_dir=str(tmp_path / "cache"))
+    ui.resize(1000, 800)
+    ui.root.layout()
+    assert ui["play"].rect.midtop == (500, 400)
+
+
+@pytest.mark.parametrize("name", ["main_menu", "options", "credits", "pause", "game_over"])
+def test_shipped_definitions_parse(name):
+    """Test that every shipped definition is valid."""
+    definition = load_definition(get_definition_path(name), cache_dir=None)
+    assert definition["elements"]
+
+
+def test_reload_changed_definitions(definition_file, tmp_path):
+    """Test that file watcher notifications rebuild hot-reload documents only."""
+    cache_dir = str(tmp_path / "cache")
+    live = UIDocument(definition_file, Handler(), 800, 600, hot_reload=True, cache_dir=cache_dir)
+    fixed = UIDocument(definition_file, Handler(), 800, 600, cache_dir=cache_dir)
+
+    with open(definition_file, "w") as f:
+        f.write(DEFINITION.replace("text: Play", "text: Start"))
+    stat = os.stat(definition_file)
+    os.utime(definition_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert reload_changed_definitions(definition_file) == 1
+    assert live["play"].text == "Start"
+    assert fixed["play"].text == "Play"
@@ -0,0 +1,93 @@
+"""Test suite for retained-mode UI rendering."""
+
+import pygame
+import pytest
+from src.ui import Button, Label, Menu, Slider, ToggleButton
+
+
+@pytest.fixture
+def font():
+    """Create a default font."""
+    return pygame.font.SysFont(None, 24)
+
+
+def test_static_button_draws_once(font):
+    """Test that an unchanged button reuses its cached surface."""
+    button = Button(10, 10, 100, 40, text="Play")
+    button.set_font(font)
+    surface = pygame.Surface((200, 100))
+
+    for _ in range(10):
+        button.render(surface)
+
+    assert button.redraw_count == 1
+
+
+def test_state_change_redraws(font):
+    """Test that hover and text changes invalidate the cache."""
+    button = Button(10, 10, 100, 40, text="Play")
+    button.set_font(font)
+    surface = pygame.Surface((200, 100))
+
+    button.render(surface)
+    button.hover = True
+    button.render(surface)
+    button.set_text("Quit")
+    button.render(surface)
+    button.render(surface)
+
+    assert button.redraw_count == 3
+
+
+def test_cached_pixels_match_position(font):
+    """Test that the cached surface is blitted where the element lives."""
+    toggle = ToggleButton(20, 30, 200, 40, label="Music", is_on=True)
+    surface = pygame.Surface((300, 100))
+    toggle.render(surface)
+
+    knob_area = surface.get_at((20 + 200 - 10 - 25, 30 + 20))
+    assert knob_area != pygame.Color(0, 0, 0)
+    assert surface.get_at((5, 5)) == pygame.Color(0, 0, 0)
+
+
+def test_slider_cache_includes_label(font):
+    """Test that the slider cache covers the label above it."""
+    slider = Slider(10, 50, 200, 20, label="Volume")
+    slider.set_font(font)
+
+    cache, position = slider.get_blit()
+    assert position == (10, 30)
+    assert cache.get_height() == 40
+
+    slider.value = 1.0
+    slider.update(0.016)
+    slider.get_blit()
+    assert slider.redraw_count == 2
+
+
+def test_invalidate_forces_redraw(font):
+    """Test explicit invalidation after changing a color."""
+    label = Label(0, 0, 100, 30, text="Score")
+    label.set_font(font)
+    label.get_blit()
+    label.text_color = (255, 0, 0)
+    label.invalidate()
+    label.get_blit()
+
+    assert label.redraw_count == 2
+
+
+def test_menu_composites_with_blits(font):
+    """Test that a static menu only redraws its elements once."""
+    menu = Menu(x=100, y=10, width=200, height=400, centered=True)
+    menu.set_font(font)
+    buttons = [menu.add_button(f"Button {i}") for i in range(5)]
+    menu.add_spacer(10)
+    menu.add_label("Footer")
+    surface = pygame.Surface((400, 400))
+
+    for _ in range(5):
+        menu.render(surface)
+
+    assert all(button.redraw_count == 1 for button in buttons)
+    assert surface.get_at(buttons[0].rect.center) != pygame.Color(0, 0, 0)
@@ -0,0 +1,124 @@
+"""Test suite for virtualized lists and dropdowns."""
+
+import pygame
+import pytest
+from src.ui import Dropdown, ScrollList
+
+
+def wheel(y):
+    return pygame.event.Event(pygame.MOUSEWHEEL, {"x": 0, "y": y})
+
+
+def click(pos, down=True):
+    event_type = pygame.MOUSEBUTTONDOWN if down else pygame.MOUSEBUTTONUP
+    return pygame.event.Event(event_type, {"pos": pos, "button": 1})
+
+
+@pytest.fixture
+def scroll_list():
+    """Create a list with many more items than fit on screen."""
+    scroll_list = ScrollList(0, 0, 200, 200, items=range(10000), row_height=40)
+    scroll_list.set_font(pygame.font.SysFont(None, 24))
+    return scroll_list
+
+
+def test_only_visible_rows_are_built(scroll_list):
+    """Test that the row pool is sized to the window, not the item count."""
+    surface = pygame.Surface((200, 200))
+    scroll_list.render(surface)
+
+    assert scroll_list.get_visible_range() == (0, 6)
+    assert len(scroll_list.rows) == 6
+
+
+def test_rows_are_recycled_while_scrolling(scroll_list):
+    """Test that scrolling rebinds pooled rows instead of creating new ones."""
+    surface = pygame.Surface((200, 200))
+    scroll_list.render(surface)
+    pool = list(scroll_list.rows)
+
+    for _ in range(20):
+        scroll_list.handle_event(wheel(-1))
+        for _ in range(30):
+            scroll_list.update(1 / 60)
+        scroll_list.render(surface)
+
+    assert scroll_list.scroll_offset == pytest.approx(20 * scroll_list.scroll_step)
+    assert len(scroll_list.rows) <= len(pool) + 1
+    assert all(row in scroll_list.rows for row in pool)
+    first, _ = scroll_list.get_visible_range()
+    assert first == 60
+
+
+def test_smooth_scroll_eases(scroll_list):
+    """Test that the offset approaches the target over several frames."""
+    scroll_list.handle_event(wheel(-1))
+    scroll_list.update(1 / 60)
+
+    assert 0 < scroll_list.scroll_offset < scroll_list.target_offset
+    assert scroll_list.is_animating()
+
+
+def test_click_selects_item_under_pointer(scroll_list):
+    """Test arithmetic hit-testing accounts for the scroll offset."""
+    selected = []
+    scroll_list.on_select = lambda index, item: selected.append(item)
+    scroll_list.scroll_offset = scroll_list.target_offset = 400
+
+    scroll_list.handle_event(click((10, 50)))
+    scroll_list.handle_event(click((10, 50), down=False))
+
+    assert selected == [11]
+
+
+def test_scroll_clamped(scroll_list):
+    """Test scrolling stays within the list."""
+    scroll_list.scroll_by(-1000)
+    assert scroll_list.target_offset == 0
+    scroll_list.scroll_by(10**9)
+    assert scroll_list.target_offset == scroll_list.get_max_offset()
+
+
+def test_virtualized_dropdown():
+    """Test that a virtualized dropdown only lays out its visible window."""
+    options = [f"Level {i}" for i in range(5000)]
+    dropdown = Dropdown(0, 0, 200, 30, options=options, max_visible_options=8)
+    dropdown.set_font(pygame.font.SysFont(None, 24))
+
+    dropdown.handle_event(click((10, 10)))
+    assert dropdown.is_open
+    assert len(dropdown.option_rects) == 8
+
+    dropdown.handle_event(wheel(-100))
+    assert dropdown.get_visible_options()[0] == "Level 100"
+
+    surface = pygame.Surface((200, 400))
+    dropdown.render(surface)
+
+    dropdown.handle_event(click(dropdown.option_rects[2].center))
+    assert dropdown.selected_option == "Level 102"
+    assert not dropdown.is_open
+
+
+def test_dropdown_opens_at_selection():
+    """Test that reopening scrolls the selected option into view."""
+    options = [str(i) for i in range(100)]
+    dropdown = Dropdown(
+        0, 0, 200, 30, options=options, initial_selection="50", max_visible_options=5
+    )
+    dropdown.open()
+
+    assert dropdown.get_visible_options()[0] == "50"
+
+
+def test_dropdown_hover_follows_motion_events():
+    """Test that option hover comes from event positions, not the OS cursor."""
+    dropdown = Dropdown(0, 0, 200, 30, options=["a", "b", "c"])
+    dropdown.open()
+
+    motion = {"pos": (10, 75), "rel": (0, 0), "buttons": (0, 0, 0)}
+    dropdown.handle_event(pygame.event.Event(pygame.MOUSEMOTION, motion))
+    assert dropdown.hover_row == 1
+
+    dropdown.open()
+    assert dropdown.hover_row is None
@@ -104,3 +104,148 @@ def test_logger_thread_safety(test_logger):
 
     # If we got here without exceptions, test passes
     assert True
+
+
+@pytest.fixture
+def async_logging():
+    """Enable async logging for a test and always restore synchronous logging."""
+    yield GameLogger.enable_async
+    GameLogger.disable_async()
+
+
+def test_async_logging_writes_on_flush(temp_log_dir, async_logging):
+    """Test that async records reach the file once logging is flushed."""
+    log_file = os.path.join(temp_log_dir, "async_test.log")
+    logger = GameLogger.get_logger(
+        "AsyncTest", log_to_file=True, log_to_console=False, file_path=log_file
+    )
+    async_logging()
+
+    assert GameLogger.is_async()
+    assert len(logger.handlers) == 1
+    for i in range(100):
+        logger.info("Async message %d", i)
+
+    log_queue = GameLogger._queue_handler.queue
+    GameLogger.disable_async()
+
+    assert not GameLogger.is_async()
+    assert log_queue.unfinished_tasks == 0
+    assert isinstance(logger.handlers[0], logging.FileHandler)
+    with open(log_file, "r") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 100
+    assert lines[-1].endswith("Async message 99")
+    assert GameLogger.get_async_stats()["dropped"] == 0
+
+
+def test_async_logging_new_logger(temp_log_dir, async_logging):
+    """Test that loggers created while async is active are routed through the queue."""
+    async_logging()
+    log_file = os.path.join(temp_log_dir, "async_new.log")
+    logger = GameLogger.get_logger(
+        "AsyncNewLogger", log_to_file=True, log_to_console=False, file_path=log_file
+    )
+    logger.warning("Queued warning")
+    GameLogger.disable_async()
+
+    with open(log_file, "r") as f:
+        assert "Queued warning" in f.read()
+
+
+def test_bounded_queue_overflow_policies():
+    """Test the drop policies of the bounded queue handler."""
+    import queue
+    from src.utils.logger import BoundedQueueHandler, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST
+
+    def make_record(message):
+        return logging.LogRecord("Overflow", logging.INFO, __file__, 0, message, None, None)
+
+    newest = BoundedQueueHandler(queue.Queue(maxsize=2), OVERFLOW_DROP_NEWEST)
+    for message in ("a", "b", "c"):
+        newest.emit(make_record(message))
+    assert newest.dropped == 1
+    assert [newest.queue.get_nowait().msg for _ in range(2)] == ["a", "b"]
+
+    oldest = BoundedQueueHandler(queue.Queue(maxsize=2), OVERFLOW_DROP_OLDEST)
+    for message in ("a", "b", "c"):
+        oldest.emit(make_record(message))
+    assert oldest.dropped == 1
+    assert [oldest.queue.get_nowait().msg for _ in range(2)] == ["b", "c"]
+
+
+def test_rate_limit_coalesces_repeats(temp_log_dir):
+    """Test that repeated messages from one call site are rate limited."""
+    log_file = os.path.join(temp_log_dir, "rate_limit.log")
+    logger = GameLogger.get_logger(
+        "RateLimitTest",
+        log_to_file=True,
+        log_to_console=False,
+        file_path=log_file,
+        rate_limit_period=60.0,
+        rate_limit_burst=2,
+    )
+
+    for _ in range(50):
+        logger.warning("Sound not found: %s", "paddle_hit")
+    logger.warning("Sound not found: %s", "score")
+
+    with open(log_file, "r") as f:
+        lines = f.read().splitlines()
+    assert len([line for line in lines if "paddle_hit" in line]) == 2
+    assert len([line for line in lines if "score" in line]) == 1
+
+
+def test_rate_limit_reports_suppressed_count():
+    """Test that the first record after the window reports suppressed repeats."""
+    from src.utils.logger import RateLimitFilter
+
+    rate_filter = RateLimitFilter(period=1.0, burst=1)
+
+    def make_record(created):
+        record = logging.LogRecord(
+            "RateLimit", logging.WARNING, "site.py", 10, "Miss %s", ("x",), None
+        )
+        record.created = created
+        return record
+
+    assert rate_filter.filter(make_record(0.0))
+    assert not rate_filter.filter(make_record(0.1))
+    assert not rate_filter.filter(make_record(0.2))
+    assert rate_filter.get_suppressed_count() == 2
+
+    record = make_record(1.5)
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "Miss x (repeated 2 more times)"
+
+
+def test_suppressed_counts_are_flushed(temp_log_dir, async_logging):
+    """Test that repeats still being suppressed are reported when async logging stops."""
+    log_file = os.path.join(temp_log_dir, "rate_limit_flush.log")
+    logger = GameLogger.get_logger(
+        "RateLimitFlush",
+        log_to_file=True,
+        log_to_console=False,
+        file_path=log_file,
+        rate_limit_period=60.0,
+        rate_limit_burst=1,
+    )
+    async_logging()
+    for _ in range(5):
+        logger.warning("Sound not found: %s", "paddle_hit")
+    GameLogger.disable_async()
+
+    with open(log_file, "r") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert lines[-1].endswith("Sound not found: paddle_hit (repeated 4 more times)")
+
+    GameLogger.flush_suppressed()
+    with open(log_file, "r") as f:
+        assert len(f.read().splitlines()) == 2
+
+
+def test_rate_limit_disabled():
+    """Test that rate limiting can be turned off."""
+    logger = GameLogger.get_logger("NoRateLimit", log_to_file=False, rate_limit=False)
+    assert logger.filters == []
@@ -126,3 +126,108 @@ def test_max_frame_samples(performance_monitor):
         performance_monitor.start_frame()
 
     assert len(performance_monitor.frame_times) <= performance_monitor.max_frame_samples
+
+
+def test_gc_pause_tracking(performance_monitor):
+    """Test that garbage collection pauses are recorded per generation."""
+    import gc
+
+    performance_monitor.start_gc_tracking()
+    try:
+        gc.collect(0)
+        gc.collect(2)
+    finally:
+        performance_monitor.stop_gc_tracking()
+
+    stats = performance_monitor.get_gc_stats()
+    assert stats[0]["count"] >= 1
+    assert stats[2]["count"] >= 1
+    assert stats[2]["max"] >= 0.0
+
+
+def test_allocation_tracking(performance_monitor):
+    """Test per-frame allocation counts."""
+    performance_monitor.start_frame()
+    garbage = [object() for _ in range(1000)]
+    performance_monitor.start_frame()
+
+    assert len(performance_monitor.frame_allocations) == 1
+    assert performance_monitor.get_allocation_stats()["last"] >= 1000
+    del garbage
+
+
+def test_type_counts(performance_monitor):
+    """Test counting live objects per type."""
+    counts = dict(performance_monitor.get_type_counts(limit=50))
+    assert counts
+    assert all(count > 0 for count in counts.values())
+
+
+def test_idle_gc(performance_monitor):
+    """Test moving garbage collection to idle time."""
+    import gc
+
+    performance_monitor.enable_idle_gc()
+    try:
+        assert not gc.isenabled()
+        assert gc.get_freeze_count() > 0
+
+        threshold = gc.get_threshold()[0]
+        garbage = [[] for _ in range(threshold + 1)]
+        assert performance_monitor.collect_idle() is not None
+        del garbage
+    finally:
+        performance_monitor.disable_idle_gc()
+
+    assert gc.isenabled()
+    assert performance_monitor.collect_idle() is None
+
+
+def test_export_report(performance_monitor, tmp_path):
+    """Test exporting the performance report."""
+    import json
+
+    performance_monitor.start_memory_tracing()
+    performance_monitor.start_frame()
+    performance_monitor.start_section("test")
+    performance_monitor.end_section()
+    performance_monitor.start_frame()
+
+    path = performance_monitor.export_report(str(tmp_path / "report.json"))
+    performance_monitor.stop_memory_tracing()
+    with open(path) as f:
+        report = json.load(f)
+
+    assert "test" in report["sections"]
+    assert "allocations_per_frame" in report
+    assert report["memory_tracing"]
+    assert report["top_allocations"]
+    assert "type_counts" in report
+
+
+def test_memory_snapshot_requires_tracing(performance_monitor):
+    """Test that snapshots never start tracing and that stopping it ends tracing."""
+    import tracemalloc
+
+    assert performance_monitor.take_memory_snapshot() == []
+    assert not tracemalloc.is_tracing()
+
+    performance_monitor.start_memory_tracing()
+    data = [bytearray(1024) for _ in range(100)]
+    assert performance_monitor.take_memory_snapshot()
+    performance_monitor.stop_memory_tracing()
+    assert not tracemalloc.is_tracing()
+    del data
+
+
+def test_input_latency_stats(performance_monitor):
+    """Test input-to-present latency samples are reported in milliseconds."""
+    assert performance_monitor.get_input_latency_stats()["avg"] == 0.0
+
+    performance_monitor.record_input_latency(0.004)
+    performance_monitor.record_input_latency(0.008)
+
+    stats = performance_monitor.get_input_latency_stats()
+    assert stats["last"] == pytest.approx(8.0)
+    assert stats["max"] == pytest.approx(8.0)
+    assert stats["avg"] == pytest.approx(6.0)
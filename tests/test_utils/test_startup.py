@@ -0,0 +1,33 @@
+"""Test suite for the startup tracer."""
+
+import time
+from src.utils.startup import StartupTracer
+
+
+def test_tracer_disabled_by_default():
+    """Test that phases are not recorded unless tracing is enabled."""
+    tracer = StartupTracer()
+    with tracer.phase("imports"):
+        pass
+
+    assert tracer.phases == []
+    assert tracer.mark_first_frame() is False
+
+
+def test_tracer_records_phases():
+    """Test recording phases and the time to first frame."""
+    tracer = StartupTracer()
+    tracer.enable()
+
+    with tracer.phase("fast"):
+        pass
+    with tracer.phase("slow"):
+        time.sleep(0.002)
+
+    assert [name for name, _ in tracer.phases] == ["fast", "slow"]
+    assert tracer.mark_first_frame() is True
+    assert tracer.mark_first_frame() is False
+
+    report = tracer.report()
+    assert report[0].startswith("slow:")
+    assert report[-1].startswith("time to first frame:")
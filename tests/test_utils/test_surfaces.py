@@ -0,0 +1,72 @@
+"""Test suite for display-format surfaces and the blit audit."""
+
+import pygame
+import pytest
+from src.utils.surfaces import (
+    AuditSurface,
+    create_surface,
+    is_display_format,
+    render_text,
+    surface_audit,
+)
+
+
+@pytest.fixture
+def display():
+    """Set a display mode so surfaces can be converted."""
+    pygame.display.init()
+    return pygame.display.set_mode((64, 48))
+
+
+@pytest.fixture
+def audit():
+    """Enable the surface audit with clean counters."""
+    surface_audit.enable()
+    surface_audit.frame_counts.clear()
+    surface_audit.total_counts.clear()
+    yield surface_audit
+    surface_audit.disable()
+
+
+def test_translucent_fill_uses_surface_alpha(display):
+    """Test that a uniform translucent color avoids a per-pixel alpha channel."""
+    overlay = create_surface((20, 10), (0, 0, 0, 128))
+
+    assert overlay.get_masks()[3] == 0  # No alpha channel
+    assert overlay.get_alpha() == 128
+    assert is_display_format(overlay)
+
+
+def test_per_pixel_alpha_surface_is_transparent(display):
+    """Test surfaces that need varying transparency."""
+    surface = create_surface((8, 8), per_pixel_alpha=True)
+
+    assert surface.get_masks()[3] != 0
+    assert surface.get_at((0, 0)).a == 0
+    assert is_display_format(surface)
+
+
+def test_render_text_converts(display):
+    """Test that text with an opaque background is converted from 8-bit."""
+    font = pygame.font.SysFont(None, 20)
+    assert not is_display_format(font.render("hi", True, (255, 255, 255), (0, 0, 0)))
+    assert is_display_format(render_text(font, "hi", (255, 255, 255), background=(0, 0, 0)))
+
+
+def test_audit_counts_blits_per_call_site(display, audit):
+    """Test that only blits of foreign formats are counted, by call site."""
+    target = AuditSurface((32, 32), 0, display)
+    foreign = pygame.Surface((4, 4), 0, 8)
+    converted = create_surface((4, 4))
+
+    for _ in range(3):
+        target.blit(foreign, (0, 0))
+    target.blits([(converted, (0, 0)), (foreign, (4, 4))])
+
+    assert sum(audit.frame_counts.values()) == 4
+    assert len(audit.frame_counts) == 2
+    assert all("test_surfaces.py" in site for site in audit.frame_counts)
+
+    audit.end_frame()
+    assert not audit.frame_counts
+    assert sum(audit.total_counts.values()) == 4
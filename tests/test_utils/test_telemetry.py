@@ -0,0 +1,97 @@
+"""Test suite for telemetry recording and analysis."""
+
+import pytest
+from src.utils.telemetry import (
+    FORMAT_BINARY,
+    FORMAT_JSONL,
+    TelemetryWriter,
+    read_records,
+    rotated_files,
+)
+from src.utils.telemetry_analyzer import FrameHistogram, analyze, expand_paths
+
+
+@pytest.fixture
+def writer():
+    """Create a telemetry writer that is always closed."""
+    writer = TelemetryWriter()
+    yield writer
+    writer.close()
+
+
+def test_writer_disabled_by_default(writer):
+    """Test that records are ignored until the writer is opened."""
+    writer.record("frame", dt=16.7)
+    assert writer.records_written == 0
+
+
+@pytest.mark.parametrize("format", [FORMAT_JSONL, FORMAT_BINARY])
+def test_write_and_read_records(writer, tmp_path, format):
+    """Test round-tripping records in both formats."""
+    path = str(tmp_path / "telemetry.log")
+    writer.open(path, format=format)
+    writer.record("scene", to="game")
+    writer.record("frame", dt=16.7, s={"render": 2.5})
+    writer.close()
+
+    records = list(read_records([path]))
+    assert [record["k"] for record in records] == ["session", "scene", "frame"]
+    assert records[0]["id"] == writer.session_id
+    assert records[2]["s"] == {"render": 2.5}
+
+
+def test_rotation(writer, tmp_path):
+    """Test that files rotate and every file starts with a session header."""
+    path = str(tmp_path / "telemetry.jsonl")
+    writer.open(path, max_bytes=500, backup_count=10)
+    for i in range(100):
+        writer.record("frame", dt=16.0 + i)
+    writer.close()
+
+    files = rotated_files(path)
+    assert len(files) > 1
+    assert files[-1] == path
+
+    frames = [record for record in read_records(files) if record["k"] == "frame"]
+    assert [record["dt"] for record in frames] == [16.0 + i for i in range(100)]
+    for file_path in files:
+        assert next(read_records([file_path]))["k"] == "session"
+
+
+def test_histogram_percentiles():
+    """Test streaming percentile estimates."""
+    histogram = FrameHistogram()
+    for ms in range(1, 101):
+        histogram.add(float(ms))
+
+    assert histogram.percentile(50) == pytest.approx(50.0, abs=FrameHistogram.BUCKET_MS)
+    assert histogram.percentile(99) == pytest.approx(99.0, abs=FrameHistogram.BUCKET_MS)
+    assert histogram.max == 100.0
+
+
+def test_analyze_sessions(writer, tmp_path):
+    """Test per-session summaries and hitch reports."""
+    path = str(tmp_path / "telemetry.jsonl")
+    writer.open(path)
+    writer.record("scene", to="game")
+    for _ in range(98):
+        writer.record("frame", dt=16.7, s={"render": 3.0})
+    writer.record("frame", dt=120.0)
+    writer.record("frame", dt=50.0)
+    writer.record("match", player=5, ai=3, won=True)
+    writer.close()
+
+    writer.open(path)
+    writer.record("frame", dt=16.0)
+    writer.close()
+
+    summaries = analyze(read_records(expand_paths([path])), hitch_ms=33.3, top=1)
+    assert len(summaries) == 2
+
+    first = summaries[0]
+    assert first["frames"] == 100
+    assert first["hitches"] == 2
+    assert first["worst_frames"] == [{"dt_ms": 120.0, "frame": 98, "scene": "game"}]
+    assert first["matches"] == 1 and first["wins"] == 1
+    assert first["sections_p95_ms"]["render"] == pytest.approx(3.0)
+    assert summaries[1]["frames"] == 1